@@ -0,0 +1,42 @@
+"""
+Benchmark of the overhead of flattening grouped arguments and grouping the
+return values of gradients for a cost function of ten arguments, as they
+occur for product manifolds. The flattening and grouping plans are computed
+once per signature by `make_flattener` and `group_return_values`, so the
+per-call cost only consists of building the flattened and grouped tuples.
+"""
+
+import time
+
+from pymanopt.tools import (flatten_arguments, group_return_values,
+                            make_flattener)
+
+
+def time_operation(operation, repeat=5, number=100000):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        for _ in range(number):
+            operation()
+        times.append((time.time() - start) / number)
+    return min(times)
+
+
+def main():
+    signature = (("a", "b"), "c", "d", ("e", "f", "g"), "h", "i", "j")
+    points = ((0, 1), 2, 3, (4, 5, 6), 7, 8, 9)
+    gradients = list(range(10))
+
+    flatten = make_flattener(signature)
+    grouped_gradient = group_return_values(lambda x: x, signature)
+
+    for name, operation in [
+            ("flatten_arguments",
+             lambda: flatten_arguments(points, signature=signature)),
+            ("make_flattener", lambda: flatten(points)),
+            ("group_return_values", lambda: grouped_gradient(gradients))]:
+        print("{:s}: {:.2f}us".format(name, 1e6 * time_operation(operation)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark of the per-evaluation latency of the cost, Euclidean gradient and
+Hessian-vector product of a small cost function in each of the available
+tracing-based autodiff backends. Unavailable backends are skipped.
+"""
+
+import time
+
+import numpy as np
+
+import pymanopt
+
+
+def create_costs(A):
+    costs = {}
+    try:
+        import autograd.numpy as anp
+    except ImportError:
+        pass
+    else:
+        @pymanopt.function.Autograd
+        def cost(X):
+            return anp.sum(anp.tanh(anp.dot(A, X)) ** 2)
+        costs["Autograd"] = cost
+    try:
+        import jax
+        import jax.numpy as jnp
+    except ImportError:
+        pass
+    else:
+        jax.config.update("jax_enable_x64", True)
+
+        @pymanopt.function.Jax
+        def cost(X):
+            return jnp.sum(jnp.tanh(jnp.dot(A, X)) ** 2)
+        costs["Jax"] = cost
+    try:
+        import torch
+    except ImportError:
+        pass
+    else:
+        A_torch = torch.from_numpy(A)
+
+        @pymanopt.function.PyTorch
+        def cost(X):
+            return torch.sum(torch.tanh(torch.matmul(A_torch, X)) ** 2)
+        costs["PyTorch"] = cost
+    return costs
+
+
+def time_operation(operation, *args, repeat=100):
+    # The first call is excluded as it may include tracing or compilation.
+    operation(*args)
+    start = time.time()
+    for _ in range(repeat):
+        operation(*args)
+    return (time.time() - start) / repeat
+
+
+def main(n=100, p=10):
+    A = np.random.randn(n, n)
+    X = np.random.randn(n, p)
+    U = np.random.randn(n, p)
+    for backend, cost in create_costs(A).items():
+        egrad = cost.compute_gradient()
+        ehess = cost.compute_hessian()
+        print("{:s}: cost {:.1f}us, egrad {:.1f}us, ehess {:.1f}us".format(
+            backend, 1e6 * time_operation(cost, X),
+            1e6 * time_operation(egrad, X),
+            1e6 * time_operation(ehess, X, U)))
+
+
+if __name__ == "__main__":
+    main()
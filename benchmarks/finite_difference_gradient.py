@@ -0,0 +1,58 @@
+"""
+Benchmark of derivative-free optimization of a black-box cost on the sphere,
+comparing conjugate gradients with finite-difference gradients against the
+Nelder-Mead and particle swarm solvers. The cost mimics a simulator by
+performing a fixed amount of work per evaluation regardless of the point.
+"""
+
+import time
+
+import numpy as np
+
+import pymanopt
+from pymanopt.manifolds import Sphere
+from pymanopt.solvers import ConjugateGradient, NelderMead, ParticleSwarm
+from pymanopt.tools.finite_differences import FiniteDifferenceGradient
+
+
+def create_cost(A, work=2):
+    B = np.random.randn(200, 200)
+
+    @pymanopt.function.Callable
+    def cost(x):
+        for _ in range(work):
+            B @ B
+        return -x @ A @ x
+    return cost
+
+
+def time_operation(operation, *args):
+    start = time.time()
+    result = operation(*args)
+    return time.time() - start, result
+
+
+def main(n=100, maxtime=60):
+    A = np.random.randn(n, n)
+    A = 0.5 * (A + A.T)
+    optimum = -np.linalg.eigvalsh(A)[-1]
+    cost = create_cost(A)
+    manifold = Sphere(n)
+    x0 = manifold.rand()
+
+    problem = pymanopt.Problem(
+        manifold, cost, grad=FiniteDifferenceGradient(manifold, cost),
+        verbosity=0)
+    solvers = [
+        ("ConjugateGradient + FD", ConjugateGradient(maxtime=maxtime), x0),
+        ("NelderMead", NelderMead(maxtime=maxtime), None),
+        ("ParticleSwarm", ParticleSwarm(maxtime=maxtime), None)
+    ]
+    for name, solver, x in solvers:
+        elapsed, x = time_operation(solver.solve, problem, x)
+        print("{:s}: {:.2f}s, cost gap {:.2e}".format(
+            name, elapsed, cost(x) - optimum))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of low-rank matrix completion on FixedRankEmbedded using sparse
+Euclidean gradients. The cost, gradient and residual only ever touch the
+observed entries, so the memory footprint scales with the number of
+observations rather than with m * n.
+"""
+
+import time
+
+import numpy as np
+import scipy.sparse
+
+import pymanopt
+from pymanopt.manifolds import FixedRankEmbedded
+from pymanopt.manifolds.fixed_rank import SparsePlusLowRank, partial_product
+from pymanopt.solvers import ConjugateGradient
+
+
+def create_problem(m, n, k, num_observations):
+    U = np.random.randn(m, k)
+    V = np.random.randn(n, k)
+    rows = np.random.randint(m, size=num_observations)
+    cols = np.random.randint(n, size=num_observations)
+    values = partial_product(U, V, rows, cols)
+
+    manifold = FixedRankEmbedded(m, n, k)
+
+    @pymanopt.function.Callable
+    def cost(x):
+        residual = manifold.partial_entries(x, rows, cols) - values
+        return 0.5 * np.dot(residual, residual)
+
+    @pymanopt.function.Callable
+    def egrad(x):
+        residual = manifold.partial_entries(x, rows, cols) - values
+        return SparsePlusLowRank(
+            scipy.sparse.coo_matrix((residual, (rows, cols)), shape=(m, n)))
+
+    return pymanopt.Problem(manifold, cost, egrad=egrad, verbosity=0)
+
+
+def main(m=20000, n=10000, k=10, num_observations=2000000, maxiter=100):
+    problem = create_problem(m, n, k, num_observations)
+    solver = ConjugateGradient(maxiter=maxiter)
+    x0 = problem.manifold.rand()
+    start = time.time()
+    x = solver.solve(problem, x=x0)
+    elapsed = time.time() - start
+    rmse = np.sqrt(2 * problem.cost(x) / num_observations)
+    print("{:d} x {:d} matrix of rank {:d} with {:d} observed entries".format(
+        m, n, k, num_observations))
+    print("Solver time: {:.2f}s".format(elapsed))
+    print("RMSE on observed entries: {:.3e}".format(rmse))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark of the trust-regions solver on a scaled-up version of the robust
+low-rank matrix approximation problem in
+examples/low_rank_matrix_approximation.py, compared to conjugate gradients.
+The Euclidean gradient and Hessian-vector products are given with respect to
+the m x n matrix, as required by FixedRankEmbedded.ehess2rhess.
+"""
+
+import time
+
+import numpy as np
+
+import pymanopt
+from pymanopt.manifolds import FixedRankEmbedded
+from pymanopt.solvers import ConjugateGradient, TrustRegions
+
+
+def create_problem(m, n, k, delta=0.5):
+    A = (np.random.randn(m, k).dot(np.random.randn(k, n)) +
+         0.1 * np.random.randn(m, n))
+    manifold = FixedRankEmbedded(m, n, k)
+
+    def to_matrix(x):
+        return (x[0] * x[1]).dot(x[2])
+
+    @pymanopt.function.Callable
+    def cost(x):
+        residual = to_matrix(x) - A
+        return np.sum(np.sqrt(residual ** 2 + delta ** 2) - delta)
+
+    @pymanopt.function.Callable
+    def egrad(x):
+        residual = to_matrix(x) - A
+        return residual / np.sqrt(residual ** 2 + delta ** 2)
+
+    @pymanopt.function.Callable
+    def ehess(x, u):
+        residual = to_matrix(x) - A
+        U, S, V = manifold.tangent2ambient(x, u)
+        direction = U.dot(S).dot(V.T)
+        return delta ** 2 * direction / (residual ** 2 + delta ** 2) ** 1.5
+
+    return pymanopt.Problem(manifold, cost, egrad=egrad, ehess=ehess,
+                            verbosity=0)
+
+
+def main(m=1000, n=500, k=10):
+    problem = create_problem(m, n, k)
+    x0 = problem.manifold.rand()
+    print("{:d} x {:d} matrix of rank {:d}".format(m, n, k))
+    for solver in (TrustRegions(logverbosity=1),
+                   ConjugateGradient(maxiter=5000, logverbosity=1)):
+        start = time.time()
+        x, optlog = solver.solve(problem, x=x0)
+        elapsed = time.time() - start
+        print("{:s}: cost {:.6e}, {:d} iterations, {:.2f}s ({:s})".format(
+            solver.__class__.__name__, problem.cost(x),
+            optlog["final_values"]["iterations"], elapsed,
+            optlog["stoppingreason"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of the Riemannian gradient and Hessian-vector product of a
+Brockett cost on the Stiefel manifold with the conversions egrad2rgrad and
+ehess2rhess evaluated in numpy or by the autodiff backend (see the
+`fuse_conversions` argument of Problem). Unavailable backends are skipped.
+"""
+
+import time
+
+import numpy as np
+
+import pymanopt
+from pymanopt.manifolds import Stiefel
+
+
+def create_costs(A, N):
+    costs = {}
+    try:
+        import jax
+        import jax.numpy as jnp
+    except ImportError:
+        pass
+    else:
+        jax.config.update("jax_enable_x64", True)
+
+        @pymanopt.function.Jax
+        def cost(X):
+            return jnp.trace(X.T @ A @ X @ N)
+        costs["Jax"] = cost
+    try:
+        import torch
+    except ImportError:
+        pass
+    else:
+        A_torch = torch.from_numpy(A)
+        N_torch = torch.from_numpy(N)
+
+        @pymanopt.function.PyTorch
+        def cost(X):
+            return torch.trace(X.t() @ A_torch @ X @ N_torch)
+        costs["PyTorch"] = cost
+    try:
+        import autograd.numpy as anp
+    except ImportError:
+        pass
+    else:
+        @pymanopt.function.Autograd
+        def cost(X):
+            return anp.trace(anp.dot(anp.dot(anp.dot(X.T, A), X), N))
+        costs["Autograd"] = cost
+    return costs
+
+
+def time_operation(operation, *args, repeat=20):
+    # The first call is excluded as it may include tracing or compilation.
+    operation(*args)
+    start = time.time()
+    for _ in range(repeat):
+        operation(*args)
+    return (time.time() - start) / repeat
+
+
+def main(n=2000, p=20):
+    A = np.random.randn(n, n)
+    A = 0.5 * (A + A.T)
+    N = np.diag(np.arange(1, p + 1, dtype=float))
+    manifold = Stiefel(n, p)
+    X = manifold.rand()
+    U = manifold.randvec(X)
+
+    costs = create_costs(A, N)
+    if not costs:
+        print("No tracing-based autodiff backends available")
+    for name, cost in costs.items():
+        for fuse_conversions in (False, True):
+            problem = pymanopt.Problem(manifold, cost,
+                                       fuse_conversions=fuse_conversions)
+            print("{:s} (fused: {}): grad {:.2f}ms, hess {:.2f}ms".format(
+                name, fuse_conversions,
+                1e3 * time_operation(problem.grad, X),
+                1e3 * time_operation(problem.hess, X, U)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Benchmark of the batched Grassmann operations in a subspace-tracking
+workload, where k subspaces of dimension p in R^n are updated, compared and
+interpolated at every step. With the default sizes every point or tangent
+vector takes 1.6 GB of memory, so pass smaller sizes to main() on machines
+with less than about 16 GB of memory.
+"""
+
+import time
+
+from pymanopt.manifolds import Grassmann
+
+
+def time_operation(operation, *args, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        operation(*args)
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(n=100000, p=20, k=100):
+    print("Gr({:d}, {:d})^{:d}".format(n, p, k))
+    for retraction in ("polar", "qr"):
+        manifold = Grassmann(n, p, k, retraction=retraction)
+        x = manifold.rand()
+        u = 0.1 * manifold.randvec(x)
+        print("retr ({:s}): {:.3f}s".format(
+            retraction, time_operation(manifold.retr, x, u)))
+    y = manifold.retr(x, u)
+    for name in ("exp", "log", "multidist"):
+        operation = getattr(manifold, name)
+        arg = u if name == "exp" else y
+        print("{:s}: {:.3f}s".format(name, time_operation(operation, x, arg)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark of the time it takes to import pymanopt in a fresh interpreter.
+The autodiff frameworks are only imported once the corresponding backend is
+used, so the import time should not depend on which of them are installed.
+The time of the first use of each available backend, which includes the
+import of its framework, is reported separately.
+"""
+
+import subprocess
+import sys
+import time
+
+
+def time_code(code, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        subprocess.check_call([sys.executable, "-c", code])
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main():
+    baseline = time_code("pass")
+    print("import pymanopt: {:.3f}s".format(
+        time_code("import pymanopt") - baseline))
+    for backend in ("Autograd", "Jax", "PyTorch", "TensorFlow", "Theano"):
+        module = "_" + backend.lower()
+        code = (
+            "from pymanopt.autodiff.backends import {:s}; "
+            "{:s}._{:s}Backend.is_available()".format(
+                module, module, backend))
+        print("import pymanopt + {:s}: {:.3f}s".format(
+            backend, time_code(code) - baseline))
+
+
+if __name__ == "__main__":
+    main()
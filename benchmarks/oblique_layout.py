@@ -0,0 +1,73 @@
+"""
+Benchmark of the Oblique manifold operations in the column-wise and row-wise
+layouts, compared to the previous column-wise implementation which formed
+the elementwise products of the columns before reducing them. With the
+default sizes every point or tangent vector takes 400 MB of memory.
+"""
+
+import time
+
+import numpy as np
+import numpy.linalg as la
+
+from pymanopt.manifolds import Oblique
+
+
+def reference_proj(X, H):
+    return H - X * np.sum(X * H, axis=0)
+
+
+def reference_retr(X, U):
+    Y = X + U
+    return Y / la.norm(Y, axis=0)
+
+
+def reference_exp(X, U):
+    norm_U = np.sqrt((U ** 2).sum(0))
+    return X * np.cos(norm_U) + U * (np.sin(norm_U) / norm_U)
+
+
+def reference_ehess2rhess(X, egrad, ehess, U):
+    return reference_proj(X, ehess) - U * (X * egrad).sum(0)
+
+
+def time_operation(operation, *args, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        operation(*args)
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(m=512, n=100000):
+    print("OB({:d}, {:d})".format(m, n))
+    manifolds = {
+        "column-wise": Oblique(m, n),
+        "row-wise": Oblique(m, n, rowwise=True)
+    }
+    references = {
+        "proj": reference_proj,
+        "retr": reference_retr,
+        "exp": reference_exp,
+        "ehess2rhess": reference_ehess2rhess
+    }
+    for name, reference in references.items():
+        timings = []
+        for layout, manifold in manifolds.items():
+            x = manifold.rand()
+            u = 0.1 * manifold.randvec(x)
+            args = [x, u]
+            if name == "ehess2rhess":
+                args = [x, u, manifold.randvec(x), u]
+            if layout == "column-wise":
+                timings.append(
+                    ("reference", time_operation(reference, *args)))
+            operation = getattr(manifold, name)
+            timings.append((layout, time_operation(operation, *args)))
+        print("{:s}: {:s}".format(name, ", ".join(
+            "{:s} {:.3f}s".format(*timing) for timing in timings)))
+
+
+if __name__ == "__main__":
+    main()
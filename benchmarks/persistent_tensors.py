@@ -0,0 +1,59 @@
+"""
+Benchmark of solving small problems with a PyTorch cost with the iterates
+kept as numpy arrays or as torch tensors for the whole solve (see the
+`persistent_tensors` argument of Problem). For small problems, the conversions
+between numpy arrays and tensors at every evaluation make up a noticeable
+part of the time per iteration.
+"""
+
+import time
+
+import numpy as np
+import torch
+
+import pymanopt
+from pymanopt.manifolds import Sphere, Stiefel
+from pymanopt.solvers import ConjugateGradient, SteepestDescent, TrustRegions
+
+
+def create_problems(n=20, p=3):
+    A = np.random.randn(n, n)
+    A_torch = torch.from_numpy(0.5 * (A + A.T))
+    N_torch = torch.from_numpy(np.diag(np.arange(1, p + 1, dtype=float)))
+
+    @pymanopt.function.PyTorch
+    def rayleigh_quotient(x):
+        return -x @ A_torch @ x
+
+    @pymanopt.function.PyTorch
+    def brockett(X):
+        return torch.trace(X.T @ A_torch @ X @ N_torch)
+
+    return {"Sphere({:d})".format(n): (Sphere(n), rayleigh_quotient),
+            "Stiefel({:d}, {:d})".format(n, p): (Stiefel(n, p), brockett)}
+
+
+def time_solve(solver, manifold, cost, persistent_tensors, x, repeat=5):
+    problem = pymanopt.Problem(manifold, cost, verbosity=0,
+                               persistent_tensors=persistent_tensors)
+    start = time.time()
+    for _ in range(repeat):
+        solver.solve(problem, x=x)
+    return (time.time() - start) / repeat
+
+
+def main():
+    solvers = [SteepestDescent(maxiter=500, mingradnorm=0),
+               ConjugateGradient(maxiter=500, mingradnorm=0),
+               TrustRegions(maxiter=50, mingradnorm=0)]
+    for name, (manifold, cost) in create_problems().items():
+        x = manifold.rand()
+        for solver in solvers:
+            print("{:s}, {:s}: numpy {:.1f}ms, tensors {:.1f}ms".format(
+                name, str(solver),
+                1e3 * time_solve(solver, manifold, cost, False, x),
+                1e3 * time_solve(solver, manifold, cost, True, x)))
+
+
+if __name__ == "__main__":
+    main()
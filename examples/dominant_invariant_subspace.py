@@ -54,8 +54,10 @@ def dominant_invariant_subspace(A, p):
     Gr = Grassmann(n, p)
     X = T.matrix()
 
-    @pymanopt.function.Theano(X)
-    def cost(X):
+    # A is passed as a data input rather than embedded in the graph, so that
+    # the cost could be reused for another matrix via cost.bind(A=...).
+    @pymanopt.function.Theano(X, data={"A": A})
+    def cost(X, A):
         return -T.dot(X.T, T.dot(A, X)).trace()
 
     # Setup the problem
@@ -0,0 +1,49 @@
+import numpy as np
+import scipy.sparse
+from numpy import random as rnd
+
+from pymanopt.solvers import TrustRegions
+from pymanopt.tools.riemannian_staircase import RiemannianStaircase
+
+
+def maxcut_sdp(L):
+    """
+    Returns a factor Y of the solution X = Y Y^T of the MaxCut SDP relaxation
+    max <L, X> / 4 s.t. X psd, diag(X) = 1, where L is the (sparse) Laplacian
+    of a graph, together with the optimal value of the relaxation.
+    """
+    staircase = RiemannianStaircase(TrustRegions(maxiter=500))
+    Y = staircase.solve(-L / 4, verbosity=1)
+    return Y, np.sum(L.dot(Y) * Y) / 4
+
+
+def round_cut(Y, L, num_trials=100):
+    """
+    Randomized rounding of Goemans and Williamson: returns the best cut
+    obtained by splitting the rows of Y by random hyperplanes.
+    """
+    best_cut = None
+    best_value = -np.inf
+    for _ in range(num_trials):
+        cut = np.sign(Y.dot(rnd.randn(Y.shape[1])))
+        value = cut.dot(L.dot(cut)) / 4
+        if value > best_value:
+            best_cut = cut
+            best_value = value
+    return best_cut, best_value
+
+
+if __name__ == "__main__":
+    # Generate a random sparse graph.
+    n = 2000
+    A = scipy.sparse.random(n, n, density=5 / n, format="csr")
+    A = A + A.T
+    A.data[:] = 1
+    L = scipy.sparse.diags(np.ravel(A.sum(axis=1))) - A
+
+    Y, upper_bound = maxcut_sdp(L.tocsr())
+    _, value = round_cut(Y, L)
+
+    print("rank of the solution:", Y.shape[1])
+    print("SDP upper bound on the max cut:", upper_bound)
+    print("value of the rounded cut:", value)
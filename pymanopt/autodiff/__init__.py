@@ -1,5 +1,7 @@
 import inspect
 
+import numpy as np
+
 from ..tools import flatten_arguments
 
 
@@ -7,12 +9,14 @@ class Function:
     def __str__(self):
         return "Function <{}>".format(self._backend)
 
-    def __init__(self, function, args, backend):
+    def __init__(self, function, args, backend, data=None):
         self._function = function
         self._args = args
         self._backend = backend
+        self._data = {} if data is None else data
 
         self._compiled_function = None
+        self._batch_function = None
         self._egrad = None
         self._ehess = None
 
@@ -49,6 +53,60 @@ class Function:
                                                         self._args)
         return self._ehess
 
+    def compute_riemannian_gradient(self, egrad2rgrad):
+        """Returns the Riemannian gradient of the function, where the
+        conversion `egrad2rgrad` of the Euclidean gradient is evaluated by the
+        backend, or None if the backend does not support this.
+        """
+        assert self._backend is not None
+        return self._backend.compute_riemannian_gradient(
+            self._function, self._args, egrad2rgrad)
+
+    def compute_riemannian_hessian(self, ehess2rhess):
+        """Returns the Riemannian Hessian-vector product of the function,
+        where the conversion `ehess2rhess` is evaluated by the backend, or
+        None if the backend does not support this.
+        """
+        assert self._backend is not None
+        return self._backend.compute_riemannian_hessian(
+            self._function, self._args, ehess2rhess)
+
+    def tensor_conversions(self):
+        """Returns the functions converting numpy arrays to tensors of the
+        backend and back if the function can be evaluated at such tensors
+        directly, or None otherwise.
+        """
+        assert self._backend is not None
+        return self._backend.tensor_conversions()
+
+    def batch(self, points):
+        """Evaluates the function at each of the given points, e.g., a list
+        of points or an array of points stacked along the first axis as
+        returned by `Manifold.rand(n)`, and returns the values as a numpy
+        array. Backends which support it evaluate all points in a single
+        vectorized call.
+        """
+        if self._batch_function is None:
+            batch_function = self._backend.compile_batch_function(
+                self._function, self._args)
+            if batch_function is None:
+                def batch_function(points):
+                    return np.array([self(point) for point in points])
+            self._batch_function = batch_function
+        return self._batch_function(points)
+
+    def bind(self, **data):
+        """Replaces the values of data inputs declared via the `data` argument
+        of a graph-based backend decorator, e.g. `cost.bind(A=A)`. The
+        compiled cost, gradient and Hessian are reused, so the new values
+        must have the same shapes and data types as the original ones.
+        """
+        for name, value in data.items():
+            if name not in self._data:
+                raise ValueError(
+                    "Function has no data input named '{}'".format(name))
+            self._backend.assign_data(self._data[name], value)
+
     def __call__(self, *args, **kwargs):
         assert self._compiled_function is not None
         return self._compiled_function(*args, **kwargs)
@@ -68,34 +126,68 @@ def make_tracing_backend_decorator(Backend):
           pass
 
     to annotate a tracing-based autodiff function with how the arguments are
-    conceptually grouped together.
+    conceptually grouped together. Keyword arguments are passed on to the
+    backend, e.g.
+
+      @decorator(threadsafe=True)
+      def f(x):
+          pass
     """
-    def decorator(*args):
+    def decorator(*args, **kwargs):
         if len(args) == 1 and callable(args[0]):
             (function,) = args
-            argspec = inspect.getfullargspec(function)
-            if argspec.varargs or argspec.varkw or argspec.kwonlyargs:
-                raise ValueError(
-                    "Decorated function must only accept positional "
-                    "arguments")
-            # We use the function signature to signal to the backend how many
-            # arguments a function requires. We do this as early as possible so
-            # as not to lose the information when wrapping `function` in one of
-            # our various wrapper functions which often accept varargs and
-            # kwargs.
-            return Function(function, args=tuple(argspec.args),
-                            backend=Backend())
+            return Function(function, args=_positional_arguments(function),
+                            backend=Backend(**kwargs))
 
         def inner(function):
-            return Function(function, args=args, backend=Backend())
+            return Function(function,
+                            args=args or _positional_arguments(function),
+                            backend=Backend(**kwargs))
         return inner
     return decorator
 
 
+def _positional_arguments(function):
+    """Returns the names of the arguments of `function`. We use the function
+    signature to signal to the backend how many arguments a function
+    requires. We do this as early as possible so as not to lose the
+    information when wrapping `function` in one of our various wrapper
+    functions which often accept varargs and kwargs.
+    """
+    argspec = inspect.getfullargspec(function)
+    if argspec.varargs or argspec.varkw or argspec.kwonlyargs:
+        raise ValueError(
+            "Decorated function must only accept positional arguments")
+    return tuple(argspec.args)
+
+
 def make_graph_backend_decorator(Backend):
-    def decorator(*args, **kwargs):
+    """Creates a function decorator for graph-based backends which is used as
+
+      @decorator(x, y)
+      def f(x, y):
+          pass
+
+    where `x` and `y` are symbolic variables of the backend. Data arrays the
+    function depends on can be declared as
+
+      @decorator(x, data={"A": A})
+      def f(x, A):
+          pass
+
+    in which case `f` is called with a backend variable holding `A` instead
+    of embedding `A` as a constant in the graph. The data can later be
+    replaced via `f.bind(A=...)` without recompiling `f`.
+    """
+    def decorator(*args, data=None, **kwargs):
         def inner(function):
-            graph = function(*flatten_arguments(args))
-            return Function(graph, args=args, backend=Backend(**kwargs))
+            backend = Backend(**kwargs)
+            variables = {
+                name: backend.create_data(name, value)
+                for name, value in (data or {}).items()
+            }
+            graph = function(*flatten_arguments(args), **variables)
+            return Function(graph, args=args, backend=backend,
+                            data=variables)
         return inner
     return decorator
@@ -1,6 +1,7 @@
 __all__ = (
     "Autograd",
     "Callable",
+    "Jax",
     "PyTorch",
     "TensorFlow",
     "Theano"
@@ -8,6 +9,7 @@ __all__ = (
 
 from ._autograd import Autograd
 from ._callable import Callable
+from ._jax import Jax
 from ._pytorch import PyTorch
 from ._tensorflow import TensorFlow
 from ._theano import Theano
@@ -3,24 +3,36 @@ Module containing functions to differentiate functions using autograd.
 """
 import functools
 
-try:
-    import autograd
-    from autograd import numpy as np
-except ImportError:
-    autograd = None
-
 from ._backend import Backend
 from .. import make_tracing_backend_decorator
-from ...tools import flatten_arguments, group_return_values, unpack_arguments
+from ...tools import (flatten_arguments, group_return_values, make_flattener,
+                      unpack_arguments)
+
+# autograd is imported on first use of the backend to keep 'import pymanopt'
+# fast.
+autograd = None
+np = None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_autograd():
+    global autograd, np
+    try:
+        import autograd
+        from autograd import numpy as np
+    except ImportError:
+        return False
+    return True
 
 
 class _AutogradBackend(Backend):
     def __init__(self):
         super().__init__("Autograd")
+        self._hessian_cache = None
 
     @staticmethod
     def is_available():
-        return autograd is not None
+        return _import_autograd()
 
     @Backend._assert_backend_available
     def is_compatible(self, objective, argument):
@@ -32,7 +44,7 @@ class _AutogradBackend(Backend):
         flattened_arguments = flatten_arguments(arguments)
         if len(flattened_arguments) == 1:
             return function
-        return unpack_arguments(function)
+        return unpack_arguments(function, signature=arguments)
 
     @Backend._assert_backend_available
     def compute_gradient(self, function, arguments):
@@ -60,41 +72,76 @@ class _AutogradBackend(Backend):
         unary_function = unpack_arguments(function, signature=arguments)
         return autograd.grad(unary_function)
 
-    @staticmethod
-    def _compute_nary_hessian_vector_product(function):
-        gradient = autograd.grad(function)
-
-        def vector_dot_grad(*args):
-            arguments, vectors = args[:-1], args[-1]
-            gradients = gradient(*arguments)
-            return np.sum(
-                [np.tensordot(gradients[i], vector, axes=vector.ndim)
-                 for i, vector in enumerate(vectors)])
-        return autograd.grad(vector_dot_grad)
+    def _gradient_vjp(self, gradient, points):
+        """Returns a function which multiplies the Hessian at `points` by a
+        vector, together with the gradient at `points`. Since the Hessian is
+        symmetric, this is the vector-Jacobian product of the gradient, whose
+        graph is traced once per point and reused as long as subsequent calls
+        pass equal points, as happens, e.g., in the inner iterations of the
+        trust-regions solver.
+        """
+        if self._hessian_cache is not None:
+            cached_points, vjp, value = self._hessian_cache
+            if len(cached_points) == len(points) and all(
+                    np.array_equal(cached_point, point)
+                    for cached_point, point in zip(cached_points, points)):
+                return vjp, value
+        # The points are copied so that the cached graph cannot be changed by
+        # in-place modifications of the arrays passed by the caller.
+        points = tuple(np.copy(point) for point in points)
+        if len(points) == 1:
+            vjp, value = autograd.make_vjp(gradient)(points[0])
+        else:
+            vjp, value = autograd.make_vjp(gradient)(points)
+        self._hessian_cache = (points, vjp, value)
+        return vjp, value
+
+    def _hessian_vector_product(self, gradient, points):
+        return self._gradient_vjp(gradient, points)[0]
 
     @Backend._assert_backend_available
     def compute_hessian(self, function, arguments):
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
         if len(flattened_arguments) == 1:
-            return autograd.hessian_tensor_product(function)
-        if len(arguments) == 1:
-            @functools.wraps(function)
-            def unary_function(arguments):
-                return function(*arguments)
-            return autograd.hessian_tensor_product(unary_function)
+            gradient = autograd.grad(function)
+
+            def unary_hessian(point, vector):
+                return self._hessian_vector_product(gradient, (point,))(
+                    vector)
+            return unary_hessian
 
         @functools.wraps(function)
         def unary_function(arguments):
             return function(*arguments)
-        hessian_vector_product = self._compute_nary_hessian_vector_product(
-            unary_function)
-
-        @functools.wraps(hessian_vector_product)
-        def wrapper(point, vector):
-            return hessian_vector_product(
-                flatten_arguments(point, signature=arguments),
-                flatten_arguments(vector, signature=arguments))
-        return group_return_values(wrapper, arguments)
+        gradient = autograd.grad(unary_function)
+
+        if len(arguments) == 1:
+            def grouped_hessian(point, vector):
+                return self._hessian_vector_product(gradient, tuple(point))(
+                    tuple(vector))
+            return grouped_hessian
+
+        def nary_hessian(point, vector):
+            hessian_vector_product = self._hessian_vector_product(
+                gradient, flatten(point))
+            return hessian_vector_product(flatten(vector))
+        return group_return_values(nary_hessian, arguments)
+
+    @Backend._assert_backend_available
+    def compute_riemannian_hessian(self, function, arguments, ehess2rhess):
+        # Autograd evaluates the gradient on numpy arrays, so there is nothing
+        # to gain from converting the gradient inside of autograd. The
+        # Hessian, however, reuses the gradient computed while tracing the
+        # Hessian-vector product rather than evaluating it a second time.
+        if len(flatten_arguments(arguments)) != 1:
+            return None
+        gradient = autograd.grad(function)
+
+        def riemannian_hessian(point, vector):
+            vjp, egrad = self._gradient_vjp(gradient, (point,))
+            return ehess2rhess(point, egrad, vjp(vector), vector)
+        return riemannian_hessian
 
 
 Autograd = make_tracing_backend_decorator(_AutogradBackend)
@@ -132,3 +132,126 @@ class Backend(metaclass=abc.ABCMeta):
             according to `arguments`, as well as a vector that is
             right-multiplied to the Hessian.
         """
+
+    def compile_batch_function(self, function, arguments):
+        """Compiles a function into a Python callable which evaluates the
+        function at each point of a sequence of points in a vectorized
+        fashion. Backends without means to vectorize functions return None,
+        in which case the function is evaluated at each point in turn.
+
+        Parameters
+        ----------
+        function
+            Python callable or a backend-specific computational graph node.
+        arguments
+            A backend-dependent representation of the arguments `function`
+            expects.
+
+        Returns
+        -------
+        batch_function : callable or None
+            A Python callable accepting a sequence of points according to the
+            signature defined by `arguments` and returning a numpy array of
+            the function values at the points.
+        """
+        return None
+
+    def compute_riemannian_gradient(self, function, arguments, egrad2rgrad):
+        """Computes the Riemannian gradient of a function by evaluating the
+        conversion `egrad2rgrad` of the Euclidean gradient on the arrays of
+        the backend, so that the conversion is part of the compiled gradient.
+        Backends which do not support this, and functions of more than one
+        argument, return None, in which case the conversion is applied to the
+        Euclidean gradient returned by `compute_gradient`.
+
+        Parameters
+        ----------
+        function
+            Python callable or a backend-specific computational graph node.
+        arguments
+            A backend-dependent representation of the arguments `function`
+            expects.
+        egrad2rgrad : callable
+            The `traced_egrad2rgrad` method of a manifold.
+
+        Returns
+        -------
+        riemannian_gradient : callable or None
+            A Python callable of the Riemannian gradient of `function`.
+        """
+        return None
+
+    def compute_riemannian_hessian(self, function, arguments, ehess2rhess):
+        """Computes the Riemannian Hessian-vector product of a function by
+        evaluating the conversion `ehess2rhess` on the arrays of the backend
+        as described in `compute_riemannian_gradient`.
+
+        Parameters
+        ----------
+        function
+            Python callable or a backend-specific computational graph node.
+        arguments
+            A backend-dependent representation of the arguments `function`
+            expects.
+        ehess2rhess : callable
+            The `traced_ehess2rhess` method of a manifold.
+
+        Returns
+        -------
+        riemannian_hessian_vector_product : callable or None
+            A Python callable accepting a point and a tangent vector and
+            evaluating the Riemannian Hessian of `function` along the vector.
+        """
+        return None
+
+    def tensor_conversions(self):
+        """Returns a pair of functions which convert a numpy array into a
+        tensor of the backend and a tensor back into a numpy array, without
+        copying the data where possible. Backends whose compiled functions,
+        gradients and Hessian-vector products accept tensors of the backend in
+        place of numpy arrays, and then return tensors rather than numpy
+        arrays, provide them so that the iterates of a solver can be kept as
+        tensors (see the `persistent_tensors` argument of Problem). Other
+        backends return None.
+
+        Returns
+        -------
+        conversions : tuple of callables or None
+            The functions converting numpy arrays to tensors and back.
+        """
+        return None
+
+    def create_data(self, name, value):
+        """Creates a backend variable holding a data array which a function
+        depends on but is not differentiated with respect to. Only
+        graph-based backends support data inputs.
+
+        Parameters
+        ----------
+        name : str
+            The name of the data input.
+        value : numpy.ndarray
+            The initial value of the data input.
+
+        Returns
+        -------
+        variable
+            A backend-specific variable which the function graph is built
+            from and whose value can be replaced via `assign_data`.
+        """
+        raise NotImplementedError(
+            "Backend '{}' does not support data inputs".format(self))
+
+    def assign_data(self, variable, value):
+        """Replaces the value of a data input created by `create_data` without
+        recompiling any of the functions which depend on it.
+
+        Parameters
+        ----------
+        variable
+            The backend-specific variable returned by `create_data`.
+        value : numpy.ndarray
+            The new value of the data input.
+        """
+        raise NotImplementedError(
+            "Backend '{}' does not support data inputs".format(self))
@@ -1,10 +1,27 @@
+import concurrent.futures
+import functools
+
+import numpy as np
+
 from ._backend import Backend
 from .. import make_tracing_backend_decorator
 
 
+@functools.lru_cache(maxsize=None)
+def _executor():
+    return concurrent.futures.ThreadPoolExecutor()
+
+
 class _CallableBackend(Backend):
-    def __init__(self):
+    """Costs are called as they are. Batches of points are evaluated one
+    point after another, unless the cost is declared thread-safe via
+    `@Callable(threadsafe=True)`, in which case they are evaluated
+    concurrently by a shared pool of threads.
+    """
+
+    def __init__(self, threadsafe=False):
         super().__init__("Callable")
+        self._threadsafe = threadsafe
 
     @staticmethod
     def is_available():
@@ -18,6 +35,17 @@ class _CallableBackend(Backend):
     def compile_function(self, function, arguments):
         return function
 
+    @Backend._assert_backend_available
+    def compile_batch_function(self, function, arguments):
+        # Opaque callables cannot be vectorized. Since the numerical libraries
+        # they call into typically release the GIL, the points of callables
+        # declared thread-safe are instead evaluated concurrently.
+        def batch_function(points):
+            if not self._threadsafe or len(points) <= 1:
+                return np.array([function(point) for point in points])
+            return np.array(list(_executor().map(function, points)))
+        return batch_function
+
     def _raise_not_implemented_error(self, function, arguments):
         raise NotImplementedError(
             "No autodiff support available for the canonical '{}' "
@@ -0,0 +1,244 @@
+"""
+Module containing functions to differentiate functions using jax.
+"""
+import functools
+import warnings
+
+import numpy as np
+
+from ._backend import Backend
+from .. import make_tracing_backend_decorator
+from ...tools import flatten_arguments, group_return_values, make_flattener
+
+# jax is imported on first use of the backend to keep 'import pymanopt' fast.
+jax = None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_jax():
+    global jax
+    try:
+        import jax
+    except ImportError:
+        return False
+    return True
+
+
+def _check_precision(arrays):
+    """Warns if any of the arrays is of double precision while the x64 mode
+    of jax is disabled, in which case jax computes in single precision.
+    """
+    if jax.config.jax_enable_x64:
+        return
+    for array in arrays:
+        if np.result_type(array) in (np.float64, np.complex128):
+            warnings.warn(
+                "jax computes in single precision unless its x64 mode is "
+                "enabled, e.g., via jax.config.update('jax_enable_x64', "
+                "True) at startup. The results are converted back to the "
+                "precision of the arguments.", stacklevel=3)
+            return
+
+
+def _asarray(array, like):
+    """Converts the jax array `array` to a numpy array of the same type as
+    the numpy array `like`.
+    """
+    return np.asarray(array, dtype=np.result_type(like))
+
+
+class _JaxBackend(Backend):
+    """The cost, its gradient and its Hessian-vector product are each
+    compiled with jax.jit once per function. The gradient is evaluated
+    together with the cost via jax.value_and_grad, and the cost at the last
+    point at which the gradient was evaluated is reused by subsequent calls
+    of the cost function. Likewise, the Riemannian Hessian-vector products
+    with fused conversions reuse the Euclidean gradient computed by the last
+    evaluation of the Riemannian gradient at the same point.
+
+    Points on manifolds are float64 arrays unless the dtype of the manifold
+    says otherwise. Since jax computes in single precision by default, the
+    x64 mode of jax has to be enabled by the user, e.g., via
+    jax.config.update("jax_enable_x64", True) at startup, to evaluate
+    functions at such points in double precision. Otherwise, a warning is
+    issued and the results computed in single precision are converted back
+    to the precision of the points.
+    """
+
+    def __init__(self):
+        super().__init__("Jax")
+        self._function = None
+        self._value_and_gradient = None
+        self._hessian_vector_product = None
+        self._last_value = None
+        self._last_egrad = None
+
+    @staticmethod
+    def is_available():
+        return _import_jax()
+
+    @Backend._assert_backend_available
+    def is_compatible(self, function, arguments):
+        return callable(function)
+
+    def _jit(self, function, arguments):
+        if self._function is not None:
+            return
+        argnums = tuple(range(len(flatten_arguments(arguments))))
+        gradient = jax.grad(function, argnums=argnums)
+
+        def hessian_vector_product(points, vectors):
+            # Forward-mode differentiation of the reverse-mode gradient.
+            return jax.jvp(gradient, points, vectors)[1]
+
+        self._function = jax.jit(function)
+        self._value_and_gradient = jax.jit(
+            jax.value_and_grad(function, argnums=argnums))
+        self._hessian_vector_product = jax.jit(hessian_vector_product)
+
+    def _evaluate(self, points):
+        # As for the Euclidean gradient reused by Problem, the value is
+        # reused if the points are the same objects as those of the last
+        # gradient evaluation, which avoids comparing them on every call.
+        if self._last_value is not None:
+            last_points, value = self._last_value
+            if all(point is last_point
+                   for point, last_point in zip(points, last_points)):
+                return value
+        _check_precision(points)
+        return float(self._function(*points))
+
+    def _evaluate_gradient(self, points):
+        _check_precision(points)
+        value, gradients = self._value_and_gradient(*points)
+        self._last_value = (tuple(points), float(value))
+        return [_asarray(gradient, point)
+                for gradient, point in zip(gradients, points)]
+
+    def _evaluate_hessian(self, points, vectors):
+        _check_precision(points)
+        hessians = self._hessian_vector_product(tuple(points), tuple(vectors))
+        return [_asarray(hessian, vector)
+                for hessian, vector in zip(hessians, vectors)]
+
+    @Backend._assert_backend_available
+    def compile_function(self, function, arguments):
+        self._jit(function, arguments)
+        flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
+
+        if len(flattened_arguments) == 1:
+            def unary_function(point):
+                return self._evaluate((point,))
+            return unary_function
+
+        def nary_function(points):
+            return self._evaluate(flatten(points))
+        return nary_function
+
+    @Backend._assert_backend_available
+    def compile_batch_function(self, function, arguments):
+        batch_function = jax.jit(jax.vmap(function))
+        flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
+
+        if len(flattened_arguments) == 1:
+            def unary_batch_function(points):
+                points = np.stack(points)
+                _check_precision((points,))
+                return np.asarray(batch_function(points))
+            return unary_batch_function
+
+        def nary_batch_function(points):
+            stacked_points = list(map(np.stack, zip(*map(flatten, points))))
+            _check_precision(stacked_points)
+            return np.asarray(batch_function(*stacked_points))
+        return nary_batch_function
+
+    @Backend._assert_backend_available
+    def compute_gradient(self, function, arguments):
+        self._jit(function, arguments)
+        flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
+
+        if len(flattened_arguments) == 1:
+            def unary_gradient(point):
+                (gradient,) = self._evaluate_gradient((point,))
+                return gradient
+            return unary_gradient
+
+        def nary_gradient(points):
+            return self._evaluate_gradient(flatten(points))
+        return group_return_values(nary_gradient, arguments)
+
+    @Backend._assert_backend_available
+    def compute_hessian(self, function, arguments):
+        self._jit(function, arguments)
+        flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
+
+        if len(flattened_arguments) == 1:
+            def unary_hessian(point, vector):
+                (hessian,) = self._evaluate_hessian((point,), (vector,))
+                return hessian
+            return unary_hessian
+
+        def nary_hessian(points, vectors):
+            return self._evaluate_hessian(flatten(points), flatten(vectors))
+        return group_return_values(nary_hessian, arguments)
+
+    def _riemannian_egrad(self, gradient, point):
+        """Returns the Euclidean gradient at `point` computed by the last
+        evaluation of the Riemannian gradient, or evaluates it if the
+        Riemannian gradient was last evaluated at a different point.
+        """
+        if self._last_egrad is not None:
+            last_point, egrad = self._last_egrad
+            if np.array_equal(point, last_point):
+                return egrad
+        egrad = gradient(point)
+        self._last_egrad = (np.copy(point), egrad)
+        return egrad
+
+    @Backend._assert_backend_available
+    def compute_riemannian_gradient(self, function, arguments, egrad2rgrad):
+        if len(flatten_arguments(arguments)) != 1:
+            return None
+        gradient = jax.grad(function)
+
+        @jax.jit
+        def compiled_riemannian_gradient(point):
+            egrad = gradient(point)
+            return egrad, egrad2rgrad(point, egrad)
+
+        def riemannian_gradient(point):
+            _check_precision((point,))
+            egrad, rgrad = compiled_riemannian_gradient(point)
+            self._last_egrad = (np.copy(point), egrad)
+            return _asarray(rgrad, point)
+        return riemannian_gradient
+
+    @Backend._assert_backend_available
+    def compute_riemannian_hessian(self, function, arguments, ehess2rhess):
+        if len(flatten_arguments(arguments)) != 1:
+            return None
+        gradient = jax.grad(function)
+        compiled_gradient = jax.jit(gradient)
+
+        @jax.jit
+        def compiled_riemannian_hessian(point, egrad, vector):
+            # Only the tangent of the forward-mode differentiation of the
+            # gradient is used, so that the compiled function does not
+            # evaluate the gradient itself but receives it as an argument.
+            ehess = jax.jvp(gradient, (point,), (vector,))[1]
+            return ehess2rhess(point, egrad, ehess, vector)
+
+        def riemannian_hessian(point, vector):
+            _check_precision((point,))
+            egrad = self._riemannian_egrad(compiled_gradient, point)
+            return _asarray(
+                compiled_riemannian_hessian(point, egrad, vector), vector)
+        return riemannian_hessian
+
+
+Jax = make_tracing_backend_decorator(_JaxBackend)
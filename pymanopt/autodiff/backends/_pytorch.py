@@ -3,25 +3,83 @@ Module containing functions to differentiate functions using pytorch.
 """
 import functools
 
-try:
-    import torch
-except ImportError:
-    torch = None
-else:
-    from torch import autograd
+import numpy as np
 
 from ._backend import Backend
 from .. import make_tracing_backend_decorator
-from ...tools import flatten_arguments, group_return_values
+from ...tools import flatten_arguments, group_return_values, make_flattener
+
+# torch is imported on first use of the backend to keep 'import pymanopt'
+# fast.
+torch = None
+autograd = None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_torch():
+    global torch, autograd
+    try:
+        import torch
+        from torch import autograd
+    except ImportError:
+        return False
+    return True
+
+
+def _from_numpy(array):
+    """Wraps a numpy array in a tensor sharing its memory. Tensors are passed
+    through as is.
+    """
+    if isinstance(array, np.ndarray):
+        return torch.from_numpy(array)
+    return array
+
+
+def _leaf(array):
+    """Returns a leaf tensor sharing the memory of `array` which requires
+    gradients. Tensors are detached first so that the tensor of the caller is
+    left unchanged.
+    """
+    if isinstance(array, np.ndarray):
+        return torch.from_numpy(array).requires_grad_()
+    return array.detach().requires_grad_()
+
+
+def _like(tensor, array):
+    """Returns `tensor` as a numpy array if `array` is one, and as a tensor
+    otherwise.
+    """
+    if isinstance(array, np.ndarray):
+        return tensor.numpy()
+    return tensor
+
+
+def _zeros_like(array):
+    if isinstance(array, np.ndarray):
+        return np.zeros_like(array)
+    return torch.zeros_like(array)
+
+
+def _to_numpy(tensor):
+    return tensor.detach().numpy()
 
 
 class _PyTorchBackend(Backend):
+    """Functions compiled by the backend accept numpy arrays, which are
+    wrapped in tensors without copying them, and return numpy arrays sharing
+    the memory of the resulting tensors. They also accept tensors, in which
+    case tensors are returned and the cost is returned as a Python float, so
+    that the iterates of solvers can be kept as tensors for the whole solve
+    (see the `persistent_tensors` argument of Problem).
+    """
+
     def __init__(self):
         super().__init__("PyTorch")
+        self._gradient_graph_cache = None
 
     @staticmethod
     def is_available():
-        return torch is not None and torch.__version__ >= "0.4.1"
+        return _import_torch() and torch.__version__ >= "0.4.1"
 
     @Backend._assert_backend_available
     def is_compatible(self, function, arguments):
@@ -30,83 +88,187 @@ class _PyTorchBackend(Backend):
     @Backend._assert_backend_available
     def compile_function(self, function, arguments):
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
 
         if len(flattened_arguments) == 1:
             @functools.wraps(function)
             def unary_function(argument):
-                return function(torch.from_numpy(argument)).numpy()
+                value = function(_from_numpy(argument))
+                if isinstance(argument, np.ndarray):
+                    return value.numpy()
+                return value.item()
             return unary_function
 
         @functools.wraps(function)
         def nary_function(arguments):
-            return function(
-                *map(torch.from_numpy, flatten_arguments(arguments))).numpy()
+            arguments = flatten(arguments)
+            value = function(*map(_from_numpy, arguments))
+            if isinstance(arguments[0], np.ndarray):
+                return value.numpy()
+            return value.item()
         return nary_function
 
-    def _sanitize_gradient(self, tensor):
-        if tensor.grad is None:
-            return torch.zeros(tensor.shape, dtype=tensor.dtype).numpy()
-        return tensor.grad.numpy()
+    @Backend._assert_backend_available
+    def compile_batch_function(self, function, arguments):
+        # torch.vmap is only available as of torch 2.0.
+        vmap = getattr(torch, "vmap", None)
+        if vmap is None:
+            return None
+        batch_function = vmap(function)
+        compiled_function = self.compile_function(function, arguments)
+        flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
+        vectorizable = [True]
 
-    def _sanitize_gradients(self, tensors):
-        return list(map(self._sanitize_gradient, tensors))
+        def evaluate(points):
+            if vectorizable[0]:
+                if len(flattened_arguments) == 1:
+                    stacked_points = [np.stack(points)]
+                else:
+                    stacked_points = map(np.stack, zip(*map(flatten, points)))
+                try:
+                    return batch_function(
+                        *map(torch.from_numpy, stacked_points)).numpy()
+                except RuntimeError:
+                    # Not every operation supports vmap, in which case the
+                    # function is evaluated at each point in turn.
+                    vectorizable[0] = False
+            return np.array([compiled_function(point) for point in points])
+        return evaluate
+
+    def _evaluate_gradient(self, function, points):
+        xs = [_leaf(point) for point in points]
+        fx = function(*xs)
+        if not fx.requires_grad:
+            return [_zeros_like(point) for point in points]
+        # Unlike backward(), autograd.grad returns the gradients directly
+        # instead of accumulating them in the .grad buffers of the leaves.
+        gradients = autograd.grad(fx, xs, allow_unused=True)
+        return [
+            _zeros_like(point) if gradient is None else _like(gradient, point)
+            for point, gradient in zip(points, gradients)
+        ]
 
     @Backend._assert_backend_available
     def compute_gradient(self, function, arguments):
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
 
         if len(flattened_arguments) == 1:
-            def unary_gradient(argument):
-                torch_argument = torch.from_numpy(argument)
-                torch_argument.requires_grad_()
-                function(torch_argument).backward()
-                return self._sanitize_gradient(torch_argument)
+            def unary_gradient(point):
+                (gradient,) = self._evaluate_gradient(function, (point,))
+                return gradient
             return unary_gradient
 
-        def nary_gradient(arguments):
-            torch_arguments = []
-            for argument in flatten_arguments(arguments):
-                torch_argument = torch.from_numpy(argument)
-                torch_argument.requires_grad_()
-                torch_arguments.append(torch_argument)
-            function(*torch_arguments).backward()
-            return self._sanitize_gradients(torch_arguments)
+        def nary_gradient(points):
+            return self._evaluate_gradient(function, flatten(points))
         return group_return_values(nary_gradient, arguments)
 
+    def _gradient_graph(self, function, points):
+        """Returns the leaf tensors of the given points and the gradients of
+        `function` at the points with their graph attached. The graph is
+        built once per point and reused as long as subsequent calls pass an
+        equal point, as happens, e.g., in the inner iterations of the
+        trust-regions solver.
+        """
+        if self._gradient_graph_cache is not None:
+            xs, gradients = self._gradient_graph_cache
+            if len(xs) == len(points) and all(
+                    torch.equal(x.detach(), _from_numpy(point))
+                    for x, point in zip(xs, points)):
+                return xs, gradients
+        # The points are copied so that the cached graph cannot be changed by
+        # in-place modifications of the arrays passed by the caller.
+        xs = [_from_numpy(point).detach().clone().requires_grad_()
+              for point in points]
+        gradients = autograd.grad(function(*xs), xs, create_graph=True,
+                                  allow_unused=True)
+        self._gradient_graph_cache = (xs, gradients)
+        return xs, gradients
+
+    def _hessian_vector_product(self, xs, gradients, vectors):
+        dot_product = 0
+        for gradient, vector in zip(gradients, vectors):
+            # Gradients which do not depend on the points do not contribute
+            # to the Hessian.
+            if gradient is not None and gradient.requires_grad:
+                dot_product = dot_product + (
+                    gradient * _from_numpy(vector)).sum()
+        if not torch.is_tensor(dot_product):
+            hessians = [None] * len(xs)
+        else:
+            hessians = autograd.grad(dot_product, xs, retain_graph=True,
+                                     allow_unused=True)
+        return [
+            _zeros_like(vector) if hessian is None else _like(hessian, vector)
+            for vector, hessian in zip(vectors, hessians)
+        ]
+
+    def _evaluate_hessian(self, function, points, vectors):
+        xs, gradients = self._gradient_graph(function, points)
+        # Vectors with an additional leading dimension are treated as a
+        # batch of vectors, each of which is multiplied by the Hessian
+        # through the same gradient graph.
+        if vectors[0].ndim == xs[0].dim() + 1:
+            hessians = [
+                self._hessian_vector_product(xs, gradients, batch)
+                for batch in zip(*vectors)
+            ]
+            if isinstance(vectors[0], np.ndarray):
+                return [np.stack(hessian) for hessian in zip(*hessians)]
+            return [torch.stack(hessian) for hessian in zip(*hessians)]
+        return self._hessian_vector_product(xs, gradients, vectors)
+
     @Backend._assert_backend_available
     def compute_hessian(self, function, arguments):
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
 
         if len(flattened_arguments) == 1:
             def unary_hessian(point, vector):
-                x = torch.from_numpy(point)
-                v = torch.from_numpy(vector)
-                x.requires_grad_()
-                fx = function(x)
-                (grad_fx,) = autograd.grad(fx, x, create_graph=True,
-                                           allow_unused=True)
-                (grad_fx * v).sum().backward()
-                return self._sanitize_gradient(x)
+                (hessian,) = self._evaluate_hessian(function, (point,),
+                                                    (vector,))
+                return hessian
             return unary_hessian
 
         def nary_hessian(points, vectors):
-            xs = []
-            for point in flatten_arguments(points):
-                x = torch.from_numpy(point)
-                x.requires_grad_()
-                xs.append(x)
-            vs = [torch.from_numpy(vector)
-                  for vector in flatten_arguments(vectors)]
-            fx = function(*xs)
-            fx.requires_grad_()
-            gradients = autograd.grad(fx, xs, create_graph=True,
-                                      allow_unused=True)
-            dot_product = 0
-            for gradient, vector in zip(gradients, vs):
-                dot_product += (gradient * vector).sum()
-            dot_product.backward()
-            return self._sanitize_gradients(xs)
+            return self._evaluate_hessian(function, flatten(points),
+                                          flatten(vectors))
         return group_return_values(nary_hessian, arguments)
 
+    @Backend._assert_backend_available
+    def compute_riemannian_gradient(self, function, arguments, egrad2rgrad):
+        if len(flatten_arguments(arguments)) != 1:
+            return None
+
+        def riemannian_gradient(point):
+            x = _leaf(point)
+            fx = function(x)
+            if not fx.requires_grad:
+                return _zeros_like(point)
+            (gradient,) = autograd.grad(fx, x)
+            return _like(egrad2rgrad(x.detach(), gradient), point)
+        return riemannian_gradient
+
+    @Backend._assert_backend_available
+    def compute_riemannian_hessian(self, function, arguments, ehess2rhess):
+        if len(flatten_arguments(arguments)) != 1:
+            return None
+
+        def riemannian_hessian(point, vector):
+            (x,), (gradient,) = self._gradient_graph(function, (point,))
+            u = _from_numpy(vector)
+            if gradient is None or not gradient.requires_grad:
+                return _zeros_like(vector)
+            (hessian,) = autograd.grad(gradient, x, grad_outputs=u,
+                                       retain_graph=True)
+            return _like(ehess2rhess(x.detach(), gradient.detach(), hessian,
+                                     u), vector)
+        return riemannian_hessian
+
+    @Backend._assert_backend_available
+    def tensor_conversions(self):
+        return torch.from_numpy, _to_numpy
+
 
 PyTorch = make_tracing_backend_decorator(_PyTorchBackend)
@@ -1,21 +1,45 @@
 """
 Module containing functions to differentiate functions using tensorflow.
 """
+import functools
 import itertools
 
-try:
-    import tensorflow as tf
-except ImportError:
-    tf = None
+import numpy as np
 
 from ._backend import Backend
 from .. import make_graph_backend_decorator
-from ...tools import flatten_arguments, group_return_values
+from ...tools import flatten_arguments, group_return_values, make_flattener
+
+# tensorflow is imported on first use of the backend to keep
+# 'import pymanopt' fast.
+tf = None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_tensorflow():
+    global tf
+    try:
+        import tensorflow as tf
+    except ImportError:
+        return False
+    return True
 
 
 class _TensorFlowBackend(Backend):
+    """The cost, its gradient and its Hessian-vector product are compiled
+    into session callables via Session.make_callable, so that evaluations
+    do not build a feed dict. Each gradient evaluation fetches the cost along
+    with the gradient, and each Hessian-vector product fetches the gradient
+    along with the product, in a single session call. The cost and the
+    gradient fetched at the last point are reused by subsequent evaluations
+    at the same point. The backend operates on graphs evaluated in a session,
+    i.e., TensorFlow 1 or the tf.compat.v1 graph mode of TensorFlow 2.
+    """
+
     def __init__(self, **kwargs):
         self._own_session = None
+        self._last_value = None
+        self._last_gradient = None
 
         if self.is_available():
             self._session = kwargs.get("session")
@@ -30,7 +54,7 @@ class _TensorFlowBackend(Backend):
 
     @staticmethod
     def is_available():
-        return tf is not None
+        return _import_tensorflow()
 
     @Backend._assert_backend_available
     def is_compatible(self, function, arguments):
@@ -40,26 +64,57 @@ class _TensorFlowBackend(Backend):
         return all([isinstance(argument, tf.Variable)
                     for argument in flattened_arguments])
 
+    @staticmethod
+    def _lookup(cache, points):
+        """Returns the value stored in `cache` if it was computed at `points`,
+        and None otherwise.
+        """
+        if cache is None:
+            return None
+        last_points, value = cache
+        if len(last_points) == len(points) and all(
+                np.array_equal(point, last_point)
+                for point, last_point in zip(points, last_points)):
+            return value
+        return None
+
+    def _evaluate(self, run, points):
+        value = self._lookup(self._last_value, points)
+        if value is not None:
+            return value
+        return run(*points)
+
     @Backend._assert_backend_available
     def compile_function(self, function, arguments):
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
+        run = self._session.make_callable(function,
+                                          feed_list=list(flattened_arguments))
         if len(flattened_arguments) == 1:
             def unary_function(point):
-                (argument,) = flattened_arguments
-                feed_dict = {argument: point}
-                return self._session.run(function, feed_dict)
+                return self._evaluate(run, (point,))
             return unary_function
 
         def nary_function(arguments):
-            flattened_inputs = flatten_arguments(arguments)
-            feed_dict = {
-                argument: array
-                for argument, array in zip(flattened_arguments,
-                                           flattened_inputs)
-            }
-            return self._session.run(function, feed_dict)
+            return self._evaluate(run, flatten(arguments))
         return nary_function
 
+    @Backend._assert_backend_available
+    def create_data(self, name, value):
+        # The variable is initialized from a placeholder rather than from
+        # `value` so that the data is not embedded as a constant in the graph.
+        value = np.asarray(value)
+        initial_value = tf.placeholder(tf.as_dtype(value.dtype),
+                                       shape=value.shape)
+        variable = tf.Variable(initial_value, trainable=False, name=name)
+        variable.load(value, self._session)
+        return variable
+
+    @Backend._assert_backend_available
+    def assign_data(self, variable, value):
+        variable.load(value, self._session)
+        self._last_value = self._last_gradient = None
+
     @staticmethod
     def _gradients(function, arguments):
         return tf.gradients(function, arguments,
@@ -68,28 +123,36 @@ class _TensorFlowBackend(Backend):
     @Backend._assert_backend_available
     def compute_gradient(self, function, arguments):
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
         gradient = self._gradients(function, flattened_arguments)
+        # The cost is fetched along with the gradient in the same call and
+        # kept for subsequent evaluations of the cost at the same point.
+        run = self._session.make_callable([function, gradient],
+                                          feed_list=list(flattened_arguments))
+
+        def evaluate_gradient(points):
+            gradients = self._lookup(self._last_gradient, points)
+            if gradients is not None:
+                return gradients
+            value, gradients = run(*points)
+            points = tuple(np.copy(point) for point in points)
+            self._last_value = (points, value)
+            self._last_gradient = (points, gradients)
+            return gradients
 
         if len(flattened_arguments) == 1:
-            (argument,) = flattened_arguments
-
             def unary_gradient(point):
-                feed_dict = {argument: point}
-                return self._session.run(gradient[0], feed_dict)
+                return evaluate_gradient((point,))[0]
             return unary_gradient
 
         def nary_gradient(points):
-            feed_dict = {
-                argument: point
-                for argument, point in zip(flattened_arguments,
-                                           flatten_arguments(points))
-            }
-            return self._session.run(gradient, feed_dict)
+            return evaluate_gradient(flatten(points))
         return group_return_values(nary_gradient, arguments)
 
     @staticmethod
     def _hessian_vector_product(function, arguments, vectors):
         """Multiply the Hessian of `function` w.r.t. `arguments` by `vectors`.
+        Returns the gradients of the first backprop along with the products.
 
         Notes
         -----
@@ -119,35 +182,35 @@ class _TensorFlowBackend(Backend):
         ]
 
         # Second backprop
-        return _TensorFlowBackend._gradients(element_wise_products, arguments)
+        return gradients, _TensorFlowBackend._gradients(
+            element_wise_products, arguments)
 
     @Backend._assert_backend_available
     def compute_hessian(self, function, arguments):
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
+        zeros = [tf.zeros_like(argument) for argument in flattened_arguments]
+        gradient, hessian = self._hessian_vector_product(
+            function, flattened_arguments, zeros)
+        # The gradient is a by-product of the Hessian-vector product. It is
+        # fetched in the same call and kept for subsequent evaluations of the
+        # gradient at the same point, e.g., by Problem.hess.
+        run = self._session.make_callable(
+            [gradient, hessian], feed_list=list(flattened_arguments) + zeros)
+
+        def evaluate_hessian(points, vectors):
+            gradients, hessians = run(*itertools.chain(points, vectors))
+            self._last_gradient = (tuple(np.copy(point) for point in points),
+                                   gradients)
+            return hessians
 
         if len(flattened_arguments) == 1:
-            (argument,) = flattened_arguments
-            zeros = tf.zeros_like(argument)
-            hessian = self._hessian_vector_product(
-                function, [argument], [zeros])
-
             def unary_hessian(point, vector):
-                feed_dict = {argument: point, zeros: vector}
-                return self._session.run(hessian[0], feed_dict)
+                return evaluate_hessian((point,), (vector,))[0]
             return unary_hessian
 
-        zeros = [tf.zeros_like(argument) for argument in flattened_arguments]
-        hessian = self._hessian_vector_product(
-            function, flattened_arguments, zeros)
-
         def nary_hessian(points, vectors):
-            feed_dict = {
-                argument: value for argument, value in zip(
-                    itertools.chain(flattened_arguments, zeros),
-                    itertools.chain(flatten_arguments(points),
-                                    flatten_arguments(vectors)))
-            }
-            return self._session.run(hessian, feed_dict)
+            return evaluate_hessian(flatten(points), flatten(vectors))
         return group_return_values(nary_hessian, arguments)
 
 
@@ -1,17 +1,28 @@
 import functools
 import itertools
 
-try:
-    import theano
-    import theano.tensor as T
-    from theano.gradient import disconnected_grad
-except ImportError:
-    theano = None
-    T = None
-
 from ._backend import Backend
 from .. import make_graph_backend_decorator
-from ...tools import flatten_arguments, group_return_values, unpack_arguments
+from ...tools import (flatten_arguments, group_return_values, make_flattener,
+                      unpack_arguments)
+
+# theano is imported on first use of the backend to keep 'import pymanopt'
+# fast.
+theano = None
+T = None
+disconnected_grad = None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_theano():
+    global theano, T, disconnected_grad
+    try:
+        import theano
+        import theano.tensor as T
+        from theano.gradient import disconnected_grad
+    except ImportError:
+        return False
+    return True
 
 
 class _TheanoBackend(Backend):
@@ -20,7 +31,7 @@ class _TheanoBackend(Backend):
 
     @staticmethod
     def is_available():
-        return theano is not None
+        return _import_theano()
 
     @Backend._assert_backend_available
     def is_compatible(self, function, arguments):
@@ -33,6 +44,14 @@ class _TheanoBackend(Backend):
     def _compile_function_without_warnings(self, *args, **kwargs):
         return theano.function(*args, **kwargs, on_unused_input="ignore")
 
+    @Backend._assert_backend_available
+    def create_data(self, name, value):
+        return theano.shared(value, name=name)
+
+    @Backend._assert_backend_available
+    def assign_data(self, variable, value):
+        variable.set_value(value)
+
     @Backend._assert_backend_available
     def compile_function(self, function, arguments):
         """Compiles a Theano graph into a python function."""
@@ -41,7 +60,7 @@ class _TheanoBackend(Backend):
             flattened_arguments, function)
         if len(flattened_arguments) == 1:
             return compiled_function
-        return unpack_arguments(compiled_function)
+        return unpack_arguments(compiled_function, signature=arguments)
 
     @Backend._assert_backend_available
     def compute_gradient(self, function, arguments):
@@ -60,7 +79,8 @@ class _TheanoBackend(Backend):
         compiled_gradient = self._compile_function_without_warnings(
             flattened_arguments, gradient)
         return group_return_values(
-            unpack_arguments(compiled_gradient), arguments)
+            unpack_arguments(compiled_gradient, signature=arguments),
+            arguments)
 
     def _compute_unary_hessian_vector_product(self, gradient, argument):
         """Returns a function accepting two arguments to compute a
@@ -110,6 +130,7 @@ class _TheanoBackend(Backend):
         vector.
         """
         flattened_arguments = flatten_arguments(arguments)
+        flatten = make_flattener(arguments)
 
         if len(flattened_arguments) == 1:
             (argument,) = flattened_arguments
@@ -123,8 +144,7 @@ class _TheanoBackend(Backend):
 
         @functools.wraps(hessian_vector_product)
         def wrapper(points, vectors):
-            return hessian_vector_product(*flatten_arguments(points),
-                                          *flatten_arguments(vectors))
+            return hessian_vector_product(*flatten(points), *flatten(vectors))
         return group_return_values(wrapper, arguments)
 
 
@@ -3,6 +3,8 @@ Module containing pymanopt problem class. Use this to build a problem
 object to feed to one of the solvers.
 """
 
+import numpy as np
+
 
 class Problem:
     """
@@ -36,21 +38,72 @@ class Problem:
             The 'Euclidean Hessian', ehess(x, a) should return the
             directional derivative of egrad at x in direction a. This
             need not lie in the tangent space.
+        - cost_batch
+            cost_batch(points) should return a numpy array of the costs at
+            each of the given points. Population-based solvers use it to
+            evaluate the cost at many points at once. If not given, the
+            batch evaluation of the cost function is used, which is
+            vectorized by backends that support it.
         - verbosity (2)
             Level of information printed by the solver while it operates, 0
             is silent, 2 is most information.
+        - promote_precision (True)
+            If True, the scalar quantities on which solvers base the
+            acceptance of steps (the ratio rho in the trust-region method and
+            the Armijo condition of the line searches) are evaluated in
+            float64 regardless of dtype.
+        - fuse_conversions (False)
+            If True and both the autodiff backend of the cost and the
+            manifold support it (see `Manifold.traced_egrad2rgrad`), the
+            conversions egrad2rgrad and ehess2rhess are evaluated by the
+            backend as part of the automatically computed gradient and
+            Hessian, rather than in numpy on the Euclidean derivatives. This
+            saves the transfer of the Euclidean derivatives and the
+            temporaries of the conversions, and allows the backend to fuse
+            the operations. Otherwise, or if egrad or ehess are given
+            explicitly, the conversions are evaluated in numpy.
+        - persistent_tensors (False)
+            If True, the gradient-based solvers keep their iterates and
+            tangent vectors as tensors of the autodiff backend of the cost
+            for the whole solve, so that neither the backend nor the manifold
+            convert them from and to numpy arrays at every evaluation. Numpy
+            arrays are only used at the boundary of the solve: the initial
+            point is converted to a tensor, and the solution returned by the
+            solver is converted back. This requires a cost of the PyTorch
+            backend and a manifold which supports tensors (see
+            `Manifold.supports_tensors`). Explicitly given derivatives and
+            preconditioners then receive and must return tensors as well.
     """
     def __init__(self, manifold, cost, egrad=None, ehess=None, grad=None,
-                 hess=None, precon=None, verbosity=2):
+                 hess=None, precon=None, verbosity=2, promote_precision=True,
+                 cost_batch=None, fuse_conversions=False,
+                 persistent_tensors=False):
         self.manifold = manifold
+        self.promote_precision = promote_precision
+        self.fuse_conversions = fuse_conversions
+
+        self._tensor_conversions = None
+        if persistent_tensors:
+            tensor_conversions = getattr(cost, "tensor_conversions", None)
+            if tensor_conversions is not None:
+                self._tensor_conversions = tensor_conversions()
+            if self._tensor_conversions is None:
+                raise ValueError(
+                    "The cost function does not support persistent tensors")
+            if not manifold.supports_tensors:
+                raise ValueError(
+                    "The manifold '{}' does not support persistent "
+                    "tensors".format(manifold))
 
         self.cost = cost
+        self._cost_batch = cost_batch
 
         self._ehess = ehess
         self._egrad = egrad
 
         self._grad = grad
         self._hess = hess
+        self._last_egrad = None
 
         if precon is None:
             def precon(x, d):
@@ -59,22 +112,95 @@ class Problem:
 
         self.verbosity = verbosity
 
+    @property
+    def dtype(self):
+        """The floating point type of the iterates, tangent vectors and
+        solver workspaces. It is determined by the manifold (float64 by
+        default), e.g., `manifold.dtype = np.float32` selects single
+        precision, and has to be set before solving the problem.
+        """
+        return self.manifold.dtype
+
+    def from_numpy(self, x):
+        """Converts the point `x` given as a numpy array into the
+        representation of the iterates used by solvers, i.e., a tensor of the
+        autodiff backend if the problem keeps persistent tensors, and the
+        numpy array itself otherwise.
+        """
+        if self._tensor_conversions is None:
+            return x
+        return self._tensor_conversions[0](x)
+
+    def to_numpy(self, x):
+        """Converts a point `x` in the representation used by solvers back
+        into a numpy array. This is the inverse of :py:func:`from_numpy`.
+        """
+        if self._tensor_conversions is None:
+            return x
+        return self._tensor_conversions[1](x)
+
+    @property
+    def scalar_dtype(self):
+        """The floating point type in which solvers evaluate the scalar
+        quantities that decide on the acceptance of steps.
+        """
+        if self.promote_precision:
+            return np.dtype(np.float64)
+        return self.dtype
+
+    @property
+    def cost_batch(self):
+        if self._cost_batch is None:
+            cost_batch = getattr(self.cost, "batch", None)
+            if cost_batch is None:
+                def cost_batch(points):
+                    return np.array([self.cost(point) for point in points])
+            self._cost_batch = cost_batch
+        return self._cost_batch
+
     @property
     def egrad(self):
         if self._egrad is None:
             self._egrad = self.cost.compute_gradient()
         return self._egrad
 
+    def _compute_fused(self, method, conversion):
+        """Returns the Riemannian derivative computed by the method `method`
+        of the cost with the manifold conversion `conversion` evaluated by the
+        backend, or None if the conversions are not to be fused or either the
+        cost or the manifold do not support it.
+        """
+        if not self.fuse_conversions or conversion is None:
+            return None
+        compute = getattr(self.cost, method, None)
+        if compute is None:
+            return None
+        return compute(conversion)
+
     @property
     def grad(self):
+        if self._grad is None and self._egrad is None:
+            self._grad = self._compute_fused(
+                "compute_riemannian_gradient",
+                self.manifold.traced_egrad2rgrad)
         if self._grad is None:
-            egrad = self.egrad
-
             def grad(x):
-                return self.manifold.egrad2rgrad(x, egrad(x))
+                egrad = self.egrad(x)
+                self._last_egrad = (x, egrad)
+                return self.manifold.egrad2rgrad(x, egrad)
             self._grad = grad
         return self._grad
 
+    def _egrad_at(self, x):
+        """Returns the Euclidean gradient at x. Solvers evaluate the Hessian
+        along many directions at the point at which they last evaluated the
+        gradient, so the Euclidean gradient of the last call of grad (or of
+        this method) is reused if x is the same object.
+        """
+        if self._last_egrad is None or self._last_egrad[0] is not x:
+            self._last_egrad = (x, self.egrad(x))
+        return self._last_egrad[1]
+
     @property
     def ehess(self):
         if self._ehess is None:
@@ -83,11 +209,22 @@ class Problem:
 
     @property
     def hess(self):
+        if self._hess is None and self._ehess is None:
+            self._hess = self._compute_fused(
+                "compute_riemannian_hessian",
+                self.manifold.traced_ehess2rhess)
         if self._hess is None:
+            tangent2factors = None
+            if self._ehess is None:
+                tangent2factors = self.manifold.tangent2factors
             ehess = self.ehess
 
             def hess(x, a):
-                return self.manifold.ehess2rhess(
-                    x, self.egrad(x), ehess(x, a), a)
+                if tangent2factors is None:
+                    ehess_a = ehess(x, a)
+                else:
+                    ehess_a = ehess(x, tangent2factors(x, a))
+                return self.manifold.ehess2rhess(x, self._egrad_at(x),
+                                                 ehess_a, a)
             self._hess = hess
         return self._hess
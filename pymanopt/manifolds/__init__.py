@@ -7,6 +7,7 @@ __all__ = (
     "Oblique",
     "PSDFixedRank",
     "PSDFixedRankComplex",
+    "PowerManifold",
     "Product",
     "SkewSymmetric",
     "SpecialOrthogonalGroup",
@@ -23,6 +24,7 @@ from .euclidean import Euclidean, SkewSymmetric, Symmetric
 from .fixed_rank import FixedRankEmbedded
 from .grassmann import Grassmann
 from .oblique import Oblique
+from .power import PowerManifold
 from .product import Product
 from .psd import (Elliptope, PSDFixedRank, PSDFixedRankComplex,
                   SymmetricPositiveDefinite)
@@ -1,6 +1,5 @@
 import numpy as np
 import numpy.linalg as la
-import numpy.random as rnd
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
 
@@ -32,60 +31,78 @@ class ComplexCircle(EuclideanEmbeddedSubmanifold):
         return la.norm(v)
 
     def dist(self, x, y):
-        return la.norm(np.arccos((x.conj() * y).real))
+        return la.norm(np.arccos(np.clip(self._real_product(x, y), -1, 1)))
 
     @property
     def typicaldist(self):
         return np.pi * np.sqrt(self._dimension)
 
     def proj(self, z, u):
-        return u - (u.conj() * z).real * z
+        Pu = np.multiply(z, self._real_product(u, z))
+        return np.subtract(u, Pu, out=Pu)
 
     tangent = proj
 
     def ehess2rhess(self, z, egrad, ehess, zdot):
-        return self.proj(z, (z * egrad.conj()).real * zdot)
+        return self.proj(z, ehess - self._real_product(z, egrad) * zdot)
 
     def exp(self, z, v):
-        y = np.zeros(self._dimension)
         abs_v = np.abs(v)
-        mask = abs_v > 0
-        not_mask = np.logical_not(mask)
-        y[mask] = (z[mask] * np.cos(abs_v[mask]) +
-                   v[mask] * (np.sin(abs_v[mask]) / abs_v[mask]))
-        y[not_mask] = z[not_mask]
+        # sin(|v|) / |v| tends to one as |v| goes to zero, in which case
+        # y = z.
+        factors = np.ones_like(abs_v)
+        np.divide(np.sin(abs_v), abs_v, out=factors, where=abs_v > 0)
+        y = np.multiply(v, factors)
+        y += z * np.cos(abs_v, out=abs_v)
         return y
 
     def retr(self, z, v):
-        return self._normalize(z + v)
+        return self._normalize(np.add(z, v))
 
     def log(self, x1, x2):
         v = self.proj(x1, x2 - x1)
         abs_v = np.abs(v)
-        di = np.arccos((x1.conj() * x2).real)
-        factors = di / abs_v
-        factors[di <= 1e-6] = 1
-        return v * factors
-
-    def rand(self):
-        dimension = self._dimension
+        # Rounding errors may push the products slightly outside [-1, 1].
+        di = np.arccos(np.clip(self._real_product(x1, x2), -1, 1))
+        # For very close points, the division of the distances by the norms
+        # of v is unreliable, so the ratios are set to one instead.
+        factors = np.ones_like(di)
+        np.divide(di, abs_v, out=factors, where=di > 1e-6)
+        v *= factors
+        return v
+
+    def rand(self, n=None):
+        shape = (self._dimension,)
         return self._normalize(
-            rnd.randn(dimension) + 1j * rnd.randn(dimension))
+            self._randn(shape, n) + 1j * self._randn(shape, n))
 
-    def randvec(self, z):
-        v = rnd.randn(self._dimension) * (1j * z)
-        return v / self.norm(z, v)
+    def randvec(self, z, n=None):
+        v = self._randn((self._dimension,), n) * (1j * z)
+        return self._normalize_samples(v, n)
 
     def transp(self, x1, x2, d):
         return self.proj(x2, d)
 
     def pairmean(self, z1, z2):
-        return self._normalize(z1 + z2)
+        return self._normalize(np.add(z1, z2))
 
     def zerovec(self, x):
-        return np.zeros(self._dimension)
+        return np.zeros(self._dimension,
+                        dtype=np.result_type(self.dtype, np.complex64))
+
+    @staticmethod
+    def _real_product(u, v):
+        """Return the element-wise real inner products Re(conj(u) * v) without
+        forming the complex product.
+        """
+        product = np.multiply(u.real, v.real)
+        product += u.imag * v.imag
+        return product
 
     @staticmethod
     def _normalize(x):
-        """Normalize the entries of x element-wise by their absolute values."""
-        return x / np.abs(x)
+        """Normalize the entries of x element-wise by their absolute values in
+        place.
+        """
+        x /= np.abs(x)
+        return x
@@ -1,5 +1,5 @@
 import numpy as np
-from numpy import linalg as la, random as rnd
+from numpy import linalg as la
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
 from pymanopt.tools.multi import multiskew, multisym
@@ -8,6 +8,8 @@ from pymanopt.tools.multi import multiskew, multisym
 class _Euclidean(EuclideanEmbeddedSubmanifold):
     """Shared base class for subspace manifolds of Euclidean space."""
 
+    _euclidean_metric = True
+
     def __init__(self, name, dimension, *shape):
         self._shape = shape
         super().__init__(name, dimension)
@@ -17,13 +19,17 @@ class _Euclidean(EuclideanEmbeddedSubmanifold):
         return np.sqrt(self.dim)
 
     def inner(self, X, G, H):
+        if not isinstance(G, np.ndarray):
+            return float(G.reshape(-1).dot(H.reshape(-1)))
         return float(np.tensordot(G, H, axes=G.ndim))
 
     def norm(self, X, G):
+        if not isinstance(G, np.ndarray):
+            return float(G.norm())
         return la.norm(G)
 
     def dist(self, X, Y):
-        return la.norm(X - Y)
+        return self.norm(None, X - Y)
 
     def proj(self, X, U):
         return U
@@ -39,12 +45,14 @@ class _Euclidean(EuclideanEmbeddedSubmanifold):
     def log(self, X, Y):
         return Y - X
 
-    def rand(self):
-        return rnd.randn(*self._shape)
+    def rand(self, n=None):
+        return self._randn(self._shape, n)
 
-    def randvec(self, X):
-        Y = self.rand()
-        return Y / self.norm(X, Y)
+    def randvec(self, X, n=None):
+        U = self._normalize_samples(self.rand(n), n)
+        if not isinstance(X, np.ndarray):
+            return X.new_tensor(U)
+        return U
 
     def transp(self, X1, X2, G):
         return G
@@ -53,7 +61,9 @@ class _Euclidean(EuclideanEmbeddedSubmanifold):
         return (X + Y) / 2
 
     def zerovec(self, X):
-        return np.zeros(self._shape)
+        if not isinstance(X, np.ndarray):
+            return X.new_zeros(self._shape)
+        return np.zeros(self._shape, dtype=self.dtype)
 
 
 class Euclidean(_Euclidean):
@@ -70,6 +80,8 @@ class Euclidean(_Euclidean):
     manifold = Euclidean(m, n)
     """
 
+    supports_tensors = True
+
     def __init__(self, *shape):
         if len(shape) == 0:
             raise TypeError("Need shape parameters")
@@ -82,6 +94,9 @@ class Euclidean(_Euclidean):
         dimension = np.prod(shape)
         super().__init__(name, dimension, *shape)
 
+    def _power(self, k):
+        return Euclidean(k, *self._shape)
+
 
 class Symmetric(_Euclidean):
     """
@@ -105,18 +120,22 @@ class Symmetric(_Euclidean):
         dimension = int(k * n * (n + 1) / 2)
         super().__init__(name, dimension, *shape)
 
+    def _power(self, k):
+        if len(self._shape) == 2:
+            return Symmetric(self._shape[0], k)
+        return None
+
     def proj(self, X, U):
         return multisym(U)
 
     def ehess2rhess(self, X, egrad, ehess, H):
         return multisym(ehess)
 
-    def rand(self):
-        return multisym(rnd.randn(*self._shape))
+    def rand(self, n=None):
+        return multisym(self._randn(self._shape, n))
 
-    def randvec(self, X):
-        Y = self.rand()
-        return multisym(Y / self.norm(X, Y))
+    def randvec(self, X, n=None):
+        return self._normalize_samples(self.rand(n), n)
 
 
 class SkewSymmetric(_Euclidean):
@@ -141,15 +160,19 @@ class SkewSymmetric(_Euclidean):
         dimension = int(k * n * (n - 1) / 2)
         super().__init__(name, dimension, *shape)
 
+    def _power(self, k):
+        if len(self._shape) == 2:
+            return SkewSymmetric(self._shape[0], k)
+        return None
+
     def proj(self, X, U):
         return multiskew(U)
 
     def ehess2rhess(self, X, egrad, ehess, H):
         return multiskew(ehess)
 
-    def rand(self):
-        return multiskew(rnd.randn(*self._shape))
+    def rand(self, n=None):
+        return multiskew(self._randn(self._shape, n))
 
-    def randvec(self, X):
-        G = self.rand()
-        return multiskew(G / self.norm(X, G))
+    def randvec(self, X, n=None):
+        return self._normalize_samples(self.rand(n), n)
@@ -3,17 +3,15 @@ Module containing manifolds of fixed rank matrices.
 """
 
 import numpy as np
+import scipy.sparse
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
-from pymanopt.manifolds.stiefel import Stiefel
 from pymanopt.tools import ndarraySequenceMixin
+from pymanopt.tools.multi import multiprod, multiqr, multitransp
 
 
 class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
     """
-    Note: Currently not compatible with the second order TrustRegions solver.
-    Should be fixed soon.
-
     Manifold of m-by-n real matrices of fixed rank k. This follows the
     embedded geometry described in Bart Vandereycken's 2013 paper:
     "Low-rank matrix completion by Riemannian optimization".
@@ -59,7 +57,10 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
     these are low-rank, they may also be represented as structures with
     U, S, V fields, such that Z = U*S*V'. There are no restrictions on what
     U, S and V are, as long as their product as indicated yields a real, mxn
-    matrix.
+    matrix. For problems such as matrix completion where the Euclidean
+    gradient is supported on a small set of observed entries, ambient
+    vectors may also be given as scipy.sparse matrices or as
+    SparsePlusLowRank objects, which never form the dense mxn matrix.
 
     The chosen geometry yields a Riemannian submanifold of the embedding
     space R^(mxn) equipped with the usual trace (Frobenius) inner product.
@@ -89,8 +90,6 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         self._m = m
         self._n = n
         self._k = k
-        self._stiefel_m = Stiefel(m, k)
-        self._stiefel_n = Stiefel(n, k)
 
         name = ("Manifold of {m}-by-{n} matrices with rank {k} and embedded "
                 "geometry".format(m=m, n=n, k=k))
@@ -115,6 +114,8 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         """
         if isinstance(Z, tuple):
             return np.dot(Z[0], np.dot(Z[1], np.dot(Z[2].T, W)))
+        elif isinstance(Z, SparsePlusLowRank) or scipy.sparse.issparse(Z):
+            return Z.dot(W)
         else:
             return np.dot(Z, W)
 
@@ -124,14 +125,17 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         """
         if isinstance(Z, tuple):
             return np.dot(Z[2], np.dot(Z[1], np.dot(Z[0].T, W)))
+        elif isinstance(Z, SparsePlusLowRank) or scipy.sparse.issparse(Z):
+            return Z.T.dot(W)
         else:
             return np.dot(Z.T, W)
 
     def proj(self, X, Z):
         """
-        Note that Z must either be an m x n matrix from the ambient space, or
-        else a tuple (Uz, Sz, Vz), where Uz * Sz * Vz is in the ambient space
-        (of low-rank matrices).
+        Note that Z must either be an m x n matrix from the ambient space
+        (dense or scipy.sparse), a SparsePlusLowRank object, or else a tuple
+        (Uz, Sz, Vz), where Uz * Sz * Vz is in the ambient space (of low-rank
+        matrices).
 
         This function then returns a tangent vector parameterized as
         (Up, M, Vp), as described in the class docstring.
@@ -156,7 +160,14 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         This function correctly maps a gradient of this form into the tangent
         space. See https://j-towns.github.io/papers/svd-derivative.pdf for a
         derivation.
+
+        Alternatively, egrad may be the gradient with respect to the m x n
+        matrix X itself, given as any non-tuple ambient vector accepted by
+        proj (e.g. a sparse matrix or a SparsePlusLowRank object), in which
+        case it is simply projected onto the tangent space.
         """
+        if not isinstance(egrad, (tuple, list)):
+            return self.proj(x, egrad)
         utdu = np.dot(x[0].T, egrad[0])
         uutdu = np.dot(x[0], utdu)
         Up = (egrad[0] - uutdu) / x[1]
@@ -165,7 +176,7 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         vvtdv = np.dot(x[2].T, vtdv)
         Vp = (egrad[2].T - vvtdv) / x[1]
 
-        i = np.eye(self._k)
+        i = np.eye(self._k, dtype=x[1].dtype)
         f = 1 / (x[1][np.newaxis, :]**2 - x[1][:, np.newaxis]**2 + i)
 
         M = (f * (utdu - utdu.T) * x[1] +
@@ -173,19 +184,102 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
 
         return _FixedRankTangentVector((Up, M, Vp))
 
-    # TODO(nkoep): Implement the 'weingarten' method to support the
-    # trust-region solver, cf.
-    # https://sites.uclouvain.be/absil/2013-01/Weingarten_07PA_techrep.pdf
+    def weingarten(self, X, U, V):
+        """
+        Evaluates the Weingarten map at X of the tangent vector U, given in
+        the (Up, M, Vp) format, and the normal vector V, given in any of the
+        ambient formats accepted by proj, cf.
+        https://sites.uclouvain.be/absil/2013-01/Weingarten_07PA_techrep.pdf
+
+        Since U.Up and U.Vp are orthogonal to X.U and X.V, only the normal
+        component of V contributes to the result. V may therefore also be an
+        arbitrary ambient vector such as the Euclidean gradient itself, in
+        which case its normal component is taken implicitly.
+        """
+        T = self._apply_ambient(V, U[2]) / X[1]
+        Up = T - np.dot(X[0], np.dot(X[0].T, T))
+        T = self._apply_ambient_transpose(V, U[0]) / X[1]
+        Vp = T - np.dot(X[2].T, np.dot(X[2], T))
+        return _FixedRankTangentVector(
+            (Up, np.zeros((self._k, self._k), dtype=Up.dtype), Vp))
+
+    def tangent2factors(self, X, Z):
+        """
+        Returns the direction (dU, dS, dVt) in which the factors (U, S, Vt)
+        of X change along a curve through X with velocity Z, given in the
+        (Up, M, Vp) format. With K the off-diagonal part of M times S^-1,
+        this is (Up S^-1 + U K, diag(M), S^-1 Vp').
+        """
+        U, S, Vt = X
+        Up, M, Vp = Z
+        dS = np.diag(M).copy()
+        K = (M - np.diag(dS)) / S
+        return (Up / S + np.dot(U, K), dS, (Vp / S).T)
+
+    def ehess2rhess(self, X, egrad, ehess, H):
+        """
+        Converts the Euclidean gradient egrad and Hessian-vector product
+        ehess along the tangent vector H to the Riemannian Hessian along H.
+
+        egrad and ehess may be ambient vectors in one of the formats accepted
+        by proj, e.g. sparse matrices or SparsePlusLowRank objects for matrix
+        completion problems, so that no m x n matrix is formed.
+
+        Alternatively, as computed by the autodiff backends for a cost
+        defined in terms of the factors (U, S, Vt) of X, egrad may be the
+        tuple of derivatives with respect to the factors, in which case
+        ehess must be the tuple of directional derivatives of egrad along
+        the direction tangent2factors(X, H). Although the factored gradient
+        does not determine the Euclidean gradient, it determines the
+        products of the Euclidean gradient with U and V which the
+        curvature terms reduce to.
+        """
+        factored = [isinstance(z, (tuple, list)) and np.ndim(z[1]) == 1
+                    for z in (egrad, ehess)]
+        if factored[0] != factored[1]:
+            raise ValueError(
+                "The Riemannian Hessian on '{:s}' requires the Euclidean "
+                "gradient and Hessian-vector product to be given either both "
+                "with respect to the m x n matrix or both with respect to its "
+                "SVD factors".format(self._get_class_name()))
+        if not factored[0]:
+            return self.proj(X, ehess) + self.weingarten(X, H, egrad)
+
+        U, S, Vt = X
+        V = Vt.T
+        gU, _, gVt = egrad
+        hU, _, hVt = ehess
+        dS = np.diag(H[1])
+        K = (H[1] - np.diag(dS)) / S
+        # The products of the Euclidean gradient with U and V.
+        GV = gU / S
+        GtU = gVt.T / S
+
+        T = (hU - GV * dS) / S
+        M = U.T.dot(T) - np.dot(GtU.T, H[2]) / S
+        Up = T - U.dot(U.T.dot(T))
+        T = (hVt.T - GtU * dS) / S - GtU.dot(K)
+        Vp = T - V.dot(V.T.dot(T))
+        return _FixedRankTangentVector((Up, M, Vp))
 
     # This retraction is second order, following general results from
     # Absil, Malick, "Projection-like retractions on matrix manifolds",
     # SIAM J. Optim., 22 (2012), pp. 135-158.
     def retr(self, X, Z):
+        Y, _, _ = self._retr(X, Z)
+        return Y
+
+    def _retr(self, X, Z):
+        """
+        Computes the retraction Y of Z at X and returns it together with the
+        leading blocks of the singular vectors computed along the way, which
+        are the matrices X.U'*Y.U and X.V'*Y.V.
+        """
         Qu, Ru = np.linalg.qr(Z[0])
         Qv, Rv = np.linalg.qr(Z[2])
 
         T = np.vstack((np.hstack((np.diag(X[1]) + Z[1], Rv.T)),
-                      np.hstack((Ru, np.zeros((self._k, self._k))))))
+                      np.hstack((Ru, np.zeros_like(Rv)))))
 
         # Numpy svd outputs St as a 1d vector, not a matrix.
         Ut, St, Vt = np.linalg.svd(T, full_matrices=False)
@@ -196,16 +290,33 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         U = np.dot(np.hstack((X[0], Qu)), Ut[:, :self._k])
         V = np.dot(np.hstack((X[2].T, Qv)), Vt[:, :self._k])
         S = St[:self._k] + np.spacing(1)
-        return (U, S, V.T)
+        return (U, S, V.T), Ut[:self._k, :self._k], Vt[:self._k, :self._k]
+
+    def retr_transp(self, X, U, vectors):
+        # The products X.U'*Y.U and X.V'*Y.V are by-products of the
+        # retraction, so that the transports avoid the m-by-2k ambient
+        # factorization of the generic transport.
+        Y, UtUnew, VtVnew = self._retr(X, U)
+        return Y, [self._transp_retracted(X, Y, G, UtUnew, VtVnew)
+                   for G in vectors]
 
     def norm(self, X, G):
         return np.sqrt(self.inner(X, G, G))
 
-    def rand(self):
-        u = self._stiefel_m.rand()
-        s = np.sort(np.random.rand(self._k))[::-1]
-        vt = self._stiefel_n.rand().T
-        return (u, s, vt)
+    def partial_entries(self, X, rows, cols):
+        """
+        Returns the entries of the m x n matrix represented by the point X at
+        the positions (rows[i], cols[i]) without forming the matrix, e.g., to
+        evaluate the residual of a matrix completion problem on the observed
+        entries only.
+        """
+        return partial_product(X[0] * X[1], X[2].T, rows, cols)
+
+    def rand(self, n=None):
+        u, _ = multiqr(self._randn((self._m, self._k), n))
+        s = np.sort(self._randu((self._k,), n), axis=-1)[..., ::-1]
+        v, _ = multiqr(self._randn((self._n, self._k), n))
+        return (u, s, multitransp(v))
 
     def _tangent(self, X, Z):
         """
@@ -214,19 +325,23 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         errors. If Z was indeed a tangent vector at X, this should barely
         affect Z (it would not at all if we had infinite numerical accuracy).
         """
-        Up = Z[0] - np.dot(X[0], np.dot(X[0].T, Z[0]))
-        Vp = Z[2] - np.dot(X[2].T, np.dot(X[2], Z[2]))
+        Up = Z[0] - multiprod(X[0], multiprod(X[0].T, Z[0]))
+        Vp = Z[2] - multiprod(X[2].T, multiprod(X[2], Z[2]))
 
         return _FixedRankTangentVector((Up, Z[1], Vp))
 
-    def randvec(self, X):
-        Up = np.random.randn(self._m, self._k)
-        Vp = np.random.randn(self._n, self._k)
-        M = np.random.randn(self._k, self._k)
+    def randvec(self, X, n=None):
+        Up = self._randn((self._m, self._k), n)
+        Vp = self._randn((self._n, self._k), n)
+        M = self._randn((self._k, self._k), n)
 
         Z = self._tangent(X, (Up, M, Vp))
 
-        nrm = self.norm(X, Z)
+        if n is None:
+            nrm = self.norm(X, Z)
+        else:
+            nrm = np.sqrt(sum([np.sum(np.reshape(C, (n, -1)) ** 2, axis=1)
+                               for C in Z]))[:, np.newaxis, np.newaxis]
 
         return _FixedRankTangentVector((Z[0]/nrm, Z[1]/nrm, Z[2]/nrm))
 
@@ -244,7 +359,7 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
         (In this implementation, S is identity, but this might change.)
         """
         U = np.hstack((np.dot(X[0], Z[1]) + Z[0], X[0]))
-        S = np.eye(2 * self._k)
+        S = np.eye(2 * self._k, dtype=U.dtype)
         V = np.hstack(([X[2].T, Z[2]]))
         return (U, S, V)
 
@@ -257,10 +372,92 @@ class FixedRankEmbedded(EuclideanEmbeddedSubmanifold):
     def transp(self, X1, X2, G):
         return self.proj(X2, self.tangent2ambient(X1, G))
 
+    def _transp_retracted(self, X1, X2, G, UtUnew, VtVnew):
+        """
+        Computes the same transport as transp if X2 was obtained by
+        retracting a tangent vector at X1, given the products UtUnew =
+        X1.U'*X2.U and VtVnew = X1.V'*X2.V returned by _retr.
+        """
+        U1, V1 = X1[0], X1[2].T
+        U2, V2 = X2[0], X2[2].T
+        Up, M, Vp = G
+
+        UptU2 = np.dot(Up.T, U2)
+        VptV2 = np.dot(Vp.T, V2)
+        ZV = np.dot(U1, np.dot(M, VtVnew) + VptV2) + np.dot(Up, VtVnew)
+        ZtU = np.dot(V1, np.dot(M.T, UtUnew) + UptU2) + np.dot(Vp, UtUnew)
+        UtZV = (np.dot(UtUnew.T, np.dot(M, VtVnew) + VptV2) +
+                np.dot(UptU2.T, VtVnew))
+
+        Up = ZV - np.dot(U2, UtZV)
+        Vp = ZtU - np.dot(V2, UtZV.T)
+        return _FixedRankTangentVector((Up, UtZV, Vp))
+
+    def lincomb(self, X, a, U, b=None, V=None, out=None):
+        return _FixedRankTangentVector(
+            [super(FixedRankEmbedded, self).lincomb(
+                X, a, U[k], b, None if V is None else V[k],
+                out=None if out is None else out[k])
+             for k in range(3)])
+
     def zerovec(self, X):
-        return _FixedRankTangentVector((np.zeros((self._m, self._k)),
-                                        np.zeros((self._k, self._k)),
-                                        np.zeros((self._n, self._k))))
+        return _FixedRankTangentVector(
+            (np.zeros((self._m, self._k), dtype=self.dtype),
+             np.zeros((self._k, self._k), dtype=self.dtype),
+             np.zeros((self._n, self._k), dtype=self.dtype)))
+
+
+class SparsePlusLowRank:
+    """
+    Ambient vector Z = A + U*S*V' given by the sum of an m x n sparse matrix
+    A and an optional low-rank matrix in the (U, S, V) format described in
+    the docstring of FixedRankEmbedded, e.g., as returned by tangent2ambient.
+    The sparse part may be any scipy.sparse matrix and is converted to CSR
+    format unless it is in CSR or CSC format already. Only products of Z and
+    Z' with thin matrices are ever computed, so the memory footprint scales
+    with the number of nonzeros in A rather than with m * n.
+    """
+
+    def __init__(self, sparse, low_rank=None):
+        if sparse.format not in ("csr", "csc"):
+            sparse = sparse.tocsr()
+        self.sparse = sparse
+        self.low_rank = low_rank
+
+    @property
+    def shape(self):
+        return self.sparse.shape
+
+    @property
+    def T(self):
+        low_rank = self.low_rank
+        if low_rank is not None:
+            low_rank = (low_rank[2], low_rank[1].T, low_rank[0])
+        return SparsePlusLowRank(self.sparse.T, low_rank)
+
+    def dot(self, W):
+        ZW = self.sparse.dot(W)
+        if self.low_rank is not None:
+            U, S, V = self.low_rank
+            ZW = ZW + np.dot(U, np.dot(S, np.dot(V.T, W)))
+        return ZW
+
+
+def partial_product(U, V, rows, cols, chunk_size=2**16):
+    """
+    Computes the entries of the matrix U*V' at the positions
+    (rows[i], cols[i]) without forming U*V'. The entries are evaluated in
+    vectorized chunks of chunk_size positions to bound the size of the
+    temporary arrays.
+    """
+    rows = np.asarray(rows)
+    cols = np.asarray(cols)
+    entries = np.empty(len(rows), dtype=np.result_type(U, V))
+    for start in range(0, len(rows), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        np.einsum("ij,ij->i", U[rows[chunk]], V[cols[chunk]],
+                  out=entries[chunk])
+    return entries
 
 
 class _FixedRankTangentVector(tuple, ndarraySequenceMixin):
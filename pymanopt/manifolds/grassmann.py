@@ -2,7 +2,7 @@ import numpy as np
 from numpy.linalg import svd
 
 from pymanopt.manifolds.manifold import Manifold
-from pymanopt.tools.multi import multiprod, multitransp
+from pymanopt.tools.multi import multiprod, multiqr, multitransp
 
 
 class Grassmann(Manifold):
@@ -14,8 +14,16 @@ class Grassmann(Manifold):
 
     Elements are represented as n x p matrices (if k == 1), and as k x n x p
     matrices if k > 1 (Note that this is different to manopt!).
+
+    The optional argument retraction selects the retraction. The default
+    "polar" retraction is compatible with the vector transport (see below),
+    while the "qr" retraction based on the Q-factor of X + G is cheaper and
+    may be preferable if the retraction is a bottleneck and no vector
+    transports are used.
     """
 
+    _euclidean_metric = True
+
     #   I have chaned the retraction to one using the polar decomp as am now
     #   implementing vector transport. See comment below (JT)
 
@@ -31,11 +39,17 @@ class Grassmann(Manifold):
     #       bottleneck in your application and you are not using vector
     #       transports, you may want to replace the retraction with a qfactor.
 
-    def __init__(self, n, p, k=1):
+    def __init__(self, n, p, k=1, retraction="polar"):
         self._n = n
         self._p = p
         self._k = k
 
+        if retraction not in ("polar", "qr"):
+            raise ValueError(
+                "Invalid retraction '{}'. Supported retractions are 'polar' "
+                "and 'qr'.".format(retraction))
+        self._retraction = retraction
+
         if n < p or p < 1:
             raise ValueError("Need n >= p >= 1. Values supplied were n = %d "
                              "and p = %d." % (n, p))
@@ -50,16 +64,27 @@ class Grassmann(Manifold):
         dimension = int(k * (n * p - p ** 2))
         super().__init__(name, dimension)
 
+    def _power(self, k):
+        if self._k == 1:
+            return Grassmann(self._n, self._p, k,
+                             retraction=self._retraction)
+        return None
+
     @property
     def typicaldist(self):
         return np.sqrt(self._p * self._k)
 
     # Geodesic distance for Grassmann
     def dist(self, X, Y):
-        u, s, v = svd(multiprod(multitransp(X), Y))
-        s[s > 1] = 1
-        s = np.arccos(s)
-        return np.linalg.norm(s)
+        return np.linalg.norm(self.multidist(X, Y))
+
+    def multidist(self, X, Y):
+        """Returns the geodesic distances between the k pairs of subspaces
+        X[i] and Y[i] as an array of length k (or a scalar if k == 1).
+        """
+        s = svd(multiprod(multitransp(X), Y), compute_uv=False)
+        np.minimum(s, 1, out=s)
+        return np.linalg.norm(np.arccos(s), axis=-1)
 
     def inner(self, X, G, H):
         # Inner product (Riemannian metric) on the tangent space
@@ -78,13 +103,21 @@ class Grassmann(Manifold):
         HXtG = multiprod(H, XtG)
         return PXehess - HXtG
 
-    def retr(self, X, G):
-        # Calculate 'thin' qr decomposition of X + G
-        # XNew, r = np.linalg.qr(X + G)
+    def traced_egrad2rgrad(self, X, G):
+        return G - X @ (X.swapaxes(-2, -1) @ G)
 
+    def traced_ehess2rhess(self, X, G, H, U):
+        return (self.traced_egrad2rgrad(X, H) -
+                U @ (X.swapaxes(-2, -1) @ G))
+
+    def retr(self, X, G):
         # We do not need to worry about flipping signs of columns here,
         # since only the column space is important, not the actual
         # columns. Compare this with the Stiefel manifold.
+        if self._retraction == "qr":
+            # Calculate 'thin' qr decomposition of X + G
+            q, _ = multiqr(X + G)
+            return q
 
         # Compute the polar factorization of Y = X+G
         u, s, vt = svd(X + G, full_matrices=False)
@@ -96,26 +129,29 @@ class Grassmann(Manifold):
 
     # Generate random Grassmann point using qr of random normally distributed
     # matrix.
-    def rand(self):
+    def rand(self, n=None):
         if self._k == 1:
-            X = np.random.randn(self._n, self._p)
-            q, r = np.linalg.qr(X)
-            return q
-
-        X = np.zeros((self._k, self._n, self._p))
-        for i in range(self._k):
-            X[i], r = np.linalg.qr(np.random.randn(self._n, self._p))
-        return X
+            X = self._randn((self._n, self._p), n)
+        else:
+            X = self._randn((self._k, self._n, self._p), n)
+        q, r = multiqr(X)
+        return q
 
-    def randvec(self, X):
-        U = np.random.randn(*np.shape(X))
-        U = self.proj(X, U)
-        U = U / np.linalg.norm(U)
-        return U
+    def randvec(self, X, n=None):
+        U = self.proj(X, self._randn(np.shape(X), n))
+        return self._normalize_samples(U, n)
 
     def transp(self, x1, x2, d):
         return self.proj(x2, d)
 
+    def retr_transp(self, X, U, vectors):
+        Y = self.retr(X, U)
+        if not vectors:
+            return Y, []
+        # Project all vectors at once by stacking them horizontally.
+        V = np.concatenate(vectors, axis=-1)
+        return Y, np.split(self.proj(Y, V), len(vectors), axis=-1)
+
     def exp(self, X, U):
         u, s, vt = svd(U, full_matrices=False)
         cos_s = np.expand_dims(np.cos(s), -2)
@@ -126,25 +162,21 @@ class Grassmann(Manifold):
 
         # From numerical experiments, it seems necessary to
         # re-orthonormalize. This is overall quite expensive.
-        if self._k == 1:
-            Y, unused = np.linalg.qr(Y)
-            return Y
-        else:
-            for i in range(self._k):
-                Y[i], unused = np.linalg.qr(Y[i])
-            return Y
+        Y, unused = multiqr(Y)
+        return Y
 
     def log(self, X, Y):
         ytx = multiprod(multitransp(Y), X)
         At = multitransp(Y) - multiprod(ytx, multitransp(X))
         Bt = np.linalg.solve(ytx, At)
-        u, s, vt = svd(multitransp(Bt), full_matrices=False)
+        # Decompose the wide p x n matrix Bt rather than its transpose. If
+        # Bt = u * s * vt, the left and right singular vectors of B = Bt' are
+        # given by vt' and u', respectively.
+        u, s, vt = svd(Bt, full_matrices=False)
         arctan_s = np.expand_dims(np.arctan(s), -2)
-
-        U = multiprod(u * arctan_s, vt)
-        return U
+        return multiprod(multitransp(vt) * arctan_s, multitransp(u))
 
     def zerovec(self, X):
         if self._k == 1:
-            return np.zeros((self._n, self._p))
-        return np.zeros((self._k, self._n, self._p))
+            return np.zeros((self._n, self._p), dtype=self.dtype)
+        return np.zeros((self._k, self._n, self._p), dtype=self.dtype)
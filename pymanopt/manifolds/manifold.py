@@ -2,6 +2,7 @@ import abc
 import functools
 
 import numpy as np
+from scipy.linalg.blas import get_blas_funcs
 
 
 class Manifold(metaclass=abc.ABCMeta):
@@ -25,6 +26,15 @@ class Manifold(metaclass=abc.ABCMeta):
     methods in this class have equivalents in Manopt with the same name).
     """
 
+    # Subclasses whose Riemannian metric is the Euclidean inner product of the
+    # real arrays representing tangent vectors set this to True. Composite
+    # manifolds such as the product manifold use it to fuse inner products.
+    _euclidean_metric = False
+
+    _random_generator = None
+
+    _dtype = np.dtype(np.float64)
+
     def __init__(self, name, dimension):
         assert isinstance(dimension, (int, np.integer)), \
                 "dimension must be an integer"
@@ -81,19 +91,159 @@ class Manifold(metaclass=abc.ABCMeta):
         """
 
     @abc.abstractmethod
-    def rand(self):
-        """Returns a random point on the manifold."""
+    def rand(self, n=None):
+        """Returns a random point on the manifold. If `n` is given, `n`
+        independent random points are returned stacked along a new leading
+        axis (componentwise for points represented by sequences of arrays).
+        Samples are drawn from :py:attr:`random_generator`.
+        """
 
     @abc.abstractmethod
-    def randvec(self, X):
+    def randvec(self, X, n=None):
         """Returns a random vector in the tangent space at `X`. This does not
-        follow a specific distribution.
+        follow a specific distribution. If `n` is given, `n` independent
+        random tangent vectors at `X` are returned stacked along a new leading
+        axis as in :py:func:`rand`.
         """
 
     @abc.abstractmethod
     def zerovec(self, X):
         """Returns the zero vector in the tangent space at X."""
 
+    # Floating point precision
+
+    @property
+    def dtype(self):
+        """The real floating point type of the arrays representing points and
+        tangent vectors on the manifold, either float32 or float64. Manifolds
+        of complex-valued arrays use the complex type of the same precision.
+        Arrays allocated by the manifold, such as random samples and zero
+        vectors, are of this type, and all operations preserve the precision
+        of their arguments. Defaults to float64.
+        """
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype):
+        dtype = np.dtype(dtype)
+        # Other floating point types such as float16 and longdouble are not
+        # supported by the linear algebra routines of numpy and scipy.
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(
+                "dtype must be float32 or float64, got '{}'".format(dtype))
+        self._dtype = dtype
+
+    # Random sampling
+
+    @property
+    def random_generator(self):
+        """The source of randomness used by :py:func:`rand` and
+        :py:func:`randvec`. Unless set otherwise, this is the global random
+        state of the `numpy.random` module. It can be set to a
+        `numpy.random.Generator` (or a legacy `numpy.random.RandomState`), or
+        to an integer seed to create a new generator. Setting it to None
+        restores the global random state.
+        """
+        if self._random_generator is None:
+            return np.random
+        return self._random_generator
+
+    @random_generator.setter
+    def random_generator(self, generator):
+        if isinstance(generator, (int, np.integer)):
+            generator = np.random.default_rng(generator)
+        self._random_generator = generator
+
+    def _randn(self, shape, n=None):
+        """Draws an array of the given shape with standard normally
+        distributed entries, with an additional leading axis of size `n` if
+        `n` is not None.
+        """
+        if n is not None:
+            shape = (n,) + tuple(shape)
+        generator = self.random_generator
+        if isinstance(generator, np.random.Generator):
+            return generator.standard_normal(shape, dtype=self.dtype)
+        return generator.standard_normal(shape).astype(self.dtype, copy=False)
+
+    def _randu(self, shape, n=None):
+        """Same as :py:func:`_randn` but with entries drawn uniformly from the
+        half-open interval [0, 1).
+        """
+        if n is not None:
+            shape = (n,) + tuple(shape)
+        generator = self.random_generator
+        if isinstance(generator, np.random.Generator):
+            return generator.random(shape, dtype=self.dtype)
+        return generator.random(shape).astype(self.dtype, copy=False)
+
+    @staticmethod
+    def _normalize_samples(U, n=None):
+        """Scales `U` to unit Frobenius norm, or each of the `n` arrays stacked
+        along the leading axis of `U` separately if `n` is not None.
+        """
+        if n is None:
+            return U / np.linalg.norm(U)
+        norms = np.linalg.norm(np.reshape(U, (n, -1)), axis=1)
+        return U / norms.reshape((n,) + (1,) * (np.ndim(U) - 1))
+
+    def _power(self, k):
+        """Returns an instance of the manifold class that represents the
+        `k`-fold power of the manifold with points and tangent vectors
+        stacked along a new leading axis, or None if the class does not
+        support this. This is used by the power manifold to dispatch to
+        batched implementations.
+        """
+        return None
+
+    # Tangent vector algebra used in the inner loops of solvers
+
+    def lincomb(self, X, a, U, b=None, V=None, out=None):
+        """Returns the linear combination `a * U + b * V` of two tangent
+        vectors `U` and `V` at `X`. If `V` is omitted, `a * U` is returned.
+
+        If the tangent vectors are numpy arrays, the result is written to the
+        array `out` (which may be `U` or `V`) if provided and of a type which
+        can hold the result, and otherwise to a single newly allocated array.
+        Subclasses with other tangent vector representations may ignore
+        `out`, so callers must always use the return value.
+        """
+        if b is None:
+            b = 1
+        if not isinstance(U, np.ndarray) or (
+                V is not None and not isinstance(V, np.ndarray)):
+            if V is None:
+                return a * U
+            return a * U + b * V
+        if V is U:
+            # Combining a vector with itself is a single scaling, which also
+            # keeps `out` from being overwritten while it is still read as
+            # both operands.
+            a, V = a + b, None
+        if V is None:
+            dtype = np.result_type(a, U)
+        else:
+            dtype = np.result_type(a, U, b, V)
+        # Arrays `out` which cannot hold the result without a loss of
+        # precision are not written to.
+        if (not isinstance(out, np.ndarray) or out.shape != U.shape or
+                not np.can_cast(dtype, out.dtype, casting="safe")):
+            out = np.multiply(a, U)
+        elif V is not None and out is V and out is not U:
+            out *= b
+            return _axpy(a, U, out)
+        elif out is not U or a != 1:
+            np.multiply(U, a, out=out)
+        if V is None:
+            return out
+        return _axpy(b, V, out)
+
+    def axpy(self, X, a, U, V):
+        """Returns `a * U + V` for two tangent vectors `U` and `V` at `X`,
+        overwriting `V` where the tangent vector representation allows it.
+        """
+        return self.lincomb(X, 1, V, a, U, out=V)
+
     # Methods which are only required by certain solvers
 
     def _raise_not_implemented_error(method):
@@ -122,6 +272,34 @@ class Manifold(metaclass=abc.ABCMeta):
         along `U` on the manifold.
         """
 
+    # Versions of egrad2rgrad and ehess2rhess which the tracing autodiff
+    # backends can evaluate on their own array types, so that the
+    # conversions become part of the compiled gradient and Hessian (see the
+    # `fuse_conversions` argument of Problem). Manifolds whose conversions
+    # only require the operators +, -, *, / and @ and the array methods sum
+    # and swapaxes, which numpy arrays share with the arrays of the
+    # backends, define them as methods with the same signatures as
+    # egrad2rgrad and ehess2rhess.
+    traced_egrad2rgrad = None
+    traced_ehess2rhess = None
+
+    # Manifolds which represent points by factors of a matrix, such as the
+    # SVD factors of a fixed-rank matrix, define a method
+    # tangent2factors(X, U) returning the direction in which the factors
+    # change along a curve through X with velocity U. The autodiff backends
+    # differentiate costs with respect to the factors, so their
+    # Hessian-vector products are evaluated along this direction, and
+    # ehess2rhess receives the factored derivatives.
+    tangent2factors = None
+
+    # Manifolds whose methods used by the gradient-based solvers, i.e., inner,
+    # norm, proj, egrad2rgrad, ehess2rhess, retr, transp, randvec, zerovec
+    # and lincomb, also accept torch tensors in place of numpy arrays and then
+    # return tensors, set this to True. Problems on such manifolds can keep
+    # the iterates of a solver as tensors for the whole solve (see the
+    # `persistent_tensors` argument of Problem).
+    supports_tensors = False
+
     @_raise_not_implemented_error
     def retr(self, X, G):
         """Computes a retraction mapping a vector `G` in the tangent space at
@@ -146,6 +324,16 @@ class Manifold(metaclass=abc.ABCMeta):
         tangent space at `X1` to the tangent space at `X2`.
         """
 
+    def retr_transp(self, X, U, vectors):
+        """Computes the retraction `Y` of a tangent vector `U` at `X` and
+        transports the tangent vectors in the sequence `vectors` from the
+        tangent space at `X` to the tangent space at `Y`. Returns `Y` and a
+        list of the transported vectors. Subclasses may override this to
+        share work between the retraction and the transports.
+        """
+        Y = self.retr(X, U)
+        return Y, [self.transp(X, Y, vector) for vector in vectors]
+
     @_raise_not_implemented_error
     def pairmean(self, X, Y):
         """Returns the intrinsic mean of two points `X` and `Y` on the
@@ -154,6 +342,23 @@ class Manifold(metaclass=abc.ABCMeta):
         """
 
 
+def _axpy(a, x, y):
+    """Computes `y + a * x` in place in `y` and returns the result. Contiguous
+    arrays of matching floating point type are handed to the BLAS routine
+    directly to avoid the temporary array for `a * x`.
+    """
+    if (x.dtype == y.dtype and y.dtype.char in "fdFD" and
+            x.flags.c_contiguous and y.flags.c_contiguous and
+            (np.iscomplexobj(y) or not np.iscomplexobj(a))):
+        axpy = get_blas_funcs("axpy", (y,))
+        axpy(x.reshape(-1), y.reshape(-1), a=a)
+        return y
+    if np.can_cast(np.result_type(a, x, y), y.dtype, casting="same_kind"):
+        y += a * x
+        return y
+    return y + a * x
+
+
 class EuclideanEmbeddedSubmanifold(Manifold, metaclass=abc.ABCMeta):
     """A class to model embedded submanifolds of a Euclidean space. It provides
     a generic way to project Euclidean gradients to their Riemannian
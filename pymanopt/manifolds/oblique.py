@@ -1,6 +1,5 @@
 import numpy as np
 import numpy.linalg as la
-import numpy.random as rnd
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
 
@@ -14,12 +13,23 @@ class Oblique(EuclideanEmbeddedSubmanifold):
     is such that the oblique manifold is a Riemannian submanifold of the
     space of m-by-n matrices with the usual trace inner product, i.e., the
     usual metric.
+
+    If rowwise is True, points are instead stored as n-by-m matrices with
+    unit-norm rows. For C-ordered arrays, the unit-norm vectors are then
+    contiguous in memory, which makes the reductions over them considerably
+    faster when m is large.
     """
 
-    def __init__(self, m, n):
+    _euclidean_metric = True
+
+    def __init__(self, m, n, rowwise=False):
         self._m = m
         self._n = n
-        name = "Oblique manifold OB({:d}, {:d})".format(m, n)
+        self._rowwise = rowwise
+        if rowwise:
+            name = "Oblique manifold OB({:d}, {:d}) (row-wise)".format(m, n)
+        else:
+            name = "Oblique manifold OB({:d}, {:d})".format(m, n)
         dimension = (m - 1) * n
         super().__init__(name, dimension)
 
@@ -27,6 +37,10 @@ class Oblique(EuclideanEmbeddedSubmanifold):
     def typicaldist(self):
         return np.pi * np.sqrt(self._n)
 
+    @property
+    def rowwise(self):
+        return self._rowwise
+
     def inner(self, X, U, V):
         return float(np.tensordot(U, V))
 
@@ -34,63 +48,83 @@ class Oblique(EuclideanEmbeddedSubmanifold):
         return la.norm(U)
 
     def dist(self, X, Y):
-        XY = (X * Y).sum(0)
-        XY[XY > 1] = 1
-        U = np.arccos(XY)
-        return la.norm(U)
+        XY = self._dots(X, Y)
+        np.minimum(XY, 1, out=XY)
+        return la.norm(np.arccos(XY, out=XY))
 
     def proj(self, X, H):
-        return H - X * ((X * H).sum(0)[np.newaxis, :])
+        PH = np.multiply(X, self._dots(X, H))
+        return np.subtract(H, PH, out=PH)
 
     def ehess2rhess(self, X, egrad, ehess, U):
-        PXehess = self.proj(X, ehess)
+        rhess = self.proj(X, ehess)
         # TODO(nkoep): Move the second summand to the 'weingarten' method
         #              instead.
-        return PXehess - U * ((X * egrad).sum(0)[np.newaxis, :])
+        UXegrad = np.multiply(U, self._dots(X, egrad))
+        return np.subtract(rhess, UXegrad, out=rhess)
 
     def exp(self, X, U):
-        norm_U = np.sqrt((U ** 2).sum(0))[np.newaxis, :]
-
-        Y = X * np.cos(norm_U) + U * (np.sin(norm_U) / norm_U)
+        norm_U = np.sqrt(self._dots(U, U))
+        # For those vectors where the step is too small, use a retraction.
+        small = norm_U <= 4.5e-8
 
-        # For those columns where the step is too small, use a retraction.
-        exclude = np.nonzero(norm_U <= 4.5e-8)[-1]
-        Y[:, exclude] = self._normalize_columns(X[:, exclude] + U[:, exclude])
+        factors = np.sin(norm_U)
+        np.divide(factors, norm_U, out=factors, where=~small)
+        Y = np.multiply(U, factors)
+        Y += X * np.cos(norm_U, out=norm_U)
 
+        if np.any(small):
+            Y = np.where(small, self.retr(X, U), Y)
         return Y
 
     def retr(self, X, U):
-        return self._normalize_columns(X + U)
+        return self._normalize(np.add(X, U))
 
     def log(self, X, Y):
         V = self.proj(X, Y - X)
-        dists = np.arccos((X * Y).sum(0))
-        norms = np.sqrt((V ** 2).sum(0)).real
+        dists = np.arccos(self._dots(X, Y))
+        norms = np.sqrt(self._dots(V, V))
         factors = dists / norms
         # For very close points, dists is almost equal to norms, but because
         # they are both almost zero, the division above can return NaN's. To
         # avoid that, we force those ratios to 1.
         factors[dists <= 1e-6] = 1
 
-        return V * factors
+        V *= factors
+        return V
 
-    def rand(self):
-        return self._normalize_columns(rnd.randn(self._m, self._n))
+    def rand(self, n=None):
+        return self._normalize(self._randn(self._shape, n))
 
-    def randvec(self, X):
-        H = rnd.randn(*X.shape)
-        P = self.proj(X, H)
-        return P / self.norm(X, P)
+    def randvec(self, X, n=None):
+        P = self.proj(X, self._randn(X.shape, n))
+        return self._normalize_samples(P, n)
 
     def transp(self, X, Y, U):
         return self.proj(Y, U)
 
     def pairmean(self, X, Y):
-        return self._normalize_columns(X + Y)
+        return self._normalize(np.add(X, Y))
 
     def zerovec(self, X):
-        return np.zeros((self._m, self._n))
+        return np.zeros(self._shape, dtype=self.dtype)
 
-    def _normalize_columns(self, X):
-        """Return an l2-column-normalized copy of the matrix X."""
-        return X / la.norm(X, axis=0)[np.newaxis, :]
+    @property
+    def _shape(self):
+        if self._rowwise:
+            return (self._n, self._m)
+        return (self._m, self._n)
+
+    def _dots(self, A, B):
+        """Return the inner products between the unit-norm vectors of A and B
+        without forming their elementwise product. The reduced axis is kept
+        so that the result broadcasts against A and B.
+        """
+        if self._rowwise:
+            return np.einsum("...i,...i->...", A, B)[..., np.newaxis]
+        return np.einsum("...ij,...ij->...j", A, B)[..., np.newaxis, :]
+
+    def _normalize(self, X):
+        """Normalize the unit-norm vectors of the matrix X in place."""
+        X /= np.sqrt(self._dots(X, X))
+        return X
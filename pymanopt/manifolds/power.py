@@ -0,0 +1,136 @@
+import numpy as np
+
+from pymanopt.manifolds.manifold import Manifold
+
+
+class PowerManifold(Manifold):
+    """Power manifold, i.e., the cartesian product of `k` copies of a manifold.
+
+    Points and tangent vectors are represented as numpy arrays of shape
+    `(k,) + shape`, where `shape` is the shape of points and tangent vectors
+    of the base manifold, i.e., the `i`-th element along the leading axis is
+    the `i`-th factor. This requires the base manifold to represent points
+    and tangent vectors as numpy arrays.
+
+    If the base manifold provides a batched implementation operating on
+    stacked arrays (e.g. `Stiefel(n, p)` for which `Stiefel(n, p, k)` is the
+    batched variant), all operations are dispatched to it. Otherwise, the
+    operations of the base manifold are applied to each factor in turn.
+
+    Examples:
+    Create the manifold of 10 points on the 2-sphere:
+    manifold = PowerManifold(Sphere(3), 10)
+    """
+
+    def __init__(self, manifold, k):
+        if k < 1:
+            raise ValueError("k must be an integer no less than 1")
+        self._manifold = manifold
+        self._k = k
+        self._batched = manifold._power(k) if k > 1 else None
+        name = "Power manifold ({:s})^{:d}".format(str(manifold), k)
+        dimension = int(k * manifold.dim)
+        super().__init__(name, dimension)
+        self._euclidean_metric = manifold._euclidean_metric
+
+    @property
+    def typicaldist(self):
+        return np.sqrt(self._k) * self._manifold.typicaldist
+
+    @Manifold.random_generator.setter
+    def random_generator(self, generator):
+        Manifold.random_generator.fset(self, generator)
+        self._manifold.random_generator = self._random_generator
+        if self._batched is not None:
+            self._batched.random_generator = self._random_generator
+
+    @Manifold.dtype.setter
+    def dtype(self, dtype):
+        Manifold.dtype.fset(self, dtype)
+        self._manifold.dtype = dtype
+        if self._batched is not None:
+            self._batched.dtype = dtype
+
+    def _stack(self, method, *args):
+        return np.stack([method(*[arg[i] for arg in args])
+                         for i in range(self._k)])
+
+    def inner(self, X, G, H):
+        if self._batched is not None:
+            return self._batched.inner(X, G, H)
+        return np.sum([self._manifold.inner(X[i], G[i], H[i])
+                       for i in range(self._k)])
+
+    def norm(self, X, G):
+        if self._batched is not None:
+            return self._batched.norm(X, G)
+        return np.sqrt(self.inner(X, G, G))
+
+    def dist(self, X, Y):
+        if self._batched is not None:
+            return self._batched.dist(X, Y)
+        return np.sqrt(np.sum([self._manifold.dist(X[i], Y[i]) ** 2
+                               for i in range(self._k)]))
+
+    def proj(self, X, U):
+        if self._batched is not None:
+            return self._batched.proj(X, U)
+        return self._stack(self._manifold.proj, X, U)
+
+    def egrad2rgrad(self, X, U):
+        if self._batched is not None:
+            return self._batched.egrad2rgrad(X, U)
+        return self._stack(self._manifold.egrad2rgrad, X, U)
+
+    def ehess2rhess(self, X, egrad, ehess, H):
+        if self._batched is not None:
+            return self._batched.ehess2rhess(X, egrad, ehess, H)
+        return self._stack(self._manifold.ehess2rhess, X, egrad, ehess, H)
+
+    def exp(self, X, U):
+        if self._batched is not None:
+            return self._batched.exp(X, U)
+        return self._stack(self._manifold.exp, X, U)
+
+    def retr(self, X, U):
+        if self._batched is not None:
+            return self._batched.retr(X, U)
+        return self._stack(self._manifold.retr, X, U)
+
+    def log(self, X, Y):
+        if self._batched is not None:
+            return self._batched.log(X, Y)
+        return self._stack(self._manifold.log, X, Y)
+
+    def rand(self, n=None):
+        if self._batched is not None:
+            return self._batched.rand(n)
+        return np.stack([self._manifold.rand(n) for _ in range(self._k)],
+                        axis=0 if n is None else 1)
+
+    def randvec(self, X, n=None):
+        if self._batched is not None:
+            return self._batched.randvec(X, n)
+        U = np.stack([self._manifold.randvec(X[i], n) for i in range(self._k)],
+                     axis=0 if n is None else 1)
+        return U / np.sqrt(self._k)
+
+    def zerovec(self, X):
+        if self._batched is not None:
+            return self._batched.zerovec(X)
+        return self._stack(self._manifold.zerovec, X)
+
+    def transp(self, X1, X2, G):
+        if self._batched is not None:
+            return self._batched.transp(X1, X2, G)
+        return self._stack(self._manifold.transp, X1, X2, G)
+
+    def retr_transp(self, X, U, vectors):
+        if self._batched is not None:
+            return self._batched.retr_transp(X, U, vectors)
+        return super().retr_transp(X, U, vectors)
+
+    def pairmean(self, X, Y):
+        if self._batched is not None:
+            return self._batched.pairmean(X, Y)
+        return self._stack(self._manifold.pairmean, X, Y)
@@ -5,22 +5,72 @@ from pymanopt.tools import ndarraySequenceMixin
 
 
 class Product(Manifold):
-    """Product manifold, i.e., the cartesian product of multiple manifolds."""
+    """Product manifold, i.e., the cartesian product of multiple manifolds.
+
+    Points and tangent vectors are represented as lists with one element per
+    factor manifold. If `packed` is True, the elements of these lists are
+    views into a single contiguous buffer of the common dtype of the factors
+    instead. Arithmetic on tangent vectors then reduces to one vectorized
+    operation on the buffer, and so does the inner product if all factors use
+    the Euclidean metric of their array representation. The packed layout
+    requires all factors to represent points and tangent vectors as
+    real-valued numpy arrays.
+
+    Batches of samples returned by `rand(n)` and `randvec(X, n)` are lists
+    of the stacked samples of each factor and are never packed.
+    """
 
     # TODO: Change the argument to *manifold so we can do Product(man1, man2).
-    def __init__(self, manifolds):
+    def __init__(self, manifolds, packed=False):
         self._manifolds = manifolds
+        self._packed = packed
+        self._layout = None
         name = ("Product manifold: {:s}".format(
                 " X ".join([str(man) for man in self._manifolds])))
         dimension = np.sum([man.dim for man in self._manifolds])
         super().__init__(name, dimension)
+        self._euclidean_metric = all(
+            [man._euclidean_metric for man in self._manifolds])
 
     @property
     def typicaldist(self):
         return np.sqrt(np.sum([man.typicaldist ** 2
                                for man in self._manifolds]))
 
+    @Manifold.random_generator.setter
+    def random_generator(self, generator):
+        Manifold.random_generator.fset(self, generator)
+        for man in self._manifolds:
+            man.random_generator = self._random_generator
+
+    @Manifold.dtype.setter
+    def dtype(self, dtype):
+        Manifold.dtype.fset(self, dtype)
+        for man in self._manifolds:
+            man.dtype = dtype
+        self._layout = None
+
+    def _get_layout(self, components):
+        if self._layout is None:
+            self._layout = _ProductLayout(components)
+        return self._layout
+
+    def _point(self, components):
+        if not self._packed:
+            return components
+        return self._get_layout(components).pack(components, _ProductPoint)
+
+    def _tangent_vector(self, components):
+        if not self._packed:
+            return _ProductTangentVector(components)
+        return self._get_layout(components).pack(
+            components, _ProductTangentVector)
+
     def inner(self, X, G, H):
+        if (self._euclidean_metric and
+                getattr(G, "_buffer", None) is not None and
+                getattr(H, "_buffer", None) is not None):
+            return float(np.dot(G._buffer, H._buffer))
         return np.sum([man.inner(X[k], G[k], H[k])
                        for k, man in enumerate(self._manifolds)])
 
@@ -32,73 +82,165 @@ class Product(Manifold):
                                for k, man in enumerate(self._manifolds)]))
 
     def proj(self, X, U):
-        return _ProductTangentVector(
+        return self._tangent_vector(
             [man.proj(X[k], U[k]) for k, man in enumerate(self._manifolds)])
 
     def egrad2rgrad(self, X, U):
-        return _ProductTangentVector(
+        return self._tangent_vector(
             [man.egrad2rgrad(X[k], U[k])
              for k, man in enumerate(self._manifolds)])
 
     def ehess2rhess(self, X, egrad, ehess, H):
-        return _ProductTangentVector(
+        return self._tangent_vector(
             [man.ehess2rhess(X[k], egrad[k], ehess[k], H[k])
              for k, man in enumerate(self._manifolds)])
 
     def exp(self, X, U):
-        return [man.exp(X[k], U[k]) for k, man in enumerate(self._manifolds)]
+        return self._point(
+            [man.exp(X[k], U[k]) for k, man in enumerate(self._manifolds)])
 
     def retr(self, X, U):
-        return [man.retr(X[k], U[k]) for k, man in enumerate(self._manifolds)]
+        return self._point(
+            [man.retr(X[k], U[k]) for k, man in enumerate(self._manifolds)])
 
     def log(self, X, U):
-        return _ProductTangentVector(
+        return self._tangent_vector(
             [man.log(X[k], U[k]) for k, man in enumerate(self._manifolds)])
 
-    def rand(self):
-        return [man.rand() for man in self._manifolds]
+    def rand(self, n=None):
+        if n is not None:
+            return [man.rand(n) for man in self._manifolds]
+        return self._point([man.rand() for man in self._manifolds])
 
-    def randvec(self, X):
+    def randvec(self, X, n=None):
         scale = len(self._manifolds) ** (-1/2)
-        return _ProductTangentVector(
-            [scale * man.randvec(X[k])
-             for k, man in enumerate(self._manifolds)])
+        components = [scale * man.randvec(X[k], n)
+                      for k, man in enumerate(self._manifolds)]
+        if n is not None:
+            return _ProductTangentVector(components)
+        return self._tangent_vector(components)
 
     def transp(self, X1, X2, G):
-        return _ProductTangentVector(
+        return self._tangent_vector(
             [man.transp(X1[k], X2[k], G[k])
              for k, man in enumerate(self._manifolds)])
 
     def pairmean(self, X, Y):
-        return [man.pairmean(X[k], Y[k])
-                for k, man in enumerate(self._manifolds)]
+        return self._point(
+            [man.pairmean(X[k], Y[k])
+             for k, man in enumerate(self._manifolds)])
+
+    def lincomb(self, X, a, U, b=None, V=None, out=None):
+        if (getattr(U, "_buffer", None) is not None and
+                (V is None or U._is_packed_like(V))):
+            if U._is_packed_like(out):
+                out_buffer = out._buffer
+            else:
+                out = out_buffer = None
+            buffer = super().lincomb(
+                X, a, U._buffer, b, None if V is None else V._buffer,
+                out=out_buffer)
+            if buffer is out_buffer:
+                return out
+            return U._layout.from_buffer(buffer, _ProductTangentVector)
+        return _ProductTangentVector(
+            [man.lincomb(X[k], a, U[k], b, None if V is None else V[k],
+                         out=None if out is None else out[k])
+             for k, man in enumerate(self._manifolds)])
 
     def zerovec(self, X):
+        if self._packed:
+            layout = self._get_layout(X)
+            return layout.from_buffer(
+                np.zeros(layout.size, dtype=layout.dtype),
+                _ProductTangentVector)
         return _ProductTangentVector(
             [man.zerovec(X[k]) for k, man in enumerate(self._manifolds)])
 
 
+class _ProductLayout:
+    """Describes how the components of points and tangent vectors on a
+    product manifold are laid out in a contiguous buffer.
+    """
+
+    def __init__(self, components):
+        self.shapes = []
+        self.slices = []
+        offset = 0
+        for component in components:
+            if (not isinstance(component, np.ndarray) or
+                    np.iscomplexobj(component)):
+                raise TypeError(
+                    "The packed layout of the product manifold requires all "
+                    "factors to be represented by real-valued numpy arrays")
+            self.shapes.append(component.shape)
+            self.slices.append(slice(offset, offset + component.size))
+            offset += component.size
+        self.size = offset
+        self.dtype = np.result_type(*components)
+
+    def from_buffer(self, buffer, cls):
+        components = cls([buffer[s].reshape(shape)
+                          for s, shape in zip(self.slices, self.shapes)])
+        components._buffer = buffer
+        components._layout = self
+        return components
+
+    def pack(self, components, cls):
+        buffer = np.empty(self.size, dtype=self.dtype)
+        for s, component in zip(self.slices, components):
+            buffer[s] = np.ravel(component)
+        return self.from_buffer(buffer, cls)
+
+
+class _ProductPoint(list):
+    _buffer = None
+    _layout = None
+
+
 class _ProductTangentVector(list, ndarraySequenceMixin):
+    _buffer = None
+    _layout = None
+
     def __repr__(self):
         return "_ProductTangentVector: " + super().__repr__()
 
+    def _is_packed_like(self, other):
+        return (self._buffer is not None and
+                getattr(other, "_layout", None) is self._layout)
+
+    def _from_buffer(self, buffer):
+        return self._layout.from_buffer(buffer, _ProductTangentVector)
+
     def __add__(self, other):
         assert len(self) == len(other)
+        if self._is_packed_like(other):
+            return self._from_buffer(self._buffer + other._buffer)
         return _ProductTangentVector(
             [v + other[k] for k, v in enumerate(self)])
 
     def __sub__(self, other):
         assert len(self) == len(other)
+        if self._is_packed_like(other):
+            return self._from_buffer(self._buffer - other._buffer)
         return _ProductTangentVector(
             [v - other[k] for k, v in enumerate(self)])
 
     def __mul__(self, other):
+        if self._buffer is not None:
+            return self._from_buffer(other * self._buffer)
         return _ProductTangentVector([other * val for val in self])
 
     __rmul__ = __mul__
 
-    def __div__(self, other):
+    def __truediv__(self, other):
+        if self._buffer is not None:
+            return self._from_buffer(self._buffer / other)
         return _ProductTangentVector([val / other for val in self])
 
+    __div__ = __truediv__
+
     def __neg__(self):
+        if self._buffer is not None:
+            return self._from_buffer(-self._buffer)
         return _ProductTangentVector([-val for val in self])
@@ -1,8 +1,8 @@
 import warnings
 
 import numpy as np
-from numpy import linalg as la, random as rnd
-from scipy.linalg import expm
+from numpy import linalg as la
+from scipy.linalg import cho_solve, solve_triangular
 # Workaround for SciPy bug: https://github.com/scipy/scipy/pull/8082
 try:
     from scipy.linalg import solve_continuous_lyapunov as lyap
@@ -10,7 +10,25 @@ except ImportError:
     from scipy.linalg import solve_lyapunov as lyap
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold, Manifold
-from pymanopt.tools.multi import multilog, multiprod, multisym, multitransp
+from pymanopt.tools.multi import (multiexp, multilog, multiprod, multiqr,
+                                  multisym, multitransp)
+
+
+def _lyap(A, Q):
+    """Solves the Lyapunov equation A * X + X * A^H = Q. If Q is a stack of
+    matrices, the equations for all of them are solved at once in the
+    eigenbasis of A, which is computed only once.
+    """
+    if np.ndim(Q) == 2:
+        return lyap(A, Q)
+    w, V = la.eig(A)
+    Vinv = la.inv(V)
+    Qt = multiprod(multiprod(Vinv, Q), Vinv.conj().T)
+    X = multiprod(multiprod(V, Qt / (w[:, np.newaxis] + w.conj())),
+                  V.conj().T)
+    if np.iscomplexobj(A) or np.iscomplexobj(Q):
+        return X
+    return X.real
 
 
 class _RetrAsExpMixin:
@@ -33,11 +51,21 @@ class SymmetricPositiveDefinite(EuclideanEmbeddedSubmanifold):
     from the Manopt MATLAB package. Also see "Conic geometric optimisation on
     the manifold of positive definite matrices" (Sra & Hosseini 2013) for more
     details.
+
+    Most operations of the affine-invariant geometry need a factorization of
+    the base point. The manifold therefore keeps the Cholesky factor of the
+    most recently used point around, so that the repeated calls to `inner`,
+    `norm`, `exp`, `log` and `dist` at the same point issued by the solvers
+    only factorize it once. The cache holds a copy of the point and is only
+    used if the point passed in is equal to it, so that points may be
+    modified in-place.
     """
     def __init__(self, n, k=1):
         self._n = n
         self._k = k
 
+        self._cholesky_cache = (None, None)
+
         if k == 1:
             name = ("Manifold of positive definite ({} x {}) matrices").format(
                 n, n)
@@ -46,22 +74,69 @@ class SymmetricPositiveDefinite(EuclideanEmbeddedSubmanifold):
         dimension = int(k * n * (n + 1) / 2)
         super().__init__(name, dimension)
 
+    def _power(self, k):
+        if self._k == 1:
+            return SymmetricPositiveDefinite(self._n, k)
+        return None
+
     @property
     def typicaldist(self):
         return np.sqrt(self.dim)
 
+    def _cholesky(self, x):
+        """Returns the lower-triangular Cholesky factor of `x`, reusing the
+        factor computed by the previous call if `x` is equal to the point of
+        that call. Comparing the points costs O(n^2) operations compared to
+        the O(n^3) operations of the factorization. The point and its factor
+        are stored and read as a single tuple, so that concurrent calls never
+        pair a factor with a different point.
+        """
+        point, cholesky = self._cholesky_cache
+        if not np.array_equal(x, point):
+            cholesky = la.cholesky(x)
+            self._cholesky_cache = (np.array(x), cholesky)
+        return cholesky
+
+    def _solve(self, x, u):
+        """Computes x^-1 * u using the Cholesky factor of `x`."""
+        c = self._cholesky(x)
+        if c.ndim == 2:
+            return cho_solve((c, True), u, check_finite=False)
+        w = np.empty(np.shape(u), dtype=np.result_type(c, u))
+        for i in range(c.shape[0]):
+            w[i] = cho_solve((c[i], True), u[i], check_finite=False)
+        return w
+
+    def _whiten(self, x, u):
+        """Computes c^-1 * u * c^-T for a symmetric matrix `u`, where c is the
+        Cholesky factor of `x`, by means of two triangular solves.
+        """
+        c = self._cholesky(x)
+        if c.ndim == 2:
+            a = solve_triangular(c, u, lower=True, check_finite=False)
+            return solve_triangular(c, a.T, lower=True, check_finite=False)
+        w = np.empty(np.shape(u), dtype=np.result_type(c, u))
+        for i in range(c.shape[0]):
+            a = solve_triangular(c[i], u[i], lower=True, check_finite=False)
+            w[i] = solve_triangular(c[i], a.T, lower=True, check_finite=False)
+        return w
+
+    def _unwhiten(self, x, w):
+        """Computes c * w * c^T where c is the Cholesky factor of `x`. This is
+        the inverse of `_whiten`.
+        """
+        c = self._cholesky(x)
+        return multiprod(multiprod(c, w), multitransp(c))
+
     def dist(self, x, y):
         # Adapted from equation 6.13 of "Positive definite matrices". The
-        # Cholesky decomposition gives the same result as matrix sqrt. There
-        # may be more efficient ways to compute this.
-        c = la.cholesky(x)
-        c_inv = la.inv(c)
-        logm = multilog(multiprod(multiprod(c_inv, y), multitransp(c_inv)),
-                        pos_def=True)
+        # Cholesky decomposition gives the same result as matrix sqrt.
+        logm = multilog(multisym(self._whiten(x, y)), pos_def=True)
         return la.norm(logm)
 
     def inner(self, x, u, v):
-        return np.tensordot(la.solve(x, u), la.solve(x, v), axes=x.ndim)
+        return np.tensordot(self._solve(x, u), self._solve(x, v),
+                            axes=x.ndim)
 
     def proj(self, X, G):
         return multisym(G)
@@ -76,78 +151,55 @@ class SymmetricPositiveDefinite(EuclideanEmbeddedSubmanifold):
                 multisym(multiprod(multiprod(u, multisym(egrad)), x)))
 
     def norm(self, x, u):
-        # This implementation is as fast as np.linalg.solve_triangular and is
-        # more stable, as the above solver tends to output non positive
-        # definite results.
-        c = la.cholesky(x)
-        c_inv = la.inv(c)
-        return la.norm(multiprod(multiprod(c_inv, u), multitransp(c_inv)))
-
-    def rand(self):
+        return la.norm(self._whiten(x, u))
+
+    def rand(self, n=None):
         # The way this is done is arbitrary. I think the space of p.d.
         # matrices would have infinite measure w.r.t. the Riemannian metric
         # (cf. integral 0-inf [ln(x)] dx = inf) so impossible to have a
         # 'uniform' distribution.
+        shape = self.zerovec(None).shape
 
         # Generate eigenvalues between 1 and 2
-        d = np.ones((self._k, self._n, 1)) + rnd.rand(self._k, self._n, 1)
-
-        # Generate an orthogonal matrix. Annoyingly qr decomp isn't
-        # vectorized so need to use a for loop. Could be done using
-        # svd but this is slower for bigger matrices.
-        u = np.zeros((self._k, self._n, self._n))
-        for i in range(self._k):
-            u[i], r = la.qr(rnd.randn(self._n, self._n))
+        d = 1 + self._randu(shape[:-1] + (1,), n)
 
-        if self._k == 1:
-            return multiprod(u, d * multitransp(u))[0]
+        # Generate orthogonal matrices. Could be done using svd but this is
+        # slower for bigger matrices.
+        u, r = multiqr(self._randn(shape, n))
         return multiprod(u, d * multitransp(u))
 
-    def randvec(self, x):
-        k = self._k
-        n = self._n
-        if k == 1:
-            u = multisym(rnd.randn(n, n))
-        else:
-            u = multisym(rnd.randn(k, n, n))
-        return u / self.norm(x, u)
+    def randvec(self, x, n=None):
+        u = multisym(self._randn(np.shape(x), n))
+        if n is None:
+            return u / self.norm(x, u)
+        # Whiten all samples at once (cf. _whiten) to compute their norms.
+        c = self._cholesky(x)
+        w = la.solve(c, multitransp(la.solve(c, u)))
+        norms = la.norm(np.reshape(w, (n, -1)), axis=1)
+        return u / norms.reshape((n,) + (1,) * np.ndim(x))
 
     def transp(self, x1, x2, d):
         return d
 
     def exp(self, x, u):
-        # TODO: Check which method is faster depending on n, k.
-        x_inv_u = la.solve(x, u)
-        if self._k > 1:
-            e = np.zeros(np.shape(x))
-            for i in range(self._k):
-                e[i] = expm(x_inv_u[i])
-        else:
-            e = expm(x_inv_u)
-        return multiprod(x, e)
-        # This alternative implementation is sometimes faster though less
-        # stable. It can return a matrix with small negative determinant.
-        #    c = la.cholesky(x)
-        #    c_inv = la.inv(c)
-        #    e = multiexp(multiprod(multiprod(c_inv, u), multitransp(c_inv)),
-        #                 sym=True)
-        #    return multiprod(multiprod(c, e), multitransp(c))
+        # With x = c * c^T, we have x * expm(x^-1 * u) = c * expm(c^-1 * u *
+        # c^-T) * c^T. The argument of the matrix exponential is symmetric so
+        # we can use an eigenvalue decomposition instead of scipy's expm.
+        e = multiexp(multisym(self._whiten(x, u)), sym=True)
+        return multisym(self._unwhiten(x, e))
 
     retr = exp
 
     def log(self, x, y):
-        c = la.cholesky(x)
-        c_inv = la.inv(c)
-        logm = multilog(multiprod(multiprod(c_inv, y), multitransp(c_inv)),
-                        pos_def=True)
-        return multiprod(multiprod(c, logm), multitransp(c))
+        logm = multilog(multisym(self._whiten(x, y)), pos_def=True)
+        return self._unwhiten(x, logm)
 
     def zerovec(self, x):
         k = self._k
         n = self._n
         if k == 1:
-            return np.zeros((k, n, n))
-        return np.zeros((n, n))
+            return np.zeros((n, n), dtype=self.dtype)
+        return np.zeros((k, n, n), dtype=self.dtype)
 
 
 # TODO(nkoep): This could either stay in here (seeing how it's a manifold of
@@ -179,9 +231,9 @@ class _PSDFixedRank(Manifold, _RetrAsExpMixin):
     def proj(self, Y, H):
         # Projection onto the horizontal space
         YtY = Y.T.dot(Y)
-        AS = Y.T.dot(H) - H.T.dot(Y)
-        Omega = lyap(YtY, AS)
-        return H - Y.dot(Omega)
+        AS = multiprod(Y.T, H) - multiprod(multitransp(H), Y)
+        Omega = _lyap(YtY, AS)
+        return H - multiprod(Y, Omega)
 
     def egrad2rgrad(self, Y, egrad):
         return egrad
@@ -192,22 +244,18 @@ class _PSDFixedRank(Manifold, _RetrAsExpMixin):
     def retr(self, Y, U):
         return Y + U
 
-    def rand(self):
-        return rnd.randn(self._n, self._k)
+    def rand(self, n=None):
+        return self._randn((self._n, self._k), n)
 
-    def randvec(self, Y):
-        H = self.rand()
-        P = self.proj(Y, H)
-        return self._normalize(P)
+    def randvec(self, Y, n=None):
+        P = self.proj(Y, self.rand(n))
+        return self._normalize_samples(P, n)
 
     def transp(self, Y, Z, U):
         return self.proj(Z, U)
 
-    def _normalize(self, Y):
-        return Y / self.norm(None, Y)
-
     def zerovec(self, X):
-        return np.zeros((self._n, self._k))
+        return np.zeros((self._n, self._k), dtype=self.dtype)
 
 
 class PSDFixedRank(_PSDFixedRank):
@@ -243,6 +291,8 @@ class PSDFixedRank(_PSDFixedRank):
     Paper link: http://www.di.ens.fr/~fbach/journee2010_sdp.pdf
     """
 
+    _euclidean_metric = True
+
     def __init__(self, n, k):
         name = ("YY' quotient manifold of {:d}x{:d} psd matrices of "
                 "rank {:d}".format(n, n, k))
@@ -293,9 +343,9 @@ class PSDFixedRankComplex(_PSDFixedRank):
         E = U - V.dot(S).dot(D)
         return self.inner(None, E, E) / 2
 
-    def rand(self):
+    def rand(self, n=None):
         rand_ = super().rand
-        return rand_() + 1j * rand_()
+        return rand_(n) + 1j * rand_(n)
 
 
 class Elliptope(Manifold, _RetrAsExpMixin):
@@ -329,6 +379,8 @@ class Elliptope(Manifold, _RetrAsExpMixin):
     Paper link: http://www.di.ens.fr/~fbach/journee2010_sdp.pdf
     """
 
+    _euclidean_metric = True
+
     def __init__(self, n, k):
         self._n = n
         self._k = k
@@ -360,9 +412,9 @@ class Elliptope(Manifold, _RetrAsExpMixin):
 
         # Projection onto the horizontal space
         YtY = Y.T.dot(Y)
-        AS = Y.T.dot(eta) - H.T.dot(Y)
-        Omega = lyap(YtY, -AS)
-        return eta - Y.dot((Omega - Omega.T) / 2)
+        AS = multiprod(Y.T, eta) - multiprod(multitransp(H), Y)
+        Omega = _lyap(YtY, -AS)
+        return eta - multiprod(Y, (Omega - multitransp(Omega)) / 2)
 
     def retr(self, Y, U):
         return self._normalize_rows(Y + U)
@@ -383,27 +435,27 @@ class Elliptope(Manifold, _RetrAsExpMixin):
 
         return self.proj(Y, hess)
 
-    def rand(self):
-        return self._normalize_rows(rnd.randn(self._n, self._k))
+    def rand(self, n=None):
+        return self._normalize_rows(self._randn((self._n, self._k), n))
 
-    def randvec(self, Y):
-        H = self.proj(Y, self.rand())
-        return H / self.norm(Y, H)
+    def randvec(self, Y, n=None):
+        H = self.proj(Y, self.rand(n))
+        return self._normalize_samples(H, n)
 
     def transp(self, Y, Z, U):
         return self.proj(Z, U)
 
     def _normalize_rows(self, Y):
         """Return an l2-row-normalized copy of the matrix Y."""
-        return Y / la.norm(Y, axis=1)[:, np.newaxis]
+        return Y / la.norm(Y, axis=-1, keepdims=True)
 
     # Orthogonal projection of each row of H to the tangent space at the
     # corresponding row of X, seen as a point on a sphere.
     def _project_rows(self, Y, H):
         # Compute the inner product between each vector H[i, :] with its root
         # point Y[i, :], i.e., Y[i, :].T * H[i, :]. Returns a row vector.
-        inners = (Y * H).sum(axis=1)
-        return H - Y * inners[:, np.newaxis]
+        inners = (Y * H).sum(axis=-1)
+        return H - Y * inners[..., np.newaxis]
 
     def zerovec(self, X):
-        return np.zeros((self._n, self._k))
+        return np.zeros((self._n, self._k), dtype=self.dtype)
@@ -3,12 +3,13 @@ Module containing manifolds of n-dimensional rotations
 """
 
 import numpy as np
-from numpy import linalg as la, random as rnd
+from numpy import linalg as la
 from scipy.linalg import expm, logm
 from scipy.special import comb
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
-from pymanopt.tools.multi import multiprod, multiskew, multisym, multitransp
+from pymanopt.tools.multi import (multiprod, multiqr, multiskew, multisym,
+                                  multitransp)
 
 
 class SpecialOrthogonalGroup(EuclideanEmbeddedSubmanifold):
@@ -73,6 +74,8 @@ class SpecialOrthogonalGroup(EuclideanEmbeddedSubmanifold):
     Original author: Nicolas Boumal, Dec. 30, 2012.
     """
 
+    _euclidean_metric = True
+
     def __init__(self, n, k=1):
         self._n = n
         self._k = k
@@ -86,6 +89,11 @@ class SpecialOrthogonalGroup(EuclideanEmbeddedSubmanifold):
         dimension = int(k * comb(n, 2))
         super().__init__(name, dimension)
 
+    def _power(self, k):
+        if self._k == 1:
+            return SpecialOrthogonalGroup(self._n, k)
+        return None
+
     def inner(self, X, U, V):
         return np.tensordot(U, V, axes=U.ndim)
 
@@ -155,53 +163,38 @@ class SpecialOrthogonalGroup(EuclideanEmbeddedSubmanifold):
             U[i] = np.real(logm(U[i]))
         return multiskew(U)
 
-    @staticmethod
-    def _randrot(n, N=1):
-        if n == 1:
-            return np.ones((N, 1, 1))
-
-        R = np.zeros((N, n, n))
-        for i in range(N):
-            # Generated as such, Q is uniformly distributed over O(n), the
-            # group of orthogonal n-by-n matrices.
-            A = rnd.randn(n, n)
-            Q, RR = la.qr(A)
-            Q = np.dot(Q, np.diag(np.sign(np.diag(RR))))  # Mezzadri 2007
-
-            # If Q is in O(n) but not in SO(n), we permute the two first
-            # columns of Q such that det(new Q) = -det(Q), hence the new Q will
-            # be in SO(n), uniformly distributed.
-            if la.det(Q) < 0:
-                Q[:, [0, 1]] = Q[:, [1, 0]]
-            R[i] = Q
-
-        if N == 1:
-            return R.reshape(n, n)
-        return R
-
-    def rand(self):
-        return self._randrot(self._n, self._k)
-
-    @staticmethod
-    def _randskew(n, N=1):
-        idxs = np.triu_indices(n, 1)
-        S = np.zeros((N, n, n))
-        for i in range(N):
-            S[i][idxs] = rnd.randn(int(n * (n - 1) / 2))
-            S = S - multitransp(S)
-        if N == 1:
-            return S.reshape(n, n)
-        return S
-
-    def randvec(self, X):
-        U = self._randskew(self._n, self._k)
-        nrmU = np.sqrt(np.tensordot(U, U, axes=U.ndim))
-        return U / nrmU
+    def _shape(self, n=None):
+        shape = (self._n, self._n)
+        if self._k > 1:
+            shape = (self._k,) + shape
+        if n is not None:
+            shape = (n,) + shape
+        return shape
+
+    def rand(self, n=None):
+        shape = self._shape(n)
+        if self._n == 1:
+            return np.ones(shape, dtype=self.dtype)
+
+        # Generated as such, Q is uniformly distributed over O(n), the group
+        # of orthogonal n-by-n matrices.
+        Q, R = multiqr(self._randn(shape[-2:], int(np.prod(shape[:-2]))))
+        signs = np.sign(np.diagonal(R, axis1=-2, axis2=-1))
+        Q *= signs[:, np.newaxis, :]  # Mezzadri 2007
+
+        # If Q is in O(n) but not in SO(n), we permute the two first columns
+        # of Q such that det(new Q) = -det(Q), hence the new Q will be in
+        # SO(n), uniformly distributed.
+        reflections = la.det(Q) < 0
+        Q[reflections, :, :2] = Q[reflections][:, :, 1::-1]
+        return Q.reshape(shape)
+
+    def randvec(self, X, n=None):
+        U = multiskew(self._randn(self._shape(), n))
+        return self._normalize_samples(U, n)
 
     def zerovec(self, X):
-        if self._k == 1:
-            return np.zeros((self._n, self._n))
-        return np.zeros((self._k, self._n, self._n))
+        return np.zeros(self._shape(), dtype=self.dtype)
 
     def transp(self, x1, x2, d):
         return d
@@ -1,8 +1,9 @@
+import abc
 import warnings
 
 import numpy as np
 import numpy.linalg as la
-import numpy.random as rnd
+from scipy.linalg import qr
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
 
@@ -10,6 +11,8 @@ from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
 class _Sphere(EuclideanEmbeddedSubmanifold):
     """Base class for tensors with unit Frobenius norm."""
 
+    _euclidean_metric = True
+
     def __init__(self, *shape, name, dimension):
         if len(shape) == 0:
             raise TypeError("Need shape parameters.")
@@ -21,9 +24,13 @@ class _Sphere(EuclideanEmbeddedSubmanifold):
         return np.pi
 
     def inner(self, X, U, V):
+        if not isinstance(U, np.ndarray):
+            return float(U.reshape(-1).dot(V.reshape(-1)))
         return float(np.tensordot(U, V, axes=U.ndim))
 
     def norm(self, X, U):
+        if not isinstance(U, np.ndarray):
+            return float(U.norm())
         return la.norm(U)
 
     def dist(self, U, V):
@@ -37,6 +44,12 @@ class _Sphere(EuclideanEmbeddedSubmanifold):
     def weingarten(self, X, U, V):
         return -self.inner(X, X, V) * U
 
+    def traced_egrad2rgrad(self, X, G):
+        return G - (X * G).sum() * X
+
+    def traced_ehess2rhess(self, X, G, H, U):
+        return H - (X * H).sum() * X - (X * G).sum() * U
+
     def exp(self, X, U):
         norm_U = self.norm(None, U)
         # Check that norm_U isn't too tiny. If very small then
@@ -58,14 +71,18 @@ class _Sphere(EuclideanEmbeddedSubmanifold):
             P *= dist / self.norm(None, P)
         return P
 
-    def rand(self):
-        Y = rnd.randn(*self._shape)
-        return self._normalize(Y)
+    def rand(self, n=None):
+        return self._normalize_samples(self._randn(self._shape, n), n)
 
-    def randvec(self, X):
-        H = rnd.randn(*self._shape)
-        P = self.proj(X, H)
-        return self._normalize(P)
+    def randvec(self, X, n=None):
+        if not isinstance(X, np.ndarray):
+            return X.new_tensor(self.randvec(X.detach().cpu().numpy(), n))
+        H = self._randn(self._shape, n)
+        if n is None:
+            P = self.proj(X, H)
+        else:
+            P = H - np.multiply.outer(np.tensordot(H, X, axes=X.ndim), X)
+        return self._normalize_samples(P, n)
 
     def transp(self, X, Y, U):
         return self.proj(Y, U)
@@ -74,7 +91,9 @@ class _Sphere(EuclideanEmbeddedSubmanifold):
         return self._normalize(X + Y)
 
     def zerovec(self, X):
-        return np.zeros(self._shape)
+        if not isinstance(X, np.ndarray):
+            return X.new_zeros(self._shape)
+        return np.zeros(self._shape, dtype=self.dtype)
 
     def _normalize(self, X):
         """
@@ -100,6 +119,8 @@ class Sphere(_Sphere):
        of Information. Springer, Berlin, Heidelberg, 2013.
     """
 
+    supports_tensors = True
+
     def __init__(self, *shape):
         if len(shape) == 0:
             raise TypeError("Need shape parameters.")
@@ -114,15 +135,22 @@ class Sphere(_Sphere):
 
 
 class _SphereSubspaceIntersectionManifold(_Sphere):
-    def __init__(self, projector, name, dimension):
-        m, n = projector.shape
-        assert m == n, "projection matrix is not square"
+    """Base class for spheres intersected with a subspace of R^n. The
+    projector onto the subspace is never formed explicitly. Instead, only an
+    orthonormal basis of the span of the matrix defining the subspace is
+    stored, so that applying the projector costs O(n * r) operations.
+    """
+
+    traced_egrad2rgrad = None
+    traced_ehess2rhess = None
+
+    def __init__(self, n, basis, name, dimension):
         if dimension == 0:
             warnings.warn(
                 "Intersected subspace is 1-dimensional! The manifold '{:s}' "
                 "therefore has dimension 0 as it only consists of isolated "
                 "points".format(self._get_class_name()))
-        self._subspace_projector = projector
+        self._basis = basis
         super().__init__(n, name=name, dimension=dimension)
 
     def _validate_span_matrix(self, U):
@@ -133,17 +161,36 @@ class _SphereSubspaceIntersectionManifold(_Sphere):
             raise ValueError(
                 "The span matrix cannot have fewer rows than columns")
 
+    @staticmethod
+    def _compute_span_basis(U):
+        """Returns an orthonormal basis of the column span of U. The rank of
+        U is determined from a rank-revealing (column-pivoted) QR
+        decomposition using the same tolerance as `numpy.linalg.matrix_rank`.
+        """
+        Q, R, _ = qr(U, mode="economic", pivoting=True)
+        diagonal = np.abs(np.diag(R))
+        if diagonal.size == 0:
+            return Q[:, :0]
+        tolerance = diagonal[0] * max(U.shape) * np.finfo(R.dtype).eps
+        rank = int(np.sum(diagonal > tolerance))
+        return Q[:, :rank]
+
+    @abc.abstractmethod
+    def _project_subspace(self, H):
+        """Applies the projector onto the intersected subspace to H, or to
+        each vector stored along the last axis of H."""
+
     def proj(self, X, H):
         Y = super().proj(X, H)
-        return self._subspace_projector.dot(Y)
+        return self._project_subspace(Y)
 
-    def rand(self):
-        X = super().rand()
-        return self._normalize(self._subspace_projector.dot(X))
+    def rand(self, n=None):
+        X = super().rand(n)
+        return self._normalize_samples(self._project_subspace(X), n)
 
-    def randvec(self, X):
-        Y = super().randvec(X)
-        return self._normalize(self._subspace_projector.dot(Y))
+    def randvec(self, X, n=None):
+        Y = super().randvec(X, n)
+        return self._normalize_samples(self._project_subspace(Y), n)
 
 
 class SphereSubspaceIntersection(_SphereSubspaceIntersectionManifold):
@@ -156,13 +203,15 @@ class SphereSubspaceIntersection(_SphereSubspaceIntersectionManifold):
     def __init__(self, U):
         self._validate_span_matrix(U)
         m = U.shape[0]
-        Q, _ = la.qr(U)
-        projector = Q.dot(Q.T)
-        subspace_dimension = la.matrix_rank(projector)
+        basis = self._compute_span_basis(U)
+        subspace_dimension = basis.shape[1]
         name = ("Sphere manifold of {}-dimensional vectors intersecting a "
                 "{}-dimensional subspace".format(m, subspace_dimension))
         dimension = subspace_dimension - 1
-        super().__init__(projector, name, dimension)
+        super().__init__(m, basis, name, dimension)
+
+    def _project_subspace(self, H):
+        return np.dot(np.dot(H, self._basis), self._basis.T)
 
 
 class SphereSubspaceComplementIntersection(
@@ -176,10 +225,12 @@ class SphereSubspaceComplementIntersection(
     def __init__(self, U):
         self._validate_span_matrix(U)
         m = U.shape[0]
-        Q, _ = la.qr(U)
-        projector = np.eye(m) - Q.dot(Q.T)
-        subspace_dimension = la.matrix_rank(projector)
+        basis = self._compute_span_basis(U)
+        subspace_dimension = m - basis.shape[1]
         name = ("Sphere manifold of {}-dimensional vectors orthogonal "
                 "to a {}-dimensional subspace".format(m, subspace_dimension))
         dimension = subspace_dimension - 1
-        super().__init__(projector, name, dimension)
+        super().__init__(m, basis, name, dimension)
+
+    def _project_subspace(self, H):
+        return H - np.dot(np.dot(H, self._basis), self._basis.T)
@@ -2,7 +2,8 @@ import numpy as np
 from scipy.linalg import expm
 
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
-from pymanopt.tools.multi import multiprod, multisym, multitransp
+from pymanopt.tools.multi import (multiprod, multiqr, multisym,
+                                  multitransp)
 
 
 class Stiefel(EuclideanEmbeddedSubmanifold):
@@ -15,6 +16,10 @@ class Stiefel(EuclideanEmbeddedSubmanifold):
     matrices if k > 1 (Note that this is different to manopt!).
     """
 
+    _euclidean_metric = True
+
+    supports_tensors = True
+
     def __init__(self, n, p, k=1):
         self._n = n
         self._p = p
@@ -34,6 +39,11 @@ class Stiefel(EuclideanEmbeddedSubmanifold):
         dimension = int(k * (n * p - p * (p + 1) / 2))
         super().__init__(name, dimension)
 
+    def _power(self, k):
+        if self._k == 1:
+            return Stiefel(self._n, self._p, k)
+        return None
+
     @property
     def typicaldist(self):
         return np.sqrt(self._p * self._k)
@@ -41,6 +51,8 @@ class Stiefel(EuclideanEmbeddedSubmanifold):
     def inner(self, X, G, H):
         # Inner product (Riemannian metric) on the tangent space
         # For the stiefel this is the Frobenius inner product.
+        if not isinstance(G, np.ndarray):
+            return float(G.reshape(-1).dot(H.reshape(-1)))
         return np.tensordot(G, H, axes=G.ndim)
 
     def dist(self, X, Y):
@@ -49,17 +61,36 @@ class Stiefel(EuclideanEmbeddedSubmanifold):
             "the 'dist' method".format(self._get_class_name()))
 
     def proj(self, X, U):
+        if not isinstance(X, np.ndarray):
+            return self.traced_egrad2rgrad(X, U)
         return U - multiprod(X, multisym(multiprod(multitransp(X), U)))
 
     # TODO(nkoep): Implement the weingarten map instead.
     def ehess2rhess(self, X, egrad, ehess, H):
+        if not isinstance(X, np.ndarray):
+            return self.traced_ehess2rhess(X, egrad, ehess, H)
         XtG = multiprod(multitransp(X), egrad)
         symXtG = multisym(XtG)
         HsymXtG = multiprod(H, symXtG)
         return self.proj(X, ehess - HsymXtG)
 
+    def traced_egrad2rgrad(self, X, G):
+        XtG = X.swapaxes(-2, -1) @ G
+        return G - X @ (XtG + XtG.swapaxes(-2, -1)) / 2
+
+    def traced_ehess2rhess(self, X, G, H, U):
+        XtG = X.swapaxes(-2, -1) @ G
+        symXtG = (XtG + XtG.swapaxes(-2, -1)) / 2
+        return self.traced_egrad2rgrad(X, H - U @ symXtG)
+
     # Retract to the Stiefel using the qr decomposition of X + G.
     def retr(self, X, G):
+        if not isinstance(X, np.ndarray):
+            import torch
+            q, r = torch.linalg.qr(X + G)
+            # Unflip any flipped signs
+            signs = (r.diagonal(dim1=-2, dim2=-1).sign() + 0.5).sign()
+            return q * signs.unsqueeze(-2)
         if self._k == 1:
             # Calculate 'thin' qr decomposition of X + G
             q, r = np.linalg.qr(X + G)
@@ -76,48 +107,68 @@ class Stiefel(EuclideanEmbeddedSubmanifold):
     def norm(self, X, G):
         # Norm on the tangent space of the Stiefel is simply the Euclidean
         # norm.
+        if not isinstance(G, np.ndarray):
+            return float(G.norm())
         return np.linalg.norm(G)
 
     # Generate random Stiefel point using qr of random normally distributed
     # matrix.
-    def rand(self):
+    def rand(self, n=None):
         if self._k == 1:
-            X = np.random.randn(self._n, self._p)
-            q, r = np.linalg.qr(X)
-            return q
-
-        X = np.zeros((self._k, self._n, self._p))
-        for i in range(self._k):
-            X[i], r = np.linalg.qr(np.random.randn(self._n, self._p))
-        return X
+            X = self._randn((self._n, self._p), n)
+        else:
+            X = self._randn((self._k, self._n, self._p), n)
+        q, r = multiqr(X)
+        return q
 
-    def randvec(self, X):
-        U = np.random.randn(*np.shape(X))
-        U = self.proj(X, U)
-        U = U / np.linalg.norm(U)
-        return U
+    def randvec(self, X, n=None):
+        if not isinstance(X, np.ndarray):
+            return X.new_tensor(self.randvec(X.detach().cpu().numpy(), n))
+        U = self.proj(X, self._randn(np.shape(X), n))
+        return self._normalize_samples(U, n)
 
     def transp(self, x1, x2, d):
         return self.proj(x2, d)
 
+    def retr_transp(self, X, U, vectors):
+        if not isinstance(X, np.ndarray):
+            return super().retr_transp(X, U, vectors)
+        Y = self.retr(X, U)
+        if not vectors:
+            return Y, []
+        # Project all vectors at once by stacking them horizontally. This
+        # turns the matrix products of the individual projections into a
+        # single pair of larger products.
+        num_vectors = len(vectors)
+        V = np.concatenate(vectors, axis=-1)
+        YtV = multiprod(multitransp(Y), V)
+        symYtV = np.concatenate(
+            [multisym(block) for block in np.split(YtV, num_vectors, axis=-1)],
+            axis=-1)
+        return Y, np.split(V - multiprod(Y, symYtV), num_vectors, axis=-1)
+
     def exp(self, X, U):
         # TODO: Simplify these expressions.
         if self._k == 1:
             W = expm(np.bmat([[X.T.dot(U), -U.T.dot(U)],
-                              [np.eye(self._p), X.T.dot(U)]]))
-            Z = np.bmat([[expm(-X.T.dot(U))], [np.zeros((self._p, self._p))]])
+                              [np.eye(self._p, dtype=X.dtype), X.T.dot(U)]]))
+            Z = np.bmat([[expm(-X.T.dot(U))],
+                         [np.zeros((self._p, self._p), dtype=X.dtype)]])
             Y = np.bmat([X, U]).dot(W).dot(Z)
         else:
-            Y = np.zeros(np.shape(X))
+            Y = np.zeros_like(X)
             for i in range(self._k):
                 W = expm(np.bmat([[X[i].T.dot(U[i]), -U[i].T.dot(U[i])],
-                                  [np.eye(self._p), X[i].T.dot(U[i])]]))
+                                  [np.eye(self._p, dtype=X.dtype),
+                                   X[i].T.dot(U[i])]]))
                 Z = np.bmat([[expm(-X[i].T.dot(U[i]))],
-                             [np.zeros((self._p, self._p))]])
+                             [np.zeros((self._p, self._p), dtype=X.dtype)]])
                 Y[i] = np.bmat([X[i], U[i]]).dot(W).dot(Z)
         return Y
 
     def zerovec(self, X):
+        if not isinstance(X, np.ndarray):
+            return X.new_zeros(X.shape)
         if self._k == 1:
-            return np.zeros((self._n, self._p))
-        return np.zeros((self._k, self._n, self._p))
+            return np.zeros((self._n, self._p), dtype=self.dtype)
+        return np.zeros((self._k, self._n, self._p), dtype=self.dtype)
@@ -33,7 +33,9 @@ class ConjugateGradient(Solver):
                 value disables this strategy. See in code formula for
                 the specific criterion used.
             - linesearch (LineSearchAdaptive)
-                The linesearch method to used.
+                The linesearch method to used. Its search method must accept
+                the `vectors` argument of the line searches in
+                pymanopt.solvers.linesearch.
         """
         super().__init__(*args, **kwargs)
 
@@ -82,6 +84,9 @@ class ConjugateGradient(Solver):
         # If no starting point is specified, generate one at random.
         if x is None:
             x = man.rand()
+        # The iterates are kept in the representation chosen by the problem,
+        # e.g., as tensors of the autodiff backend, until the solver returns.
+        x = problem.from_numpy(x)
 
         # Initialize iteration counter and timer
         iter = 0
@@ -113,7 +118,8 @@ class ConjugateGradient(Solver):
                 print("%5d\t%+.16e\t%.8e" % (iter, cost, gradnorm))
 
             if self._logverbosity >= 2:
-                self._append_optlog(iter, x, cost, gradnorm=gradnorm)
+                self._append_optlog(iter, problem.to_numpy(x), cost,
+                                    gradnorm=gradnorm)
 
             stop_reason = self._check_stopping_criterion(
                 time0, gradnorm=gradnorm, iter=iter + 1, stepsize=stepsize)
@@ -142,8 +148,17 @@ class ConjugateGradient(Solver):
                 df0 = -gradPgrad
 
             # Execute line search
-            stepsize, newx = linesearch.search(objective, man, x, desc_dir,
-                                               cost, df0)
+            # The sufficient decrease test of the line search is carried out
+            # in the scalar precision prescribed by the problem. The vectors
+            # the CG scheme needs at the new point are transported along with
+            # the retraction of the accepted step.
+            scalar = problem.scalar_dtype.type
+            vectors = [grad, desc_dir]
+            if self._beta_type == BetaTypes.HagerZhang:
+                vectors.append(Pgrad)
+            stepsize, newx, transported = linesearch.search(
+                objective, man, x, desc_dir, scalar(cost), scalar(df0),
+                vectors=vectors)
 
             # Compute the new cost-related quantities for newx
             newcost = objective(newx)
@@ -153,7 +168,7 @@ class ConjugateGradient(Solver):
             newgradPnewgrad = man.inner(newx, newgrad, Pnewgrad)
 
             # Apply the CG scheme to compute the next search direction
-            oldgrad = man.transp(x, newx, grad)
+            oldgrad = transported[0]
             orth_grads = man.inner(newx, oldgrad, Pnewgrad) / newgradPnewgrad
 
             # Powell's restart strategy (see page 12 of Hager and Zhang's
@@ -162,7 +177,7 @@ class ConjugateGradient(Solver):
                 beta = 0
                 desc_dir = -Pnewgrad
             else:
-                desc_dir = man.transp(x, newx, desc_dir)
+                desc_dir = transported[1]
 
                 if self._beta_type == BetaTypes.FletcherReeves:
                     beta = newgradPnewgrad / gradPgrad
@@ -181,7 +196,7 @@ class ConjugateGradient(Solver):
                         beta = 1
                 elif self._beta_type == BetaTypes.HagerZhang:
                     diff = newgrad - oldgrad
-                    Poldgrad = man.transp(x, newx, Pgrad)
+                    Poldgrad = transported[2]
                     Pdiff = Pnewgrad - Poldgrad
                     deno = man.inner(newx, diff, desc_dir)
                     numo = man.inner(newx, diff, Pnewgrad)
@@ -199,7 +214,8 @@ class ConjugateGradient(Solver):
                         "Unknown beta_type %s. Should be one of %s." % (
                             self._beta_type, types))
 
-                desc_dir = -Pnewgrad + beta * desc_dir
+                desc_dir = man.lincomb(newx, -1, Pnewgrad, beta, desc_dir,
+                                       out=desc_dir)
 
             # Update the necessary variables for the next iteration.
             x = newx
@@ -211,6 +227,7 @@ class ConjugateGradient(Solver):
 
             iter += 1
 
+        x = problem.to_numpy(x)
         if self._logverbosity <= 0:
             return x
         else:
@@ -1,3 +1,14 @@
+def _retract(manifold, x, u, vectors):
+    """Retracts the tangent vector `u` at `x` and, unless `vectors` is None,
+    transports the tangent vectors in `vectors` along in a single call of
+    `manifold.retr_transp`. Returns the new point and the list of transported
+    vectors, or None if no vectors are given.
+    """
+    if vectors is None:
+        return manifold.retr(x, u), None
+    return manifold.retr_transp(x, u, vectors)
+
+
 class LineSearchBackTracking:
     """
     Back-tracking line-search based on linesearch.m in the manopt MATLAB
@@ -14,7 +25,7 @@ class LineSearchBackTracking:
 
         self._oldf0 = None
 
-    def search(self, objective, manifold, x, d, f0, df0):
+    def search(self, objective, manifold, x, d, f0, df0, vectors=None):
         """
         Function to perform backtracking line-search.
         Arguments:
@@ -28,11 +39,17 @@ class LineSearchBackTracking:
                 tangent vector at x (descent direction)
             - df0
                 directional derivative at x along d
+            - vectors (None)
+                optional list of tangent vectors at x which are transported
+                to the tangent space at newx together with the retraction
+                (see `Manifold.retr_transp`)
         Returns:
             - stepsize
                 norm of the vector retracted to reach newx from x
             - newx
                 next iterate suggested by the line-search
+            - transported
+                the transported vectors, only returned if vectors is given
         """
         # Compute the norm of the search direction
         norm_d = manifold.norm(x, d)
@@ -47,7 +64,7 @@ class LineSearchBackTracking:
         alpha = float(alpha)
 
         # Make the chosen step and compute the cost there.
-        newx = manifold.retr(x, alpha * d)
+        newx, transported = _retract(manifold, x, alpha * d, vectors)
         newf = objective(newx)
         step_count = 1
 
@@ -59,7 +76,7 @@ class LineSearchBackTracking:
             alpha = self.contraction_factor * alpha
 
             # and look closer down the line
-            newx = manifold.retr(x, alpha * d)
+            newx, transported = _retract(manifold, x, alpha * d, vectors)
             newf = objective(newx)
 
             step_count = step_count + 1
@@ -68,12 +85,15 @@ class LineSearchBackTracking:
         if newf > f0:
             alpha = 0
             newx = x
+            transported = vectors
 
         stepsize = alpha * norm_d
 
         self._oldf0 = f0
 
-        return stepsize, newx
+        if vectors is None:
+            return stepsize, newx
+        return stepsize, newx, transported
 
 
 class LineSearchAdaptive:
@@ -89,7 +109,7 @@ class LineSearchAdaptive:
         self._initial_stepsize = initial_stepsize
         self._oldalpha = None
 
-    def search(self, objective, man, x, d, f0, df0):
+    def search(self, objective, man, x, d, f0, df0, vectors=None):
         norm_d = man.norm(x, d)
 
         if self._oldalpha is not None:
@@ -98,7 +118,7 @@ class LineSearchAdaptive:
             alpha = self._initial_stepsize / norm_d
         alpha = float(alpha)
 
-        newx = man.retr(x, alpha * d)
+        newx, transported = _retract(man, x, alpha * d, vectors)
         newf = objective(newx)
         cost_evaluations = 1
 
@@ -108,7 +128,7 @@ class LineSearchAdaptive:
             alpha *= self._contraction_factor
 
             # Look closer down the line.
-            newx = man.retr(x, alpha * d)
+            newx, transported = _retract(man, x, alpha * d, vectors)
             newf = objective(newx)
 
             cost_evaluations += 1
@@ -116,6 +136,7 @@ class LineSearchAdaptive:
         if newf > f0:
             alpha = 0
             newx = x
+            transported = vectors
 
         stepsize = alpha * norm_d
 
@@ -133,4 +154,6 @@ class LineSearchAdaptive:
         else:
             self._oldalpha = 2 * alpha
 
-        return stepsize, newx
+        if vectors is None:
+            return stepsize, newx
+        return stepsize, newx, transported
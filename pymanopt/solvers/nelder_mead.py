@@ -116,7 +116,7 @@ class NelderMead(Solver):
 
         # Compute objective-related quantities for x, and setup a function
         # evaluations counter.
-        costs = np.array([objective(xi) for xi in x])
+        costs = np.asarray(problem.cost_batch(x))
         costevals = dim + 1
 
         # Sort simplex points by cost.
@@ -222,7 +222,7 @@ class NelderMead(Solver):
             x0 = x[0]
             for i in np.arange(1, dim + 1):
                 x[i] = man.pairmean(x0, x[i])
-                costs[i] = objective(x[i])
+            costs[1:] = problem.cost_batch(x[1:])
             costevals += dim
 
         if self._logverbosity <= 0:
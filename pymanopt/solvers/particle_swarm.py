@@ -1,7 +1,6 @@
 import time
 
 import numpy as np
-import numpy.random as rnd
 
 from pymanopt.solvers.solver import Solver
 
@@ -56,7 +55,7 @@ class ParticleSwarm(Solver):
         """
         man = problem.manifold
         verbosity = problem.verbosity
-        objective = problem.cost
+        objective_batch = problem.cost_batch
 
         # Choose proper default algorithm parameters. We need to know about the
         # dimension of the manifold to limit the parameter range, so we have to
@@ -84,14 +83,15 @@ class ParticleSwarm(Solver):
         # Initialize personal best positions to the initial population.
         y = list(x)
 
-        # Save a copy of the swarm at the previous iteration.
-        xprev = list(x)
+        # Draw all random numbers from the source of randomness of the
+        # manifold so that seeding the manifold makes runs reproducible.
+        rng = man.random_generator
 
         # Initialize velocities for each particle.
         v = [man.randvec(xi) for xi in x]
 
         # Compute cost for each particle xi.
-        costs = np.array([objective(xi) for xi in x])
+        costs = np.asarray(objective_batch(x))
         fy = list(costs)
         costevals = self._populationsize
 
@@ -135,30 +135,28 @@ class ParticleSwarm(Solver):
                 # Get the position and past best position of particle i.
                 yi = y[i]
 
-                # Get the previous position and velocity of particle i.
-                xiprev = xprev[i]
-                vi = v[i]
-
                 # Compute the new velocity of particle i, composed of three
-                # contributions.
-                inertia = w * man.transp(xiprev, xi, vi)
-                nostalgia = rnd.rand() * self._nostalgia * man.log(xi, yi)
-                social = rnd.rand() * self._social * man.log(xi, xbest)
+                # contributions. The previous velocity v[i] was already
+                # transported to the tangent space at xi in the position
+                # update below.
+                inertia = w * v[i]
+                nostalgia = rng.random() * self._nostalgia * man.log(xi, yi)
+                social = rng.random() * self._social * man.log(xi, xbest)
 
                 v[i] = inertia + nostalgia + social
 
-            # Backup the current swarm positions.
-            xprev = list(x)
-
-            # Update positions, personal bests and global best.
+            # Compute new positions of the particles and transport their
+            # velocities along.
             for i, xi in enumerate(x):
-                # Compute new position of particle i.
-                x[i] = man.retr(xi, v[i])
-                # Compute new cost of particle i.
-                fxi = objective(xi)
+                x[i], (v[i],) = man.retr_transp(xi, v[i], [v[i]])
+
+            # Compute the costs of the swarm at the new positions.
+            costs = np.asarray(objective_batch(x))
+            costevals += self._populationsize
 
-                # Update costs of the swarm.
-                costs[i] = fxi
+            # Update personal bests and global best.
+            for i, xi in enumerate(x):
+                fxi = costs[i]
                 # Update self-best if necessary.
                 if fxi < fy[i]:
                     fy[i] = fxi
@@ -167,7 +165,6 @@ class ParticleSwarm(Solver):
                     if fy[i] < fbest:
                         fbest = fy[i]
                         xbest = xi
-            costevals += self._populationsize
 
         if self._logverbosity <= 0:
             return xbest
@@ -56,6 +56,9 @@ class SteepestDescent(Solver):
         # If no starting point is specified, generate one at random.
         if x is None:
             x = man.rand()
+        # The iterates are kept in the representation chosen by the problem,
+        # e.g., as tensors of the autodiff backend, until the solver returns.
+        x = problem.from_numpy(x)
 
         # Initialize iteration counter and timer
         iter = 0
@@ -78,14 +81,18 @@ class SteepestDescent(Solver):
                 print("%5d\t%+.16e\t%.8e" % (iter, cost, gradnorm))
 
             if self._logverbosity >= 2:
-                self._append_optlog(iter, x, cost, gradnorm=gradnorm)
+                self._append_optlog(iter, problem.to_numpy(x), cost,
+                                    gradnorm=gradnorm)
 
             # Descent direction is minus the gradient
             desc_dir = -grad
 
-            # Perform line-search
+            # Perform line-search. The sufficient decrease test is carried out
+            # in the scalar precision prescribed by the problem.
+            scalar = problem.scalar_dtype.type
             stepsize, x = linesearch.search(objective, man, x, desc_dir,
-                                            cost, -gradnorm**2)
+                                            scalar(cost),
+                                            -scalar(gradnorm) ** 2)
 
             stop_reason = self._check_stopping_criterion(
                 time0, stepsize=stepsize, gradnorm=gradnorm, iter=iter)
@@ -96,6 +103,7 @@ class SteepestDescent(Solver):
                     print('')
                 break
 
+        x = problem.to_numpy(x)
         if self._logverbosity <= 0:
             return x
         else:
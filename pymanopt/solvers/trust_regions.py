@@ -111,10 +111,14 @@ class TrustRegions(Solver):
         cost = problem.cost
         grad = problem.grad
         hess = problem.hess
+        scalar = problem.scalar_dtype.type
 
         # If no starting point is specified, generate one at random.
         if x is None:
             x = man.rand()
+        # The iterates are kept in the representation chosen by the problem,
+        # e.g., as tensors of the autodiff backend, until the solver returns.
+        x = problem.from_numpy(x)
 
         # Initializations
         time0 = time.time()
@@ -159,7 +163,7 @@ class TrustRegions(Solver):
                 eta = 1e-6 * man.randvec(x)
                 # Must be inside trust region
                 while man.norm(x, eta) > Delta:
-                    eta = np.sqrt(np.sqrt(np.spacing(1)))
+                    eta = np.sqrt(np.sqrt(np.spacing(1))) * eta
 
             # Solve TR subproblem approximately
             eta, Heta, numit, stop_inner = self._truncated_conjugate_gradient(
@@ -213,8 +217,11 @@ class TrustRegions(Solver):
 
             # Will we accept the proposal or not? Check the performance of the
             # quadratic model against the actual cost.
-            rhonum = fx - fx_prop
-            rhoden = -man.inner(x, fgradx, eta) - 0.5 * man.inner(x, eta, Heta)
+            # The ratio is evaluated in the scalar precision prescribed by
+            # the problem, which may be higher than that of the iterates.
+            rhonum = scalar(fx) - scalar(fx_prop)
+            rhoden = (-scalar(man.inner(x, fgradx, eta)) -
+                      0.5 * scalar(man.inner(x, eta, Heta)))
 
             # rhonum could be anything.
             # rhoden should be nonnegative, as guaranteed by tCG, baring
@@ -245,7 +252,10 @@ class TrustRegions(Solver):
             # but not under scaling of f. For abs(fx) > 1, the opposite holds.
             # This should not alarm us, as this heuristic only triggers at the
             # very last iterations if very fine convergence is demanded.
-            rho_reg = max(1, abs(fx)) * np.spacing(1) * self.rho_regularization
+            # The cost is only as accurate as the precision of the iterates,
+            # so the machine epsilon of their dtype is used.
+            rho_reg = (max(1, abs(scalar(fx))) * np.finfo(man.dtype).eps *
+                       self.rho_regularization)
             rhonum = rhonum + rho_reg
             rhoden = rhoden + rho_reg
 
@@ -371,6 +381,7 @@ class TrustRegions(Solver):
                     print('')
                 break
 
+        x = problem.to_numpy(x)
         if self._logverbosity <= 0:
             return x
         else:
@@ -382,18 +393,25 @@ class TrustRegions(Solver):
                                       theta, kappa, mininner, maxinner):
         man = problem.manifold
         inner = man.inner
+        lincomb = man.lincomb
         hess = problem.hess
         precon = problem.precon
 
+        # The iterates below are updated in place via lincomb where the
+        # tangent vector representation of the manifold allows it. The
+        # residual r is therefore a private copy of the gradient, and new_eta
+        # and new_Heta are scratch buffers swapped with eta and Heta on
+        # acceptance of a step.
         if not self.use_rand:  # and therefore, eta == 0
             Heta = man.zerovec(x)
-            r = fgradx
+            r = lincomb(x, 1, fgradx)
             e_Pe = 0
         else:  # and therefore, no preconditioner
             # eta (presumably) ~= 0 was provided by the caller.
             Heta = hess(x, eta)
-            r = fgradx + Heta
+            r = lincomb(x, 1, fgradx, 1, Heta)
             e_Pe = inner(x, eta, eta)
+        new_eta = new_Heta = None
 
         r_r = inner(x, r, r)
         norm_r = np.sqrt(r_r)
@@ -410,7 +428,7 @@ class TrustRegions(Solver):
         d_Pd = z_r
 
         # Initial search direction
-        delta = -z
+        delta = lincomb(x, -1, z)
         if not self.use_rand:
             e_Pd = 0
         else:
@@ -460,12 +478,12 @@ class TrustRegions(Solver):
                         np.sqrt(e_Pd * e_Pd +
                                 d_Pd * (Delta ** 2 - e_Pe))) / d_Pd)
 
-                eta = eta + tau * delta
+                eta = lincomb(x, 1, eta, tau, delta, out=eta)
 
                 # If only a nonlinear Hessian approximation is available, this
                 # is only approximately correct, but saves an additional
                 # Hessian call.
-                Heta = Heta + tau * Hdelta
+                Heta = lincomb(x, 1, Heta, tau, Hdelta, out=Heta)
 
                 # Technically, we may want to verify that this new eta is
                 # indeed better than the previous eta before returning it (this
@@ -483,11 +501,11 @@ class TrustRegions(Solver):
 
             # No negative curvature and eta_prop inside TR: accept it.
             e_Pe = e_Pe_new
-            new_eta = eta + alpha * delta
+            new_eta = lincomb(x, 1, eta, alpha, delta, out=new_eta)
 
             # If only a nonlinear Hessian approximation is available, this is
             # only approximately correct, but saves an additional Hessian call.
-            new_Heta = Heta + alpha * Hdelta
+            new_Heta = lincomb(x, 1, Heta, alpha, Hdelta, out=new_Heta)
 
             # Verify that the model cost decreased in going from eta to
             # new_eta. If it did not (which can only occur if the Hessian
@@ -500,12 +518,12 @@ class TrustRegions(Solver):
                 stop_tCG = self.MODEL_INCREASED
                 break
 
-            eta = new_eta
-            Heta = new_Heta
+            eta, new_eta = new_eta, eta
+            Heta, new_Heta = new_Heta, Heta
             model_value = new_model_value
 
             # Update the residual.
-            r = r + alpha * Hdelta
+            r = lincomb(x, 1, r, alpha, Hdelta, out=r)
 
             # Compute new norm of r.
             r_r = inner(x, r, r)
@@ -538,7 +556,7 @@ class TrustRegions(Solver):
 
             # Compute new search direction
             beta = z_r / zold_rold
-            delta = -z + beta * delta
+            delta = lincomb(x, -1, z, beta, delta, out=delta)
 
             # Update new P-norms and P-dots [CGT2000, eq. 7.5.6 & 7.5.7].
             e_Pd = beta * (e_Pd + alpha * d_Pd)
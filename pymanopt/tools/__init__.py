@@ -48,22 +48,51 @@ def flatten_arguments(arguments, signature=None):
     return tuple(flattened_arguments)
 
 
+def make_flattener(signature):
+    """Returns a function which flattens arguments grouped according to
+    `signature`, e.g. `make_flattener((("x", "y"), "z"))(((1, 2), 3))`
+    produces the tuple `(1, 2, 3)`. The signature is analysed once so that
+    the returned function does not inspect the types of the arguments on
+    every call. As elsewhere, a signature consisting of a single group
+    describes arguments which are passed as the group itself.
+    """
+    is_group = [isinstance(group, (list, tuple)) for group in signature]
+    if not any(is_group) or len(signature) == 1:
+        return tuple
+
+    def flatten(arguments):
+        flattened_arguments = []
+        for group, argument in zip(is_group, arguments):
+            if group:
+                flattened_arguments.extend(argument)
+            else:
+                flattened_arguments.append(argument)
+        return tuple(flattened_arguments)
+    return flatten
+
+
 def unpack_arguments(function, signature=None):
     """A decorator which wraps a function accepting a single sequence of
     arguments and calls the function with unpacked arguments. If given, the
     call arguments are unpacked according to the `signature' which is a string
     representation of the argument grouping/nesting, e.g. `(("x", "y"), "z")'.
     """
+    if signature is None:
+        flatten = flatten_arguments
+    else:
+        flatten = make_flattener(signature)
+
     @functools.wraps(function)
     def inner(arguments):
-        return function(*flatten_arguments(arguments, signature=signature))
+        return function(*flatten(arguments))
     return inner
 
 
 def group_return_values(function, signature):
     """Returns a wrapped version of `function` which groups the return values
     of the function in the same way as defined by the signature given by
-    `signature`.
+    `signature`. The indices and slices picking out the groups from the
+    return values are computed once up front.
     """
     if len(signature) == 1:
         @functools.wraps(function)
@@ -71,25 +100,24 @@ def group_return_values(function, signature):
             return function(*args)
         return inner
 
-    group_sizes = []
+    indices = []
+    i = 0
     for element in signature:
-        if isinstance(element, (list, tuple)):
-            group_sizes.append(len(element))
+        n = len(element) if isinstance(element, (list, tuple)) else 1
+        if n == 1:
+            indices.append(i)
         else:
-            group_sizes.append(1)
+            indices.append(slice(i, i + n))
+        i += n
+
+    if all(isinstance(index, int) for index in indices):
+        @functools.wraps(function)
+        def inner(*args):
+            return list(function(*args))
+        return inner
 
     @functools.wraps(function)
     def inner(*args):
-        # TODO(nkoep): This function might be hot. Can we come up with a more
-        #              elegant implementation?
         return_values = function(*args)
-        groups = []
-        i = 0
-        for n in group_sizes:
-            if n == 1:
-                groups.append(return_values[i])
-            else:
-                groups.append(return_values[i:i+n])
-            i += n
-        return groups
+        return [return_values[index] for index in indices]
     return inner
@@ -0,0 +1,163 @@
+"""
+Module containing a finite-difference approximation of the Riemannian
+gradient of cost functions for which no derivatives are available, e.g.,
+costs defined via the `Callable` backend which wrap black-box simulations.
+The approximation allows using first-order solvers such as
+`SteepestDescent` and `ConjugateGradient` with such costs:
+
+    problem = pymanopt.Problem(
+        manifold, cost, grad=FiniteDifferenceGradient(manifold, cost))
+
+Each gradient evaluation requires between `k` and `2 * k` evaluations of the
+cost, where `k` is the number of directions, which are all issued at once.
+"""
+import enum
+
+import numpy as np
+
+
+class FiniteDifferenceTypes(enum.Enum):
+    Forward = 0
+    Central = 1
+    ComplexStep = 2
+
+
+class FiniteDifferenceGradient:
+    """
+    Approximation of the Riemannian gradient of `cost` on `manifold` by
+    finite differences of the cost along an orthonormal set of tangent
+    vectors.
+
+    The directional derivative along a unit tangent vector u at x is
+    approximated by differences of the cost at the retractions R_x(t * u)
+    for a small step t. Given the directional derivatives along k
+    orthonormal tangent vectors u_1, ..., u_k, the gradient is approximated
+    by (dim / k) * sum_i Df(x)[u_i] * u_i. If k equals the dimension of the
+    manifold, the u_i form an orthonormal basis of the tangent space and the
+    approximation is only subject to the error of the finite differences.
+    Otherwise the u_i span a random subspace of the tangent space which is
+    redrawn at every call, and the approximation is a (noisy) unbiased
+    estimate of the gradient if the tangent vectors returned by
+    `manifold.randvec` are isotropically distributed, which is the case for
+    most manifolds.
+
+    Arguments:
+        - manifold
+            Manifold the cost function is defined on.
+        - cost
+            The cost function. If it provides a `batch` method, as functions
+            decorated with one of the autodiff backends do, the cost at all
+            perturbed points is evaluated by a single call of it, which in
+            case of the `Callable` backend evaluates the points concurrently
+            in a pool of threads if the cost is declared thread-safe.
+        - method (FiniteDifferenceTypes.Central)
+            The finite difference scheme: forward differences require
+            k + 1 cost evaluations and have an error of order t, central
+            differences require 2 * k evaluations and have an error of order
+            t ** 2. The complex step method evaluates
+            Im(f(x + i * t * u)) / t, which requires k evaluations and does
+            not suffer from cancellation, so the derivatives are accurate to
+            machine precision. It requires the cost to be defined on complex
+            arrays of the ambient space of the manifold and to be real
+            analytic, and the manifold to be a real submanifold of a
+            Euclidean space.
+        - num_directions (None)
+            Number of tangent directions k. Defaults to the dimension of the
+            manifold.
+        - step (None)
+            The step size t. Defaults to a multiple of the typical distance
+            on the manifold, with a factor chosen according to the method
+            and the machine epsilon of the dtype of the manifold.
+        - executor (None)
+            A `concurrent.futures.Executor` used to evaluate the cost at the
+            perturbed points instead of `cost.batch`, e.g., a
+            `ProcessPoolExecutor` for costs which hold the GIL or are not
+            thread-safe. The cost must then be picklable.
+    """
+
+    def __init__(self, manifold, cost, method=FiniteDifferenceTypes.Central,
+                 num_directions=None, step=None, executor=None):
+        if not isinstance(method, FiniteDifferenceTypes):
+            raise ValueError(
+                "Unknown finite difference method '{}'".format(method))
+        if num_directions is None:
+            num_directions = manifold.dim
+        if not 0 < num_directions <= manifold.dim:
+            raise ValueError(
+                "Number of directions must be between 1 and the dimension of "
+                "the manifold")
+        self._manifold = manifold
+        self._cost = cost
+        self._method = method
+        self._num_directions = num_directions
+        self._step = step
+        self._executor = executor
+
+    @property
+    def step(self):
+        if self._step is None:
+            try:
+                typicaldist = self._manifold.typicaldist
+            except NotImplementedError:
+                typicaldist = 1.0
+            eps = np.finfo(self._manifold.dtype).eps
+            if self._method == FiniteDifferenceTypes.Forward:
+                factor = np.sqrt(eps)
+            elif self._method == FiniteDifferenceTypes.Central:
+                factor = np.cbrt(eps)
+            else:
+                factor = eps
+            self._step = factor * typicaldist
+        return self._step
+
+    def _evaluate(self, points):
+        if self._executor is not None:
+            return np.array(list(self._executor.map(self._cost, points)))
+        cost_batch = getattr(self._cost, "batch", None)
+        if cost_batch is not None:
+            return np.asarray(cost_batch(points))
+        return np.array([self._cost(point) for point in points])
+
+    def _directions(self, x):
+        """Returns a list of `num_directions` orthonormal tangent vectors at
+        `x` obtained by orthonormalizing random tangent vectors.
+        """
+        manifold = self._manifold
+        directions = []
+        for _ in range(2 * self._num_directions):
+            if len(directions) == self._num_directions:
+                break
+            u = manifold.randvec(x)
+            # Orthogonalize twice to retain orthogonality in finite precision.
+            for _ in range(2):
+                for v in directions:
+                    u = u - manifold.inner(x, v, u) * v
+            norm = manifold.norm(x, u)
+            if norm > np.sqrt(np.finfo(manifold.dtype).eps):
+                directions.append(u / norm)
+        return directions
+
+    def _derivatives(self, x, directions):
+        manifold = self._manifold
+        t = self.step
+        if self._method == FiniteDifferenceTypes.ComplexStep:
+            values = self._evaluate([t * 1j * u + x for u in directions])
+            return np.imag(values) / t
+        if self._method == FiniteDifferenceTypes.Forward:
+            values = self._evaluate(
+                [x] + [manifold.retr(x, t * u) for u in directions])
+            return (values[1:] - values[0]) / t
+        values = self._evaluate(
+            [manifold.retr(x, t * u) for u in directions] +
+            [manifold.retr(x, -t * u) for u in directions])
+        k = len(directions)
+        return (values[:k] - values[k:]) / (2 * t)
+
+    def __call__(self, x):
+        directions = self._directions(x)
+        derivatives = self._derivatives(x, directions)
+        scale = self._manifold.dim / len(directions)
+        gradient = self._manifold.zerovec(x)
+        for derivative, u in zip(derivatives, directions):
+            gradient = gradient + (scale * derivative) * u
+        return gradient
@@ -0,0 +1,44 @@
+"""
+Module containing factories of quadratic cost functions together with their
+Euclidean derivatives, which only ever multiply the matrix defining the
+quadratic form with vectors.
+"""
+import numpy as np
+import scipy.sparse
+
+from pymanopt.autodiff.backends import Callable
+
+
+def hermitian_quadratic_cost(C):
+    """
+    Returns the cost f(z) = z^H C z of a Hermitian n x n matrix C together
+    with its Euclidean gradient 2 C z and Hessian u -> 2 C u with respect to
+    the real inner product Re(u^H v) of C^n, e.g., for phase synchronization
+    on ComplexCircle(n). The triple can be passed on to pymanopt.Problem as
+
+        Problem(manifold, *hermitian_quadratic_cost(C)).
+
+    C may be a dense array or a scipy.sparse matrix, which is converted to
+    CSR format unless it is in CSR or CSC format already. Only products of C
+    with vectors are ever computed, so that no n x n matrix is formed.
+    """
+    if scipy.sparse.issparse(C) and C.format not in ("csr", "csc"):
+        C = C.tocsr()
+
+    @Callable
+    def cost(z):
+        return np.vdot(z, C.dot(z)).real
+
+    @Callable
+    def egrad(z):
+        Cz = C.dot(z)
+        Cz *= 2
+        return Cz
+
+    @Callable
+    def ehess(z, u):
+        Cu = C.dot(u)
+        Cu *= 2
+        return Cu
+
+    return cost, egrad, ehess
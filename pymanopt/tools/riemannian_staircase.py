@@ -0,0 +1,223 @@
+# References:
+#     @InProceedings{boumal2016bm,
+#       Title     = {The non-convex {B}urer-{M}onteiro approach works on
+#                    smooth semidefinite programs},
+#       Author    = {Boumal, N. and Voroninski, V. and Bandeira, A. S.},
+#       Booktitle = {Advances in Neural Information Processing Systems},
+#       Year      = {2016},
+#       Pages     = {2757--2765}
+#     }
+#
+#     @Article{journee2010lowrank,
+#       Title   = {Low-rank optimization on the cone of positive
+#                  semidefinite matrices},
+#       Author  = {Journee, M. and Bach, F. and Absil, P.-A. and
+#                  Sepulchre, R.},
+#       Journal = {SIAM Journal on Optimization},
+#       Year    = {2010},
+#       Number  = {5},
+#       Pages   = {2327--2351},
+#       Volume  = {20}
+#     }
+
+import time
+
+import numpy as np
+import scipy.sparse
+from scipy.sparse.linalg import LinearOperator, eigsh
+
+import pymanopt
+from pymanopt.manifolds import Elliptope, PSDFixedRank
+from pymanopt.solvers.trust_regions import TrustRegions
+
+
+class RiemannianStaircase:
+    """
+    Riemannian staircase for semidefinite programs of the form
+
+        min_X <C, X> + mu / 2 * ||X||_F^2  s.t.  X psd (and diag(X) = 1),
+
+    where C is a symmetric n x n matrix. The program is solved via the
+    Burer-Monteiro factorization X = Y Y^T with Y of size n x k, starting from
+    a small rank k. At each step of the staircase, the factorized problem is
+    solved on Elliptope(n, k) if the diagonal of X is constrained to be one
+    (as in MaxCut relaxations) and on PSDFixedRank(n, k) otherwise. The
+    solver of each step is warm-started at the final iterate of the previous
+    one.
+
+    A second-order critical point Y is globally optimal if the dual
+    certificate S, i.e., the Euclidean gradient C + mu * X of the cost
+    shifted by the Lagrange multipliers of the diagonal constraints, is
+    positive semidefinite. Otherwise, the eigenvector of S to its smallest
+    eigenvalue is appended to Y as a new column, which is a direction of
+    negative curvature of the cost in rank k + 1, and the staircase climbs to
+    the next step.
+
+    The matrix C may be a dense array or a scipy.sparse matrix. Neither X nor
+    S are ever formed, so that, besides C, only O(n * k) memory is used.
+
+    Unlike the solvers in `pymanopt.solvers`, the staircase does not solve a
+    given `Problem` but sets up the problems of its steps from C and mu.
+    """
+
+    def __init__(self, solver=None, rank=2, maxrank=None, tolerance=1e-6,
+                 maxbacktracks=30, logverbosity=0):
+        """
+        Variable attributes (defaults in brackets):
+            - solver (TrustRegions())
+                Solver used at each step of the staircase. It must return
+                only the final iterate, i.e., run with logverbosity 0.
+            - rank (2)
+                Rank k of the factorization at the first step.
+            - maxrank (None)
+                Largest rank to climb to. Defaults to n.
+            - tolerance (1e-6)
+                A point is accepted as optimal if the smallest eigenvalue of
+                the dual certificate is no less than -tolerance.
+            - maxbacktracks (30)
+                Maximum number of times the step along the direction of
+                negative curvature is halved when climbing to the next rank.
+            - logverbosity (0)
+                Level of information logged by the staircase, 0 is silent, 1
+                returns a log of the steps along with the solution.
+        """
+        if solver is None:
+            solver = TrustRegions()
+        self._solver = solver
+        self._rank = rank
+        self._maxrank = maxrank
+        self._tolerance = tolerance
+        self._maxbacktracks = maxbacktracks
+        self._logverbosity = logverbosity
+
+    def __str__(self):
+        return type(self).__name__
+
+    def solve(self, C, mu=0, unit_diagonal=True, x=None, verbosity=2):
+        """
+        Solves the semidefinite program with cost matrix C and returns the
+        factor Y of the solution X = Y Y^T. If an initial factor x is given,
+        the staircase starts at its rank. The verbosity is passed on to the
+        problems solved at each step.
+        """
+        n = C.shape[0]
+        if C.shape != (n, n):
+            raise ValueError("The cost matrix must be square")
+        if not unit_diagonal and mu <= 0:
+            raise ValueError(
+                "The cost is unbounded below on the cone of positive "
+                "semidefinite matrices unless mu > 0")
+        if scipy.sparse.issparse(C):
+            C = C.tocsr()
+        if unit_diagonal:
+            manifold_class = Elliptope
+        else:
+            manifold_class = PSDFixedRank
+
+        maxrank = n if self._maxrank is None else min(self._maxrank, n)
+        Y = x
+        rank = self._rank if Y is None else Y.shape[1]
+        time0 = time.time()
+        steps = {"rank": [], "f(x)": [], "mineigval": []}
+
+        while True:
+            manifold = manifold_class(n, rank)
+            problem = self._make_problem(manifold, C, mu, verbosity)
+            Y = self._solver.solve(problem, x=Y)
+            fY = problem.cost(Y)
+            mineigval, direction = self._certificate(C, mu, Y, unit_diagonal)
+
+            steps["rank"].append(rank)
+            steps["f(x)"].append(fY)
+            steps["mineigval"].append(mineigval)
+            if verbosity >= 1:
+                print("Rank {:d}: f(x) = {:+.8e}, min. eigenvalue of "
+                      "certificate = {:+.3e}".format(rank, fY, mineigval))
+
+            if mineigval >= -self._tolerance:
+                stop_reason = ("Terminated - certified optimal at rank "
+                               "{:d}".format(rank))
+                break
+            if rank >= maxrank:
+                stop_reason = ("Terminated - max rank {:d} reached without "
+                               "certificate".format(rank))
+                break
+
+            rank += 1
+            Y = self._escape(manifold_class(n, rank), problem.cost, Y,
+                             direction)
+
+        if verbosity >= 1:
+            print(stop_reason)
+            print('')
+        if self._logverbosity <= 0:
+            return Y
+        optlog = {
+            "solver": str(self),
+            "stoppingreason": stop_reason,
+            "final_values": {"x": Y, "f(x)": fY, "rank": rank,
+                             "mineigval": mineigval,
+                             "time": time.time() - time0},
+            "steps": steps
+        }
+        return Y, optlog
+
+    @staticmethod
+    def _make_problem(manifold, C, mu, verbosity):
+        @pymanopt.function.Callable
+        def cost(Y):
+            return np.sum(C.dot(Y) * Y) + mu / 2 * np.sum(Y.T.dot(Y) ** 2)
+
+        @pymanopt.function.Callable
+        def egrad(Y):
+            return 2 * C.dot(Y) + 2 * mu * Y.dot(Y.T.dot(Y))
+
+        @pymanopt.function.Callable
+        def ehess(Y, U):
+            return 2 * C.dot(U) + 2 * mu * (
+                U.dot(Y.T.dot(Y)) + Y.dot(U.T.dot(Y) + Y.T.dot(U)))
+
+        return pymanopt.Problem(manifold, cost, egrad=egrad, ehess=ehess,
+                                verbosity=verbosity)
+
+    @staticmethod
+    def _certificate(C, mu, Y, unit_diagonal):
+        """Returns the smallest eigenvalue of the dual certificate at Y and a
+        corresponding unit-norm eigenvector.
+        """
+        n = Y.shape[0]
+        if unit_diagonal:
+            multipliers = np.sum((C.dot(Y) + mu * Y.dot(Y.T.dot(Y))) * Y,
+                                 axis=1)
+        else:
+            multipliers = np.zeros(n, dtype=Y.dtype)
+
+        def matvec(v):
+            v = np.ravel(v)
+            return C.dot(v) + mu * Y.dot(Y.T.dot(v)) - multipliers * v
+
+        certificate = LinearOperator((n, n), matvec=matvec, dtype=Y.dtype)
+        # The columns of Y span an (almost) null space of the certificate at
+        # critical points, so the Lanczos basis is enlarged with the rank to
+        # resolve the smallest eigenvalue next to this cluster.
+        ncv = min(n, 2 * Y.shape[1] + 40)
+        eigvals, eigvecs = eigsh(certificate, k=1, which="SA", ncv=ncv)
+        return eigvals[0], eigvecs[:, 0]
+
+    def _escape(self, manifold, cost, Y, direction):
+        """Appends a zero column to Y and moves away from the resulting point
+        on the manifold of rank one higher along the direction of negative
+        curvature in the new column until the cost decreases. If none of the
+        steps decreases the cost, the padded point itself is returned.
+        """
+        Y0 = np.hstack((Y, np.zeros((Y.shape[0], 1), dtype=Y.dtype)))
+        U = np.zeros_like(Y0)
+        U[:, -1] = direction
+        f0 = cost(Y0)
+        stepsize = 1
+        for _ in range(self._maxbacktracks):
+            Y = manifold.retr(Y0, stepsize * U)
+            if cost(Y) < f0:
+                return Y
+            stepsize /= 2
+        return Y0
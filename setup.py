@@ -1,4 +1,5 @@
 import os
+import re
 import runpy
 from itertools import chain
 
@@ -6,7 +7,13 @@ from setuptools import find_packages, setup
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-OPTIONAL_DEPENDENCIES = ("autograd", "tensorflow", "theano")
+# Maps the names of the extras to the packages they install.
+OPTIONAL_DEPENDENCIES = {
+    "autograd": ("autograd",),
+    "jax": ("jax", "jaxlib"),
+    "tensorflow": ("tensorflow",),
+    "theano": ("theano",)
+}
 
 
 def parse_requirements_file(filename):
@@ -21,9 +28,12 @@ if __name__ == "__main__":
     optional_dependencies = {}
     for requirement in requirements:
         # We manually separate out hard from optional dependencies.
-        if any((d in requirement for d in OPTIONAL_DEPENDENCIES)):
-            package = requirement.split(">")[0].split("=")[0]
-            optional_dependencies[package] = [requirement]
+        package = re.split(r"[\s<>=!~;]", requirement, maxsplit=1)[0]
+        for extra, packages in OPTIONAL_DEPENDENCIES.items():
+            if package in packages:
+                optional_dependencies.setdefault(extra, []).append(
+                    requirement)
+                break
         else:
             install_requires.append(requirement)
 
@@ -62,7 +72,7 @@ if __name__ == "__main__":
         ],
         keywords=("optimization,manifold optimization,"
                   "automatic differentiation,machine learning,numpy,scipy,"
-                  "theano,autograd,tensorflow"),
+                  "theano,autograd,tensorflow,jax"),
         packages=find_packages(exclude=["tests"]),
         install_requires=install_requires,
         extras_require=extras_require,
@@ -3,6 +3,9 @@ import unittest
 import numpy as np
 from numpy import random as rnd, testing as np_testing
 
+import pymanopt
+from pymanopt.manifolds import Stiefel
+
 
 class TestUnaryFunction(unittest.TestCase):
     """Test cost function, gradient and Hessian for a simple unary function.
@@ -192,6 +195,11 @@ class TestVector(unittest.TestCase):
         # Now test hess
         np_testing.assert_allclose(self.correct_hess, hess(self.Y, self.A))
 
+    def test_batch(self):
+        Ys = rnd.randn(3, self.n)
+        np_testing.assert_allclose(
+            [np.exp(np.sum(Y ** 2)) for Y in Ys], self.cost.batch(Ys))
+
 
 class TestMatrix(unittest.TestCase):
     def setUp(self):
@@ -368,3 +376,73 @@ class TestMixed(unittest.TestCase):
         h = hess(self.y, self.a)
         for k in range(len(h)):
             np_testing.assert_allclose(self.correct_hess[k], h[k])
+
+
+class TestDataBinding(unittest.TestCase):
+    """Test that rebinding the data of a cost function defined on a
+    graph-based backend changes the cost, gradient and Hessian accordingly.
+    The cost is x' * A * x for a data matrix A.
+    """
+
+    def setUp(self):
+        self.n = 10
+        self.A = rnd.randn(self.n, self.n)
+        self.cost = None
+
+    def _test_functions(self, A):
+        cost = self.cost
+        egrad = cost.compute_gradient()
+        ehess = cost.compute_hessian()
+        x = rnd.randn(self.n)
+        u = rnd.randn(self.n)
+        self.assertAlmostEqual(x.dot(A).dot(x), cost(x))
+        np_testing.assert_allclose((A + A.T).dot(x), egrad(x))
+        np_testing.assert_allclose((A + A.T).dot(u), ehess(x, u))
+
+    def test_bind(self):
+        assert self.cost is not None
+        self._test_functions(self.A)
+        B = rnd.randn(self.n, self.n)
+        self.cost.bind(A=B)
+        self._test_functions(B)
+
+    def test_bind_unknown_name(self):
+        with self.assertRaises(ValueError):
+            self.cost.bind(B=self.A)
+
+
+class TestRiemannianDerivatives(unittest.TestCase):
+    """Test that the Riemannian gradient and Hessian of a problem whose
+    conversions egrad2rgrad and ehess2rhess are evaluated by the backend agree
+    with the conversions evaluated in numpy. The cost is trace(X' * A * X) on
+    the Stiefel manifold for a symmetric matrix A.
+    """
+
+    def setUp(self):
+        self.n = 10
+        self.p = 3
+        A = rnd.randn(self.n, self.n)
+        self.A = A + A.T
+        self.manifold = Stiefel(self.n, self.p)
+        self.cost = None
+
+    def test_fused_conversions(self):
+        assert self.cost is not None
+        manifold = self.manifold
+        problem = pymanopt.Problem(manifold, self.cost, fuse_conversions=True)
+        x = manifold.rand()
+        u = manifold.randvec(x)
+        egrad = 2 * self.A.dot(x)
+        ehess = 2 * self.A.dot(u)
+        np_testing.assert_allclose(manifold.egrad2rgrad(x, egrad),
+                                   problem.grad(x))
+        np_testing.assert_allclose(
+            manifold.ehess2rhess(x, egrad, ehess, u), problem.hess(x, u))
+
+        # Derivatives computed at the point of the last gradient evaluation
+        # must not be reused at other points.
+        y = manifold.rand()
+        v = manifold.randvec(y)
+        np_testing.assert_allclose(
+            manifold.ehess2rhess(y, 2 * self.A.dot(y), 2 * self.A.dot(v), v),
+            problem.hess(y, v))
@@ -1,4 +1,5 @@
 import autograd.numpy as np
+from numpy import random as rnd, testing as np_testing
 
 from pymanopt.function import Autograd
 from . import _backend_tests
@@ -80,3 +81,41 @@ class TestMixed(_backend_tests.TestMixed):
                     np.exp(np.sum(z ** 2)))
 
         self.cost = cost
+
+
+class TestHessianVectorProducts(_backend_tests.TestVector):
+    def setUp(self):
+        super().setUp()
+
+        @Autograd
+        def cost(X):
+            return np.exp(np.sum(X ** 2))
+
+        self.cost = cost
+
+    def test_repeated_vectors(self):
+        hess = self.cost.compute_hessian()
+        Y = self.Y.copy()
+        for _ in range(3):
+            A = rnd.randn(self.n)
+            np_testing.assert_allclose(
+                np.exp(np.sum(Y ** 2)) * (4 * Y * Y.dot(A) + 2 * A),
+                hess(Y, A))
+
+        # Modifying the point in place must invalidate the cached graph.
+        Y /= 2
+        np_testing.assert_allclose(
+            np.exp(np.sum(Y ** 2)) * (4 * Y * Y.dot(self.A) + 2 * self.A),
+            hess(Y, self.A))
+
+
+class TestRiemannianDerivatives(_backend_tests.TestRiemannianDerivatives):
+    def setUp(self):
+        super().setUp()
+        A = self.A
+
+        @Autograd
+        def cost(X):
+            return np.trace(X.T @ A @ X)
+
+        self.cost = cost
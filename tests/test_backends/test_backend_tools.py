@@ -1,6 +1,9 @@
+import subprocess
+import sys
 import unittest
 
-from pymanopt.tools import flatten_arguments
+from pymanopt.tools import (flatten_arguments, group_return_values,
+                            make_flattener)
 
 
 class TestArgumentFlattening(unittest.TestCase):
@@ -25,3 +28,38 @@ class TestArgumentFlattening(unittest.TestCase):
     def test_nested_arguments(self):
         arguments = (("x", "y"), "z")
         self._test_flatten_arguments(arguments, ("x", "y", "z"))
+
+    def test_flattener(self):
+        self.assertEqual(make_flattener(("x",))((1,)), (1,))
+        self.assertEqual(make_flattener(("x", "y"))((1, 2)), (1, 2))
+        self.assertEqual(make_flattener((("x", "y"),))((1, 2)), (1, 2))
+        flatten = make_flattener((("x", "y"), "z", ("u", "v")))
+        self.assertEqual(flatten(((1, 2), 3, [4, 5])), (1, 2, 3, 4, 5))
+
+
+class TestReturnValueGrouping(unittest.TestCase):
+    def test_single_group(self):
+        function = group_return_values(lambda x: x, (("x", "y"),))
+        self.assertEqual(function([1, 2]), [1, 2])
+
+    def test_unary_arguments(self):
+        function = group_return_values(lambda x: x, ("x", "y", "z"))
+        self.assertEqual(function((1, 2, 3)), [1, 2, 3])
+
+    def test_nested_arguments(self):
+        function = group_return_values(
+            lambda x: x, (("x", "y"), "z", ("u", "v")))
+        self.assertEqual(function([1, 2, 3, 4, 5]), [[1, 2], 3, [4, 5]])
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_pymanopt(self):
+        # Importing pymanopt must not import any of the autodiff frameworks,
+        # which only happens once a backend is used for the first time.
+        frameworks = ("autograd", "jax", "tensorflow", "theano", "torch")
+        code = (
+            "import sys; import pymanopt; "
+            "print(','.join(sorted(set(name.split('.')[0] "
+            "for name in sys.modules) & set({!r}))))".format(frameworks))
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.decode().strip(), "")
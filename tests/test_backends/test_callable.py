@@ -0,0 +1,49 @@
+import threading
+import unittest
+
+import numpy as np
+from numpy import random as rnd, testing as np_testing
+
+from pymanopt.function import Callable
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        @Callable
+        def cost(X):
+            return np.exp(np.sum(X ** 2))
+
+        self.cost = cost
+
+    def test_batch(self):
+        Xs = rnd.randn(5, 4, 3)
+        np_testing.assert_allclose(
+            [np.exp(np.sum(X ** 2)) for X in Xs], self.cost.batch(Xs))
+        np_testing.assert_allclose(
+            [np.exp(np.sum(Xs[0] ** 2))], self.cost.batch(list(Xs[:1])))
+
+    def test_sequential_by_default(self):
+        threads = set()
+
+        @Callable
+        def cost(X):
+            threads.add(threading.get_ident())
+            return np.sum(X)
+
+        Xs = rnd.randn(20, 4)
+        np_testing.assert_allclose(cost.batch(Xs), Xs.sum(axis=1))
+        self.assertEqual(threads, {threading.get_ident()})
+
+    def test_threadsafe(self):
+        @Callable(threadsafe=True)
+        def cost(X):
+            return np.exp(np.sum(X ** 2))
+
+        Xs = rnd.randn(20, 4, 3)
+        np_testing.assert_allclose(
+            cost.batch(Xs), [np.exp(np.sum(X ** 2)) for X in Xs])
+        np_testing.assert_allclose(cost(Xs[0]), np.exp(np.sum(Xs[0] ** 2)))
+
+    def test_no_autodiff(self):
+        with self.assertRaises(NotImplementedError):
+            self.cost.compute_gradient()
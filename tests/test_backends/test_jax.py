@@ -0,0 +1,148 @@
+import unittest
+
+import jax
+import jax.numpy as np
+import numpy as onp
+
+from pymanopt.function import Jax
+from . import _backend_tests
+
+# The tests evaluate the backend at double precision points.
+jax.config.update("jax_enable_x64", True)
+
+
+class TestUnaryFunction(_backend_tests.TestUnaryFunction):
+    def setUp(self):
+        super().setUp()
+
+        @Jax
+        def cost(x):
+            return np.sum(x ** 2)
+
+        self.cost = cost
+
+
+class TestNaryFunction(_backend_tests.TestNaryFunction):
+    def setUp(self):
+        super().setUp()
+
+        @Jax
+        def cost(x, y):
+            return np.dot(x, y)
+
+        self.cost = cost
+
+
+class TestNaryParameterGrouping(_backend_tests.TestNaryParameterGrouping):
+    def setUp(self):
+        super().setUp()
+
+        @Jax(("x", "y"), "z")
+        def cost(x, y, z):
+            return np.sum(x ** 2 + y + z ** 3)
+
+        self.cost = cost
+
+
+class TestVector(_backend_tests.TestVector):
+    def setUp(self):
+        super().setUp()
+
+        @Jax
+        def cost(X):
+            return np.exp(np.sum(X ** 2))
+
+        self.cost = cost
+
+
+class TestMatrix(_backend_tests.TestMatrix):
+    def setUp(self):
+        super().setUp()
+
+        @Jax
+        def cost(X):
+            return np.exp(np.sum(X ** 2))
+
+        self.cost = cost
+
+
+class TestTensor3(_backend_tests.TestTensor3):
+    def setUp(self):
+        super().setUp()
+
+        @Jax
+        def cost(X):
+            return np.exp(np.sum(X ** 2))
+
+        self.cost = cost
+
+
+class TestMixed(_backend_tests.TestMixed):
+    def setUp(self):
+        super().setUp()
+
+        @Jax
+        def cost(x, y, z):
+            return (np.exp(np.sum(x ** 2)) + np.exp(np.sum(y ** 2)) +
+                    np.exp(np.sum(z ** 2)))
+
+        self.cost = cost
+
+
+class TestRiemannianDerivatives(_backend_tests.TestRiemannianDerivatives):
+    def setUp(self):
+        super().setUp()
+        A = self.A
+
+        @Jax
+        def cost(X):
+            return np.trace(X.T @ A @ X)
+
+        self.cost = cost
+
+
+class TestPrecision(unittest.TestCase):
+    def test_x64_disabled(self):
+        @Jax
+        def cost(x):
+            return np.sum(x ** 2)
+
+        egrad = cost.compute_gradient()
+        ehess = cost.compute_hessian()
+        x = onp.ones(3)
+        jax.config.update("jax_enable_x64", False)
+        try:
+            # Double precision points are evaluated in single precision with
+            # a warning, and the results are of the type of the points.
+            with self.assertWarns(UserWarning):
+                self.assertAlmostEqual(cost(x), 3)
+            with self.assertWarns(UserWarning):
+                g = egrad(x)
+            self.assertEqual(g.dtype, onp.float64)
+            onp.testing.assert_allclose(g, 2 * x)
+            with self.assertWarns(UserWarning):
+                h = ehess(x, x)
+            self.assertEqual(h.dtype, onp.float64)
+            onp.testing.assert_allclose(h, 2 * x)
+            x = x.astype(onp.float32)
+            self.assertAlmostEqual(cost(x), 3)
+            g = egrad(x)
+            self.assertEqual(g.dtype, onp.float32)
+            onp.testing.assert_allclose(g, 2 * x)
+        finally:
+            jax.config.update("jax_enable_x64", True)
+
+    def test_value_reuse(self):
+        # The value computed along with the gradient is reused for the same
+        # point object only.
+        @Jax
+        def cost(x):
+            return np.sum(x ** 2)
+
+        egrad = cost.compute_gradient()
+        x = onp.ones(3)
+        egrad(x)
+        self.assertEqual(cost(x), 3)
+        y = x.copy()
+        y[0] = 2
+        self.assertEqual(cost(y), 6)
@@ -1,6 +1,13 @@
+import unittest
+
+import numpy as np
 import torch
+from numpy import random as rnd, testing as np_testing
 
+import pymanopt
 from pymanopt.function import PyTorch
+from pymanopt.manifolds import Euclidean, Product, Sphere, Stiefel
+from pymanopt.solvers import ConjugateGradient, SteepestDescent, TrustRegions
 from . import _backend_tests
 
 
@@ -81,3 +88,169 @@ class TestMixed(_backend_tests.TestMixed):
                     torch.exp(torch.sum(z ** 2)))
 
         self.cost = cost
+
+
+class TestHessianVectorProducts(_backend_tests.TestVector):
+    def setUp(self):
+        super().setUp()
+
+        @PyTorch
+        def cost(X):
+            return torch.exp(torch.sum(X ** 2))
+
+        self.cost = cost
+
+    def _correct_hess(self, Y, A):
+        return np.exp(np.sum(Y ** 2)) * (4 * Y * Y.dot(A) + 2 * A)
+
+    def test_repeated_vectors(self):
+        hess = self.cost.compute_hessian()
+        Y = self.Y.copy()
+        for _ in range(3):
+            A = rnd.randn(self.n)
+            np_testing.assert_allclose(self._correct_hess(Y, A), hess(Y, A))
+
+        # Modifying the point in place must invalidate the cached graph.
+        Y /= 2
+        np_testing.assert_allclose(self._correct_hess(Y, self.A),
+                                   hess(Y, self.A))
+
+    def test_batched_vectors(self):
+        hess = self.cost.compute_hessian()
+        A = rnd.randn(4, self.n)
+        H = hess(self.Y, A)
+        self.assertEqual(H.shape, A.shape)
+        for Ai, Hi in zip(A, H):
+            np_testing.assert_allclose(self._correct_hess(self.Y, Ai), Hi)
+
+
+class TestUnusedArguments(unittest.TestCase):
+    def test_zero_gradients(self):
+        @PyTorch
+        def cost(x, y):
+            return torch.sum(x ** 2)
+
+        n = 5
+        egrad = cost.compute_gradient()
+        x = rnd.randn(n)
+        g_x, g_y = egrad((x, rnd.randn(n)))
+        np_testing.assert_allclose(g_x, 2 * x)
+        np_testing.assert_array_equal(g_y, np.zeros(n))
+
+    def test_trust_regions(self):
+        # The randomized trust-region method updates Hessian-vector products
+        # in place, including the zero products of the unused argument.
+        @PyTorch
+        def cost(x, y):
+            return torch.sum(torch.exp(x) - x)
+
+        manifold = Product([Euclidean(3), Euclidean(2)])
+        problem = pymanopt.Problem(manifold, cost, verbosity=0)
+        x, y = TrustRegions(use_rand=True).solve(problem)
+        np_testing.assert_allclose(x, np.zeros(3), atol=1e-6)
+        u = manifold.randvec((x, y))
+        np_testing.assert_array_equal(problem.hess((x, y), u)[1], np.zeros(2))
+
+
+class TestRiemannianDerivatives(_backend_tests.TestRiemannianDerivatives):
+    def setUp(self):
+        super().setUp()
+        A = torch.from_numpy(self.A)
+
+        @PyTorch
+        def cost(X):
+            return torch.trace(X.t() @ A @ X)
+
+        self.cost = cost
+
+
+class TestPersistentTensors(unittest.TestCase):
+    def setUp(self):
+        n = 8
+        p = 3
+        A = rnd.randn(n, n)
+        A = torch.from_numpy(0.5 * (A + A.T))
+        N = torch.from_numpy(np.diag(np.arange(1, p + 1, dtype=float)))
+
+        @PyTorch
+        def cost(X):
+            return torch.trace(X.t() @ A @ X @ N)
+
+        self.cost = cost
+        self.manifold = manifold = Stiefel(n, p)
+        self.x0 = manifold.rand()
+
+        # Record the types of the iterates passed to the manifold by solvers.
+        self.types = set()
+        retr = manifold.retr
+
+        def recording_retr(X, G):
+            self.types.add(type(X))
+            return retr(X, G)
+        manifold.retr = recording_retr
+
+    def _solve(self, solver, persistent_tensors):
+        problem = pymanopt.Problem(self.manifold, self.cost, verbosity=0,
+                                   persistent_tensors=persistent_tensors)
+        return solver.solve(problem, x=self.x0)
+
+    def _test_solver(self, solver):
+        # Few iterations are run so that the iterates of both modes agree up
+        # to round-off, which grows over long runs on this problem.
+        x = self._solve(solver, False)
+        self.assertEqual(self.types, {np.ndarray})
+        self.types.clear()
+        x_tensors = self._solve(solver, True)
+        self.assertEqual(self.types, {torch.Tensor})
+        self.assertIsInstance(x_tensors, np.ndarray)
+        np_testing.assert_allclose(x_tensors, x, atol=1e-8)
+
+    def test_steepest_descent(self):
+        self._test_solver(SteepestDescent(maxiter=10))
+
+    def test_conjugate_gradient(self):
+        self._test_solver(ConjugateGradient(maxiter=10))
+
+    def test_trust_regions(self):
+        self._test_solver(TrustRegions(maxiter=20))
+
+    def test_unsupported_manifold(self):
+        @PyTorch
+        def cost(x, y):
+            return torch.sum(x ** 2) + torch.sum(y ** 2)
+
+        manifold = Product([Euclidean(3), Euclidean(2)])
+        with self.assertRaises(ValueError):
+            pymanopt.Problem(manifold, cost, persistent_tensors=True)
+
+    def test_unsupported_cost(self):
+        with self.assertRaises(ValueError):
+            pymanopt.Problem(self.manifold, lambda X: 0.0,
+                             persistent_tensors=True)
+
+    def test_manifold_operations(self):
+        # The tensor branches of the manifolds agree with their numpy
+        # counterparts.
+        for manifold in (Euclidean(4, 2), Sphere(4, 2), self.manifold):
+            x = manifold.rand()
+            u = manifold.randvec(x)
+            v = manifold.randvec(x)
+            e = rnd.randn(*x.shape)
+            x_t, u_t, v_t, e_t = map(torch.from_numpy, (x, u, v, e))
+            np_testing.assert_allclose(manifold.inner(x_t, u_t, v_t),
+                                       manifold.inner(x, u, v))
+            np_testing.assert_allclose(manifold.norm(x_t, u_t),
+                                       manifold.norm(x, u))
+            np_testing.assert_allclose(manifold.proj(x_t, e_t).numpy(),
+                                       manifold.proj(x, e))
+            np_testing.assert_allclose(manifold.retr(x_t, u_t).numpy(),
+                                       manifold.retr(x, u))
+            np_testing.assert_allclose(
+                manifold.ehess2rhess(x_t, e_t, v_t, u_t).numpy(),
+                manifold.ehess2rhess(x, e, v, u))
+            np_testing.assert_array_equal(manifold.zerovec(x_t).numpy(),
+                                          np.zeros_like(x))
+            w = manifold.randvec(x_t)
+            self.assertIsInstance(w, torch.Tensor)
+            np_testing.assert_allclose(manifold.proj(x, w.numpy()),
+                                       w.numpy(), atol=1e-12)
@@ -72,6 +72,69 @@ class TestVector(_backend_tests.TestVector):
         self.cost = cost
 
 
+class TestFusedDerivatives(unittest.TestCase):
+    def test_cost_after_gradient(self):
+        n = 10
+
+        x = tf.Variable(tf.zeros(n, dtype=np.float64))
+
+        @TensorFlow(x)
+        def cost(x):
+            return tf.reduce_sum(x ** 2)
+
+        egrad = cost.compute_gradient()
+        y = rnd.randn(n)
+        np.testing.assert_allclose(egrad(y), 2 * y)
+        self.assertAlmostEqual(cost(y), np.sum(y ** 2))
+        y /= 2
+        self.assertAlmostEqual(cost(y), np.sum(y ** 2))
+
+    def test_gradient_after_hessian(self):
+        n = 10
+        num_calls = [0]
+
+        class CountingSession(tf.Session):
+            def make_callable(self, *args, **kwargs):
+                run = super().make_callable(*args, **kwargs)
+
+                def counting_run(*args):
+                    num_calls[0] += 1
+                    return run(*args)
+                return counting_run
+
+        x = tf.Variable(tf.zeros(n, dtype=np.float64))
+
+        @TensorFlow(x, session=CountingSession())
+        def cost(x):
+            return tf.reduce_sum(x ** 3)
+
+        egrad = cost.compute_gradient()
+        ehess = cost.compute_hessian()
+        y = rnd.randn(n)
+        u = rnd.randn(n)
+        np.testing.assert_allclose(ehess(y, u), 6 * y * u)
+        self.assertEqual(num_calls[0], 1)
+        # The gradient is fetched along with the Hessian-vector product.
+        np.testing.assert_allclose(egrad(y), 3 * y ** 2)
+        self.assertEqual(num_calls[0], 1)
+        y /= 2
+        np.testing.assert_allclose(egrad(y), 3 * y ** 2)
+        self.assertEqual(num_calls[0], 2)
+
+
+class TestDataBinding(_backend_tests.TestDataBinding):
+    def setUp(self):
+        super().setUp()
+
+        x = tf.Variable(tf.zeros(self.n, dtype=np.float64))
+
+        @TensorFlow(x, data={"A": self.A})
+        def cost(x, A):
+            return tf.tensordot(x, tf.tensordot(A, x, axes=1), axes=1)
+
+        self.cost = cost
+
+
 class TestMatrix(_backend_tests.TestMatrix):
     def setUp(self):
         super().setUp()
@@ -135,6 +198,9 @@ class TestUserProvidedSession(unittest.TestCase):
             def run(*args, **kwargs):
                 raise RuntimeError
 
+            def make_callable(self, *args, **kwargs):
+                return self.run
+
         n = 10
 
         x = tf.Variable(tf.zeros(n, dtype=tf.float64), name="x")
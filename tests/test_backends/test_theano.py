@@ -83,6 +83,19 @@ class TestVector(_backend_tests.TestVector):
         T.exp.R_op = Rop
 
 
+class TestDataBinding(_backend_tests.TestDataBinding):
+    def setUp(self):
+        super().setUp()
+
+        x = T.vector()
+
+        @Theano(x, data={"A": self.A})
+        def cost(x, A):
+            return T.dot(x, T.dot(A, x))
+
+        self.cost = cost
+
+
 class TestMatrix(_backend_tests.TestMatrix):
     def setUp(self):
         super().setUp()
@@ -0,0 +1,73 @@
+import numpy as np
+from numpy import random as rnd, testing as np_testing
+
+import pymanopt
+from pymanopt.manifolds import Euclidean, Product, Sphere
+from pymanopt.solvers import SteepestDescent
+from pymanopt.tools.finite_differences import (FiniteDifferenceGradient,
+                                               FiniteDifferenceTypes)
+from ._test import TestCase
+
+
+class TestFiniteDifferenceGradient(TestCase):
+    def setUp(self):
+        n = self.n = 10
+        A = rnd.randn(n, n)
+        self.A = A = 0.5 * (A + A.T)
+
+        @pymanopt.function.Callable
+        def cost(x):
+            return -x @ A @ x
+
+        self.cost = cost
+        self.man = Sphere(n)
+
+    def _rgrad(self, x):
+        return self.man.proj(x, -2 * self.A @ x)
+
+    def test_methods(self):
+        x = self.man.rand()
+        for method, decimal in [(FiniteDifferenceTypes.Forward, 5),
+                                (FiniteDifferenceTypes.Central, 7),
+                                (FiniteDifferenceTypes.ComplexStep, 12)]:
+            grad = FiniteDifferenceGradient(self.man, self.cost, method=method)
+            np_testing.assert_almost_equal(grad(x), self._rgrad(x), decimal)
+
+    def test_random_directions(self):
+        x = self.man.rand()
+        grad = FiniteDifferenceGradient(self.man, self.cost, num_directions=3)
+        g = grad(x)
+        np_testing.assert_allclose(self.man.proj(x, g), g)
+        # On average, the random estimates approximate the gradient.
+        g = np.mean([grad(x) for _ in range(3000)], axis=0)
+        rgrad = self._rgrad(x)
+        np_testing.assert_allclose(g, rgrad, atol=0.1 * np.linalg.norm(rgrad))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            FiniteDifferenceGradient(self.man, self.cost, method="foo")
+        with self.assertRaises(ValueError):
+            FiniteDifferenceGradient(self.man, self.cost,
+                                     num_directions=self.n)
+
+    def test_product(self):
+        man = Product([Sphere(self.n), Euclidean(2)])
+        A = self.A
+
+        def cost(x):
+            return -x[0] @ A @ x[0] + np.sum(x[1] ** 2)
+
+        grad = FiniteDifferenceGradient(man, cost)
+        x = man.rand()
+        g = grad(x)
+        np_testing.assert_almost_equal(g[0], self._rgrad(x[0]))
+        np_testing.assert_almost_equal(g[1], 2 * x[1])
+
+    def test_solve(self):
+        problem = pymanopt.Problem(
+            self.man, self.cost,
+            grad=FiniteDifferenceGradient(self.man, self.cost), verbosity=0)
+        x = SteepestDescent(maxiter=2000).solve(problem)
+        eigenvalues, eigenvectors = np.linalg.eigh(self.A)
+        np_testing.assert_allclose(-problem.cost(x), eigenvalues[-1],
+                                   rtol=1e-6)
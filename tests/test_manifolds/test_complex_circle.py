@@ -1,3 +1,6 @@
+import numpy as np
+import numpy.testing as np_testing
+
 from pymanopt.manifolds import ComplexCircle
 from .._test import TestCase
 
@@ -9,3 +12,59 @@ class TestComplexCircleManifold(TestCase):
 
     def test_dim(self):
         self.assertEqual(self.man.dim, self.dimension)
+
+    def test_proj(self):
+        man = self.man
+        z = man.rand()
+        u = np.random.randn(self.dimension) + 1j * np.random.randn(
+            self.dimension)
+        v = man.proj(z, u)
+        np_testing.assert_allclose((v.conj() * z).real,
+                                   np.zeros(self.dimension), atol=1e-12)
+        np_testing.assert_allclose(man.proj(z, v), v)
+
+    def test_retr(self):
+        man = self.man
+        z = man.rand()
+        u = man.randvec(z)
+        y = man.retr(z, u)
+        np_testing.assert_allclose(np.abs(y), np.ones(self.dimension))
+        np_testing.assert_allclose(y, (z + u) / np.abs(z + u))
+
+    def test_exp_log_inverse(self):
+        man = self.man
+        z = man.rand()
+        u = 0.5 * man.randvec(z)
+        u[0] = 0
+        y = man.exp(z, u)
+        np_testing.assert_allclose(np.abs(y), np.ones(self.dimension))
+        np_testing.assert_allclose(y[0], z[0])
+        np_testing.assert_allclose(man.log(z, y), u, atol=1e-10)
+
+    def test_zerovec(self):
+        man = self.man
+        z = man.rand()
+        v = man.zerovec(z)
+        assert np.iscomplexobj(v)
+        np_testing.assert_array_equal(man.exp(z, v), z)
+
+    def test_ehess2rhess(self):
+        # Compare the Riemannian Hessian against a finite difference of the
+        # Riemannian gradient along the curve t -> retr(z, t * u), projected
+        # back onto the tangent space at z.
+        man = self.man
+        n = self.dimension
+        A = np.random.randn(n, n) + 1j * np.random.randn(n, n)
+        C = A + A.conj().T
+
+        def rgrad(z):
+            return man.egrad2rgrad(z, 2 * C.dot(z))
+
+        z = man.rand()
+        u = man.randvec(z)
+        t = 1e-5
+        difference = man.proj(z, (rgrad(man.retr(z, t * u)) -
+                                  rgrad(man.retr(z, -t * u))) / (2 * t))
+        np_testing.assert_allclose(
+            man.ehess2rhess(z, 2 * C.dot(z), 2 * C.dot(u), u), difference,
+            rtol=1e-5, atol=1e-6)
@@ -78,6 +78,50 @@ class TestEuclideanManifold(TestCase):
         np_testing.assert_almost_equal(la.norm(u), 1)
         assert la.norm(u - v) > 1e-6
 
+    def test_lincomb(self):
+        e = self.man
+        x = e.rand()
+        u = e.randvec(x)
+        v = e.randvec(x)
+        expected = 2 * u - 3 * v
+        np_testing.assert_allclose(e.lincomb(x, 2, u, -3, v), expected)
+        np_testing.assert_allclose(e.lincomb(x, 2, u), 2 * u)
+
+        # In-place updates of either operand.
+        w = u.copy()
+        result = e.lincomb(x, 2, w, -3, v, out=w)
+        assert result is w
+        np_testing.assert_allclose(w, expected)
+        w = v.copy()
+        result = e.lincomb(x, 2, u, -3, w, out=w)
+        assert result is w
+        np_testing.assert_allclose(w, expected)
+
+        # Combinations of a vector with itself, in place and otherwise.
+        for a in (1, 2):
+            w = u.copy()
+            result = e.lincomb(x, a, w, 3, w, out=w)
+            assert result is w
+            np_testing.assert_allclose(w, (a + 3) * u)
+            w = u.copy()
+            np_testing.assert_allclose(e.lincomb(x, a, w, 3, w), (a + 3) * u)
+            np_testing.assert_array_equal(w, u)
+
+        # Arrays which cannot hold the result are left untouched.
+        w = np.zeros(u.shape, dtype=int)
+        result = e.lincomb(x, 2, u, -3, v, out=w)
+        np_testing.assert_allclose(result, expected)
+        np_testing.assert_array_equal(w, 0)
+        w = v.astype(np.float32)
+        result = e.lincomb(x, 2, u, -3, w, out=w)
+        assert result.dtype == np.float64
+        np_testing.assert_allclose(result, 2 * u - 3 * v.astype(np.float32))
+
+        w = v.copy()
+        result = e.axpy(x, 2, u, w)
+        assert result is w
+        np_testing.assert_allclose(w, 2 * u + v)
+
     def test_transp(self):
         e = self.man
         x = e.rand()
@@ -1,7 +1,12 @@
+import autograd.numpy as anp
 import numpy as np
 from numpy import linalg as la, testing as np_testing
+import scipy.sparse
 
+import pymanopt
 from pymanopt.manifolds import FixedRankEmbedded
+from pymanopt.manifolds.fixed_rank import SparsePlusLowRank
+from pymanopt.solvers import TrustRegions
 from .._test import TestCase
 
 
@@ -103,6 +108,31 @@ class TestFixedRankEmbeddedManifold(TestCase):
         assert la.norm(x[1] - y[1]) > 1e-6
         assert la.norm(x[2] - y[2]) > 1e-6
 
+    def test_rand_batch(self):
+        x = self.man.rand(3)
+        assert np.shape(x[0]) == (3, self.m, self.k)
+        assert np.shape(x[1]) == (3, self.k)
+        assert np.shape(x[2]) == (3, self.k, self.n)
+        for i in range(3):
+            np_testing.assert_allclose(x[0][i].T.dot(x[0][i]), np.eye(self.k),
+                                       atol=1e-6)
+            np_testing.assert_allclose(x[2][i].dot(x[2][i].T), np.eye(self.k),
+                                       atol=1e-6)
+            assert (np.diff(x[1][i]) <= 0).all()
+
+    def test_randvec_batch(self):
+        e = self.man
+        x = e.rand()
+        u = e.randvec(x, 3)
+        assert np.shape(u[1]) == (3, self.k, self.k)
+        for i in range(3):
+            ui = (u[0][i], u[1][i], u[2][i])
+            np_testing.assert_almost_equal(e.norm(x, ui), 1)
+            np_testing.assert_allclose(np.dot(ui[0].T, x[0]),
+                                       np.zeros((self.k, self.k)), atol=1e-6)
+            np_testing.assert_allclose(np.dot(ui[2].T, x[2].T),
+                                       np.zeros((self.k, self.k)), atol=1e-6)
+
     def test_transp(self):
         s = self.man
         x = s.rand()
@@ -113,6 +143,63 @@ class TestFixedRankEmbeddedManifold(TestCase):
         diff = [A[k]-B[k] for k in range(len(A))]
         np_testing.assert_almost_equal(s.norm(y, diff), 0)
 
+    def test_retr_transp(self):
+        s = self.man
+        x = s.rand()
+        u = s.randvec(x)
+        v = s.randvec(x)
+        w = s.randvec(x)
+        y, (A, B) = s.retr_transp(x, u, [v, w])
+        for a, b in zip(y, s.retr(x, u)):
+            np_testing.assert_allclose(a, b)
+        for transported, vector in ((A, v), (B, w)):
+            expected = s.proj(y, s.tangent2ambient(x, vector))
+            diff = [transported[k] - expected[k] for k in range(3)]
+            np_testing.assert_almost_equal(s.norm(y, diff), 0)
+
+        # The transport between two points does not depend on an earlier
+        # retraction between them, even if the points were since modified.
+        y, (A,) = s.retr_transp(x, u, [v])
+        y[0][:] = s.rand()[0]
+        expected = s.proj(y, s.tangent2ambient(x, v))
+        diff = [a - b for a, b in zip(s.transp(x, y, v), expected)]
+        np_testing.assert_almost_equal(s.norm(y, diff), 0)
+
+    def test_lincomb(self):
+        e = self.man
+        x = e.rand()
+        u = e.randvec(x)
+        v = e.randvec(x)
+        expected = (2 * u + v).to_ambient(x)
+        w = e.lincomb(x, 1, v, 2, u, out=v)
+        np_testing.assert_allclose(w.to_ambient(x), expected)
+        for a, b in zip(w, v):
+            assert a is b
+
+    def test_proj_sparse(self):
+        m = self.man
+        x = m.rand()
+        a = scipy.sparse.random(self.m, self.n, density=0.2, format="coo")
+        u = np.random.randn(self.m, 2)
+        s = np.random.randn(2, 2)
+        v = np.random.randn(self.n, 2)
+        z = SparsePlusLowRank(a, (u, s, v))
+        dense = a.toarray() + u.dot(s).dot(v.T)
+        for g, h in ((m.proj(x, z), m.proj(x, dense)),
+                     (m.proj(x, a), m.proj(x, a.toarray())),
+                     (m.egrad2rgrad(x, z), m.proj(x, dense))):
+            for k in range(3):
+                np_testing.assert_allclose(g[k], h[k])
+
+    def test_partial_entries(self):
+        m = self.man
+        x = m.rand()
+        rows = np.random.randint(self.m, size=20)
+        cols = np.random.randint(self.n, size=20)
+        dense = x[0].dot(np.diag(x[1])).dot(x[2])
+        np_testing.assert_allclose(m.partial_entries(x, rows, cols),
+                                   dense[rows, cols])
+
     def test_apply_ambient(self):
         m = self.man
         z = np.random.randn(self.m, self.n)
@@ -156,7 +243,85 @@ class TestFixedRankEmbeddedManifold(TestCase):
         np_testing.assert_allclose(z_ambient, u.dot(s).dot(v.T))
 
     def test_ehess2rhess(self):
-        pass
+        # Compare the Riemannian Hessian of f(X) = ||X - A||^2 / 2 with a
+        # finite difference approximation of the second derivative of f along
+        # a retraction curve, which is valid since the retraction is second
+        # order.
+        m = self.man
+        rng = np.random.default_rng(0)
+        m.random_generator = rng
+        a = rng.standard_normal((self.m, self.n))
+        # Keep the singular values away from zero so that the curvature of
+        # the manifold and hence the finite difference error stay bounded.
+        u, s, vt = m.rand()
+        x = (u, s + 1, vt)
+        u = m.randvec(x)
+
+        def cost(y):
+            return 0.5 * la.norm(y[0].dot(np.diag(y[1])).dot(y[2]) - a) ** 2
+
+        egrad = x[0].dot(np.diag(x[1])).dot(x[2]) - a
+        ehess = m.tangent2ambient(x, u)
+        hess = m.ehess2rhess(x, egrad, ehess, u)
+
+        h = 1e-4
+        second_derivative = (cost(m.retr(x, h * u)) - 2 * cost(x) +
+                             cost(m.retr(x, -h * u))) / h ** 2
+        np_testing.assert_allclose(m.inner(x, u, hess), second_derivative,
+                                   rtol=1e-4, atol=1e-4)
+
+        # The Hessian is symmetric.
+        v = m.randvec(x)
+        hess_v = m.ehess2rhess(x, egrad, m.tangent2ambient(x, v), v)
+        np_testing.assert_almost_equal(m.inner(x, v, hess),
+                                       m.inner(x, u, hess_v))
+
+        # Sparse Euclidean gradients give the same result.
+        sparse_egrad = SparsePlusLowRank(scipy.sparse.csr_matrix(egrad))
+        for g, h in zip(hess, m.ehess2rhess(x, sparse_egrad, ehess, u)):
+            np_testing.assert_allclose(g, h)
+
+    def _robust_approximation_cost(self, a, delta=0.5):
+        @pymanopt.function.Autograd
+        def cost(u, s, vt):
+            x = anp.dot(anp.dot(u, anp.diag(s)), vt)
+            return anp.sum(anp.sqrt((x - a) ** 2 + delta ** 2) - delta)
+        return cost
+
+    def test_ehess2rhess_factored(self):
+        # The Riemannian Hessian computed from the derivatives with respect
+        # to the SVD factors agrees with the one computed from the
+        # derivatives with respect to the matrix.
+        m = self.man
+        a = np.random.randn(self.m, self.n)
+        delta = 0.5
+        cost = self._robust_approximation_cost(a, delta)
+        x = m.rand()
+        u = m.randvec(x)
+
+        r = x[0].dot(np.diag(x[1])).dot(x[2]) - a
+        egrad = r / np.sqrt(r ** 2 + delta ** 2)
+        ud, sd, vd = m.tangent2ambient(x, u)
+        ehess = (delta ** 2 / (r ** 2 + delta ** 2) ** 1.5 *
+                 ud.dot(sd).dot(vd.T))
+        hess = m.ehess2rhess(x, egrad, ehess, u)
+
+        factored_egrad = cost.compute_gradient()(x)
+        factored_ehess = cost.compute_hessian()(x, m.tangent2factors(x, u))
+        for g, h in zip(hess, m.ehess2rhess(x, factored_egrad,
+                                            factored_ehess, u)):
+            np_testing.assert_allclose(g, h, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            m.ehess2rhess(x, factored_egrad, ehess, u)
+
+    def test_trust_regions_autodiff(self):
+        m = self.man
+        a = np.random.randn(self.m, self.n)
+        problem = pymanopt.Problem(
+            m, self._robust_approximation_cost(a), verbosity=0)
+        x = TrustRegions(mingradnorm=1e-8).solve(problem)
+        self.assertLess(m.norm(x, problem.grad(x)), 1e-8)
 
     def test_retr(self):
         # Test that the result is on the manifold and that for small
@@ -51,6 +51,16 @@ class TestSingleGrassmannManifold(TestCase):
 
     # def test_egrad2rgrad(self):
 
+    def test_traced_conversions(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        egrad, ehess = rnd.randn(2, *np.shape(x))
+        np_testing.assert_allclose(self.man.egrad2rgrad(x, egrad),
+                                   self.man.traced_egrad2rgrad(x, egrad))
+        np_testing.assert_allclose(
+            self.man.ehess2rhess(x, egrad, ehess, u),
+            self.man.traced_ehess2rhess(x, egrad, ehess, u))
+
     # def test_norm(self):
 
     def test_rand(self):
@@ -66,6 +76,16 @@ class TestSingleGrassmannManifold(TestCase):
 
     # def test_transp(self):
 
+    def test_retr_transp(self):
+        s = self.man
+        x = s.rand()
+        u = s.randvec(x)
+        vectors = [s.randvec(x), s.randvec(x)]
+        y, transported = s.retr_transp(x, u, vectors)
+        np_testing.assert_allclose(y, s.retr(x, u))
+        for a, v in zip(transported, vectors):
+            np_testing.assert_allclose(a, s.transp(x, y, v))
+
     def test_exp_log_inverse(self):
         s = self.man
         x = s.rand()
@@ -114,6 +134,27 @@ class TestMultiGrassmannManifold(TestCase):
         np_testing.assert_almost_equal(self.man.dist(x, y),
                                        self.man.norm(x, self.man.log(x, y)))
 
+    def test_multidist(self):
+        x = self.man.rand()
+        y = self.man.rand()
+        dists = self.man.multidist(x, y)
+        self.assertEqual(dists.shape, (self.k,))
+        single = Grassmann(self.m, self.n)
+        for i in range(self.k):
+            np_testing.assert_almost_equal(dists[i], single.dist(x[i], y[i]))
+        np_testing.assert_almost_equal(self.man.dist(x, y), la.norm(dists))
+
+    def test_retr_qr(self):
+        man = Grassmann(self.m, self.n, k=self.k, retraction="qr")
+        x = man.rand()
+        u = man.randvec(x)
+        y = man.retr(x, u)
+        np_testing.assert_allclose(multiprod(multitransp(y), y),
+                                   multieye(self.k, self.n), atol=1e-10)
+        # The QR and polar retractions yield the same subspace.
+        np_testing.assert_almost_equal(man.dist(y, self.man.retr(x, u)), 0,
+                                       decimal=5)
+
     def test_inner(self):
         X = self.man.rand()
         A = self.man.randvec(X)
@@ -149,6 +190,16 @@ class TestMultiGrassmannManifold(TestCase):
 
     # def test_egrad2rgrad(self):
 
+    def test_traced_conversions(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        egrad, ehess = rnd.randn(2, *np.shape(x))
+        np_testing.assert_allclose(self.man.egrad2rgrad(x, egrad),
+                                   self.man.traced_egrad2rgrad(x, egrad))
+        np_testing.assert_allclose(
+            self.man.ehess2rhess(x, egrad, ehess, u),
+            self.man.traced_ehess2rhess(x, egrad, ehess, u))
+
     def test_norm(self):
         x = self.man.rand()
         u = self.man.randvec(x)
@@ -176,6 +227,16 @@ class TestMultiGrassmannManifold(TestCase):
 
     # def test_transp(self):
 
+    def test_retr_transp(self):
+        s = self.man
+        x = s.rand()
+        u = s.randvec(x)
+        vectors = [s.randvec(x), s.randvec(x)]
+        y, transported = s.retr_transp(x, u, vectors)
+        np_testing.assert_allclose(y, s.retr(x, u))
+        for a, v in zip(transported, vectors):
+            np_testing.assert_allclose(a, s.transp(x, y, v))
+
     def test_exp_log_inverse(self):
         s = self.man
         x = s.rand()
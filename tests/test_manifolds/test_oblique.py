@@ -1,3 +1,5 @@
+import numpy as np
+import numpy.linalg as la
 import numpy.testing as np_testing
 
 from pymanopt.manifolds import Oblique
@@ -32,6 +34,18 @@ class TestObliqueManifold(TestCase):
 
     # def test_randvec(self):
 
+    def test_dtype(self):
+        man = Oblique(self.m, self.n)
+        man.dtype = np.float32
+        x = man.rand()
+        u = man.randvec(x)
+        for array in (x, u, man.zerovec(x), man.proj(x, u), man.retr(x, u),
+                      man.exp(x, u), man.log(x, man.retr(x, u))):
+            assert array.dtype == np.float32
+        for dtype in (np.float16, np.longdouble, np.int32, np.complex64):
+            with self.assertRaises(ValueError):
+                man.dtype = dtype
+
     # def test_transp(self):
 
     def test_exp_log_inverse(self):
@@ -58,3 +72,57 @@ class TestObliqueManifold(TestCase):
         Y = s.rand()
         Z = s.pairmean(X, Y)
         np_testing.assert_array_almost_equal(s.dist(X, Z), s.dist(Y, Z))
+
+
+class TestObliqueManifoldRowwise(TestCase):
+    def setUp(self):
+        self.m = m = 100
+        self.n = n = 50
+        self.man = Oblique(m, n, rowwise=True)
+        self.columnwise = Oblique(m, n)
+
+    def test_rand(self):
+        x = self.man.rand()
+        assert x.shape == (self.n, self.m)
+        np_testing.assert_allclose(la.norm(x, axis=1), np.ones(self.n))
+
+    def test_rand_batch(self):
+        x = self.man.rand(3)
+        assert x.shape == (3, self.n, self.m)
+        np_testing.assert_allclose(la.norm(x, axis=-1), np.ones((3, self.n)))
+
+    def test_proj(self):
+        x = self.man.rand()
+        h = np.random.randn(self.n, self.m)
+        np_testing.assert_allclose(self.man.proj(x, h),
+                                   self.columnwise.proj(x.T, h.T).T)
+
+    def test_ehess2rhess(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        egrad, ehess = np.random.randn(2, self.n, self.m)
+        np_testing.assert_allclose(
+            self.man.ehess2rhess(x, egrad, ehess, u),
+            self.columnwise.ehess2rhess(x.T, egrad.T, ehess.T, u.T).T)
+
+    def test_retr(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        np_testing.assert_allclose(self.man.retr(x, u),
+                                   self.columnwise.retr(x.T, u.T).T)
+
+    def test_exp(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        u[0] = 0
+        y = self.man.exp(x, u)
+        np_testing.assert_allclose(y, self.columnwise.exp(x.T, u.T).T)
+        np_testing.assert_allclose(y[0], x[0])
+
+    def test_exp_log_inverse(self):
+        s = self.man
+        x = s.rand()
+        y = s.rand()
+        u = s.log(x, y)
+        z = s.exp(x, u)
+        np_testing.assert_almost_equal(0, s.dist(y, z), decimal=6)
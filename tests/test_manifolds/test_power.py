@@ -0,0 +1,142 @@
+import numpy as np
+from numpy import linalg as la, testing as np_testing
+
+from pymanopt.manifolds import (PowerManifold, Sphere, SpecialOrthogonalGroup,
+                                SymmetricPositiveDefinite)
+from .._test import TestCase
+
+
+class TestPowerManifoldFallback(TestCase):
+    def setUp(self):
+        self.n = n = 4
+        self.k = k = 5
+        self.sphere = Sphere(n)
+        self.man = PowerManifold(self.sphere, k)
+
+    def test_dim(self):
+        assert self.man.dim == self.k * (self.n - 1)
+
+    def test_typicaldist(self):
+        np_testing.assert_almost_equal(self.man.typicaldist,
+                                       np.sqrt(self.k) * np.pi)
+
+    def test_rand(self):
+        x = self.man.rand()
+        assert x.shape == (self.k, self.n)
+        np_testing.assert_allclose(la.norm(x, axis=1), np.ones(self.k))
+
+    def test_randvec(self):
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x)
+        np_testing.assert_almost_equal(man.norm(x, u), 1)
+        np_testing.assert_allclose(np.sum(x * u, axis=1), np.zeros(self.k),
+                                   atol=1e-12)
+
+    def test_inner(self):
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x)
+        v = man.randvec(x)
+        np_testing.assert_almost_equal(
+            man.inner(x, u, v),
+            sum(self.sphere.inner(x[i], u[i], v[i]) for i in range(self.k)))
+
+    def test_proj(self):
+        man = self.man
+        x = man.rand()
+        u = np.random.randn(self.k, self.n)
+        p = man.proj(x, u)
+        for i in range(self.k):
+            np_testing.assert_allclose(p[i], self.sphere.proj(x[i], u[i]))
+
+    def test_retr(self):
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x)
+        y = man.retr(x, u)
+        np_testing.assert_allclose(la.norm(y, axis=1), np.ones(self.k))
+
+    def test_dist(self):
+        man = self.man
+        x = man.rand()
+        y = man.rand()
+        np_testing.assert_almost_equal(
+            man.dist(x, y),
+            np.sqrt(sum(self.sphere.dist(x[i], y[i]) ** 2
+                        for i in range(self.k))))
+
+    def test_exp_log_inverse(self):
+        man = self.man
+        x = man.rand()
+        y = man.rand()
+        np_testing.assert_allclose(man.exp(x, man.log(x, y)), y)
+
+    def test_zerovec(self):
+        man = self.man
+        x = man.rand()
+        np_testing.assert_equal(man.zerovec(x), np.zeros((self.k, self.n)))
+
+    def test_rand_batch(self):
+        x = self.man.rand(3)
+        assert x.shape == (3, self.k, self.n)
+        np_testing.assert_allclose(la.norm(x, axis=-1), np.ones((3, self.k)))
+
+    def test_random_generator(self):
+        man = self.man
+        man.random_generator = 7
+        x = man.rand()
+        assert self.sphere.random_generator is man.random_generator
+        man.random_generator = 7
+        np_testing.assert_array_equal(man.rand(), x)
+
+
+class TestPowerManifoldBatched(TestCase):
+    def setUp(self):
+        self.n = n = 3
+        self.k = k = 4
+        self.rotations = SpecialOrthogonalGroup(n)
+        self.man = PowerManifold(self.rotations, k)
+
+    def test_dispatch(self):
+        assert self.man._batched is not None
+        assert self.man.dim == self.k * self.rotations.dim
+
+    def test_rand(self):
+        x = self.man.rand()
+        assert x.shape == (self.k, self.n, self.n)
+        for xi in x:
+            np_testing.assert_allclose(xi.T.dot(xi), np.eye(self.n),
+                                       atol=1e-10)
+
+    def test_inner(self):
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x)
+        v = man.randvec(x)
+        np_testing.assert_almost_equal(
+            man.inner(x, u, v),
+            sum(self.rotations.inner(x[i], u[i], v[i])
+                for i in range(self.k)))
+
+    def test_retr(self):
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x)
+        y = man.retr(x, u)
+        for i in range(self.k):
+            np_testing.assert_allclose(y[i],
+                                       self.rotations.retr(x[i], u[i]))
+
+    def test_randvec_batch(self):
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x, 3)
+        assert u.shape == (3, self.k, self.n, self.n)
+        for ui in u:
+            np_testing.assert_almost_equal(man.norm(x, ui), 1)
+
+    def test_zerovec(self):
+        man = PowerManifold(SymmetricPositiveDefinite(self.n), self.k)
+        x = man.rand()
+        np_testing.assert_equal(man.zerovec(x), np.zeros_like(x))
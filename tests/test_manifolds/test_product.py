@@ -47,9 +47,30 @@ class TestProductManifold(TestCase):
 
     # def test_norm(self):
 
-    # def test_rand(self):
-
-    # def test_randvec(self):
+    def test_rand(self):
+        X = self.man.rand(3)
+        assert np.shape(X[0]) == (3, self.m, self.n)
+        assert np.shape(X[1]) == (3, self.n)
+        np_testing.assert_allclose(np.linalg.norm(X[1], axis=1), np.ones(3))
+
+    def test_randvec(self):
+        man = self.man
+        X = man.rand()
+        U = man.randvec(X, 3)
+        for k in range(3):
+            np_testing.assert_almost_equal(man.norm(X, [U[0][k], U[1][k]]), 1)
+
+    def test_random_generator(self):
+        man = self.man
+        man.random_generator = 1
+        X = man.rand()
+        assert self.sphere.random_generator is man.random_generator
+        man.random_generator = 1
+        Y = man.rand()
+        np_testing.assert_array_equal(X[0], Y[0])
+        np_testing.assert_array_equal(X[1], Y[1])
+        man.random_generator = None
+        assert self.euclidean.random_generator is np.random
 
     # def test_transp(self):
 
@@ -74,3 +95,85 @@ class TestProductManifold(TestCase):
         Y = s.rand()
         Z = s.pairmean(X, Y)
         np_testing.assert_array_almost_equal(s.dist(X, Z), s.dist(Y, Z))
+
+
+class TestPackedProductManifold(TestCase):
+    def setUp(self):
+        self.m = m = 10
+        self.n = n = 5
+        self.euclidean = Euclidean(m, n)
+        self.sphere = Sphere(n)
+        self.man = Product([self.euclidean, self.sphere], packed=True)
+        self.unpacked = Product([self.euclidean, self.sphere])
+
+    def test_components_are_views(self):
+        man = self.man
+        X = man.rand()
+        G = man.randvec(X)
+        for components in (X, G):
+            self.assertEqual(components._buffer.size, self.m * self.n + self.n)
+            for component in components:
+                assert np.shares_memory(component, components._buffer)
+        self.assertEqual(X[0].shape, (self.m, self.n))
+        self.assertEqual(X[1].shape, (self.n,))
+
+    def test_inner(self):
+        man = self.man
+        X = man.rand()
+        G = man.randvec(X)
+        H = man.randvec(X)
+        np_testing.assert_almost_equal(man.inner(X, G, H),
+                                       self.unpacked.inner(X, G, H))
+        np_testing.assert_almost_equal(man.norm(X, G), 1)
+
+    def test_dtype(self):
+        man = Product([Euclidean(self.m, self.n), Sphere(self.n)], packed=True)
+        man.dtype = np.float32
+        X = man.rand()
+        G = man.randvec(X)
+        for components in (X, G, man.zerovec(X), man.retr(X, G)):
+            assert components._buffer.dtype == np.float32
+            for component in components:
+                assert component.dtype == np.float32
+
+    def test_tangent_vector_arithmetic(self):
+        man = self.man
+        X = man.rand()
+        G = man.randvec(X)
+        H = man.randvec(X)
+        for result, expected in ((G + H, [G[0] + H[0], G[1] + H[1]]),
+                                 (G - H, [G[0] - H[0], G[1] - H[1]]),
+                                 (2 * G, [2 * G[0], 2 * G[1]]),
+                                 (G / 2, [G[0] / 2, G[1] / 2]),
+                                 (-G, [-G[0], -G[1]])):
+            assert result._buffer is not None
+            np_testing.assert_allclose(result[0], expected[0])
+            np_testing.assert_allclose(result[1], expected[1])
+
+    def test_retr(self):
+        man = self.man
+        X = man.rand()
+        G = man.randvec(X)
+        Y = man.retr(X, G)
+        assert Y._buffer is not None
+        np_testing.assert_allclose(Y[0], X[0] + G[0])
+        np_testing.assert_almost_equal(np.linalg.norm(Y[1]), 1)
+
+    def test_lincomb(self):
+        man = self.man
+        X = man.rand()
+        G = man.randvec(X)
+        H = man.randvec(X)
+        expected = 2 * G._buffer - 3 * H._buffer
+        result = man.lincomb(X, 2, G, -3, H, out=H)
+        assert result is H
+        np_testing.assert_allclose(H._buffer, expected)
+        np_testing.assert_allclose(H[1], expected[self.m * self.n:])
+
+    def test_zerovec(self):
+        man = self.man
+        X = man.rand()
+        Z = man.zerovec(X)
+        np_testing.assert_equal(Z._buffer, 0)
+        G = man.randvec(X)
+        np_testing.assert_allclose((G + Z)._buffer, G._buffer)
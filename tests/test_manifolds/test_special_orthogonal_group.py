@@ -1,7 +1,35 @@
+import numpy as np
+from numpy import linalg as la, testing as np_testing
+
 from pymanopt.manifolds import SpecialOrthogonalGroup
+from pymanopt.tools.multi import multiprod, multiskew, multitransp
 from .._test import TestCase
 
 
 class TestSpecialOrthogonalGroup(TestCase):
     def test_constructor(self):
         SpecialOrthogonalGroup(10, 3)
+
+    def test_rand(self):
+        man = SpecialOrthogonalGroup(4, 3)
+        x = man.rand(5)
+        assert np.shape(x) == (5, 3, 4, 4)
+        np_testing.assert_allclose(multiprod(multitransp(x), x),
+                                   np.broadcast_to(np.eye(4), x.shape),
+                                   atol=1e-12)
+        np_testing.assert_allclose(la.det(x), np.ones((5, 3)))
+
+    def test_randvec(self):
+        man = SpecialOrthogonalGroup(4)
+        x = man.rand()
+        u = man.randvec(x, 5)
+        assert np.shape(u) == (5, 4, 4)
+        np_testing.assert_allclose(multiskew(u), u)
+        np_testing.assert_allclose(la.norm(u, axis=(1, 2)), np.ones(5))
+
+    def test_random_generator(self):
+        man = SpecialOrthogonalGroup(3)
+        man.random_generator = np.random.default_rng(0)
+        x = man.rand()
+        man.random_generator = 0
+        np_testing.assert_array_equal(man.rand(), x)
@@ -73,6 +73,16 @@ class TestSphereManifold(TestCase):
                                                                   ehess, u),
                                    self.man.ehess2rhess(x, egrad, ehess, u))
 
+    def test_traced_conversions(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        egrad, ehess = rnd.randn(2, *np.shape(x))
+        np_testing.assert_allclose(self.man.egrad2rgrad(x, egrad),
+                                   self.man.traced_egrad2rgrad(x, egrad))
+        np_testing.assert_allclose(
+            self.man.ehess2rhess(x, egrad, ehess, u),
+            self.man.traced_ehess2rhess(x, egrad, ehess, u))
+
     def test_retr(self):
         # Test that the result is on the manifold and that for small
         # tangent vectors it has little effect.
@@ -189,6 +199,16 @@ class TestSphereSubspaceIntersectionManifold(TestCase):
         man = SphereSubspaceIntersection(U)
         self.assertEqual(man.dim, dim)
 
+    def test_dim_rank_deficient(self):
+        n = 100
+        U = rnd.randn(n, 5).dot(rnd.randn(5, 20))
+        man = SphereSubspaceIntersection(U)
+        self.assertEqual(man.dim, 4)
+        # Check that a random element lies in the span of U.
+        x = man.rand()
+        coefficients = la.lstsq(U, x, rcond=None)[0]
+        np_testing.assert_array_almost_equal(U.dot(coefficients), x)
+
 
 class TestSphereSubspaceComplementIntersectionManifold(TestCase):
     def setUp(self):
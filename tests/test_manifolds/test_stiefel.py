@@ -1,7 +1,9 @@
 import autograd.numpy as np
 from numpy import linalg as la, random as rnd, testing as np_testing
 
+import pymanopt
 from pymanopt.manifolds import Stiefel
+from pymanopt.solvers import ConjugateGradient
 from pymanopt.tools import testing
 from pymanopt.tools.multi import multieye, multiprod, multisym, multitransp
 from .._test import TestCase
@@ -86,6 +88,16 @@ class TestSingleStiefelManifold(TestCase):
 
     # def test_egrad2rgrad(self):
 
+    def test_traced_conversions(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        egrad, ehess = rnd.randn(2, *np.shape(x))
+        np_testing.assert_allclose(self.man.egrad2rgrad(x, egrad),
+                                   self.man.traced_egrad2rgrad(x, egrad))
+        np_testing.assert_allclose(
+            self.man.ehess2rhess(x, egrad, ehess, u),
+            self.man.traced_ehess2rhess(x, egrad, ehess, u))
+
     def test_norm(self):
         x = self.man.rand()
         u = self.man.randvec(x)
@@ -93,6 +105,47 @@ class TestSingleStiefelManifold(TestCase):
 
     # def test_transp(self):
 
+    def test_retr_transp(self):
+        s = self.man
+        x = s.rand()
+        u = s.randvec(x)
+        vectors = [s.randvec(x), s.randvec(x)]
+        y, transported = s.retr_transp(x, u, vectors)
+        np_testing.assert_allclose(y, s.retr(x, u))
+        for a, v in zip(transported, vectors):
+            np_testing.assert_allclose(a, s.transp(x, y, v))
+
+    def test_conjugate_gradient_retr_transp(self):
+        # The conjugate gradient solver transports its vectors along with
+        # the retraction of the accepted step rather than separately.
+        s = self.man
+        A = rnd.randn(self.m, self.m)
+        A = A + A.T
+
+        @pymanopt.function.Autograd
+        def cost(X):
+            return -np.trace(np.dot(X.T, np.dot(A, X)))
+
+        calls = {"retr_transp": 0, "transp": 0}
+        retr_transp = s.retr_transp
+        transp = s.transp
+
+        def counting_retr_transp(X, U, vectors):
+            calls["retr_transp"] += 1
+            return retr_transp(X, U, vectors)
+
+        def counting_transp(X1, X2, G):
+            calls["transp"] += 1
+            return transp(X1, X2, G)
+        s.retr_transp = counting_retr_transp
+        s.transp = counting_transp
+
+        problem = pymanopt.Problem(s, cost, verbosity=0)
+        x = ConjugateGradient(maxiter=20).solve(problem)
+        self.assertGreater(calls["retr_transp"], 0)
+        self.assertEqual(calls["transp"], 0)
+        np_testing.assert_allclose(x.T.dot(x), np.eye(self.n), atol=1e-10)
+
     def test_exp(self):
         # Check that exp lies on the manifold and that exp of a small vector u
         # is close to x + u.
@@ -186,6 +239,24 @@ class TestMultiStiefelManifold(TestCase):
         V = self.man.randvec(X)
         assert la.norm(U - V) > 1e-6
 
+    def test_rand_batch(self):
+        X = self.man.rand(4)
+        assert X.shape == (4, self.k, self.m, self.n)
+        np_testing.assert_allclose(
+            multiprod(multitransp(X), X),
+            np.broadcast_to(multieye(self.k, self.n), X.shape[:2] + (
+                self.n, self.n)), atol=1e-10)
+
+    def test_randvec_batch(self):
+        X = self.man.rand()
+        U = self.man.randvec(X, 4)
+        assert U.shape == (4, self.k, self.m, self.n)
+        np_testing.assert_allclose(multisym(multiprod(multitransp(X), U)),
+                                   np.zeros((4, self.k, self.n, self.n)),
+                                   atol=1e-10)
+        np_testing.assert_allclose(la.norm(U.reshape(4, -1), axis=1),
+                                   np.ones(4))
+
     def test_retr(self):
         # Test that the result is on the manifold and that for small
         # tangent vectors it has little effect.
@@ -204,6 +275,16 @@ class TestMultiStiefelManifold(TestCase):
 
     # def test_egrad2rgrad(self):
 
+    def test_traced_conversions(self):
+        x = self.man.rand()
+        u = self.man.randvec(x)
+        egrad, ehess = rnd.randn(2, *np.shape(x))
+        np_testing.assert_allclose(self.man.egrad2rgrad(x, egrad),
+                                   self.man.traced_egrad2rgrad(x, egrad))
+        np_testing.assert_allclose(
+            self.man.ehess2rhess(x, egrad, ehess, u),
+            self.man.traced_ehess2rhess(x, egrad, ehess, u))
+
     def test_norm(self):
         x = self.man.rand()
         u = self.man.randvec(x)
@@ -211,6 +292,16 @@ class TestMultiStiefelManifold(TestCase):
 
     # def test_transp(self):
 
+    def test_retr_transp(self):
+        s = self.man
+        x = s.rand()
+        u = s.randvec(x)
+        vectors = [s.randvec(x), s.randvec(x)]
+        y, transported = s.retr_transp(x, u, vectors)
+        np_testing.assert_allclose(y, s.retr(x, u))
+        for a, v in zip(transported, vectors):
+            np_testing.assert_allclose(a, s.transp(x, y, v))
+
     def test_exp(self):
         # Check that exp lies on the manifold and that exp of a small vector u
         # is close to x + u.
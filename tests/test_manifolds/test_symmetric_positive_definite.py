@@ -1,3 +1,5 @@
+import concurrent.futures
+
 import numpy as np
 from numpy import linalg as la, random as rnd, testing as np_testing
 from scipy.linalg import eigvalsh, expm
@@ -84,6 +86,48 @@ class TestSingleSymmetricPositiveDefiniteManifold(TestCase):
         x = man.rand()
         np.testing.assert_almost_equal(man.norm(np.eye(self.n), x), la.norm(x))
 
+    def test_factorization_cache(self):
+        # Alternate between two base points to make sure the cached Cholesky
+        # factor of one point is never used for the other one.
+        man = self.man
+        x = man.rand()
+        y = man.rand()
+        u = man.randvec(x)
+        c = la.cholesky(x)
+        c_inv = la.inv(c)
+        norm = la.norm(c_inv.dot(u).dot(c_inv.T))
+        np_testing.assert_almost_equal(man.norm(x, u), norm)
+        man.norm(y, u)
+        np_testing.assert_almost_equal(man.norm(x, u), norm)
+        np_testing.assert_almost_equal(
+            man.inner(x, u, u), np.tensordot(la.solve(x, u), la.solve(x, u)))
+
+    def test_factorization_cache_in_place_update(self):
+        # Modifying a point in-place must invalidate the cached factor.
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x)
+        man.norm(x, u)
+        x += man.rand()
+        c_inv = la.inv(la.cholesky(x))
+        np_testing.assert_almost_equal(man.norm(x, u),
+                                       la.norm(c_inv.dot(u).dot(c_inv.T)))
+
+    def test_factorization_cache_threads(self):
+        # Concurrent calls at different points must not mix up the cached
+        # factors.
+        man = self.man
+        xs = [man.rand() for _ in range(8)]
+        u = man.randvec(xs[0])
+        c_invs = [la.inv(la.cholesky(x)) for x in xs]
+        norms = [la.norm(c_inv.dot(u).dot(c_inv.T)) for c_inv in c_invs]
+        points = [xs[i % len(xs)] for i in range(400)]
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda x: man.norm(x, u), points))
+        np_testing.assert_allclose(
+            results, [norms[i % len(xs)] for i in range(len(points))])
+        np_testing.assert_allclose(man.norm(xs[0], u), norms[0])
+
     def test_exp_log_inverse(self):
         man = self.man
         x = man.rand()
@@ -201,6 +245,31 @@ class TestMultiSymmetricPositiveDefiniteManifold(TestCase):
         np_testing.assert_almost_equal(1, man.norm(x, u))
         assert la.norm(u - v) > 1e-3
 
+    def test_rand_batch(self):
+        man = self.man
+        x = man.rand(4)
+        assert np.shape(x) == (4, self.k, self.n, self.n)
+        np_testing.assert_allclose(x, multisym(x))
+        assert (la.eigvalsh(x) > 0).all()
+
+    def test_randvec_batch(self):
+        man = self.man
+        x = man.rand()
+        u = man.randvec(x, 4)
+        assert np.shape(u) == (4, self.k, self.n, self.n)
+        for ui in u:
+            np_testing.assert_allclose(multisym(ui), ui)
+            np_testing.assert_almost_equal(1, man.norm(x, ui))
+
+    def test_random_generator(self):
+        man = self.man
+        man.random_generator = 42
+        x = man.rand()
+        u = man.randvec(x)
+        man.random_generator = np.random.default_rng(42)
+        np_testing.assert_array_equal(man.rand(), x)
+        np_testing.assert_array_equal(man.randvec(x), u)
+
     def test_transp(self):
         man = self.man
         x = man.rand()
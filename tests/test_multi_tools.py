@@ -3,7 +3,7 @@ from numpy import linalg as la, random as rnd, testing as np_testing
 from scipy.linalg import expm, logm
 
 from pymanopt.tools.multi import (multiexp, multieye, multilog, multiprod,
-                                  multisym, multitransp)
+                                  multiqr, multisym, multitransp)
 from ._test import TestCase
 
 
@@ -62,6 +62,14 @@ class TestMulti(TestCase):
 
         np_testing.assert_allclose(A, multieye(self.k, self.n))
 
+    def test_multiqr(self):
+        A = rnd.randn(self.k, self.n, self.p)
+        q, r = multiqr(A)
+        np_testing.assert_allclose(multiprod(q, r), A)
+        np_testing.assert_allclose(multiprod(multitransp(q), q),
+                                   multieye(self.k, self.p), atol=1e-10)
+        np_testing.assert_allclose(np.tril(r, -1), 0)
+
     def test_multilog_singlemat(self):
         a = np.diag(rnd.rand(self.m))
         q, r = la.qr(rnd.randn(self.m, self.m))
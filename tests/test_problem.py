@@ -26,3 +26,46 @@ class TestProblem(TestCase):
         x = rnd.randn(self.n)
         np_testing.assert_allclose(2 * x * np.exp(np.sum(x ** 2)),
                                    problem.egrad(x))
+
+    def test_dtype(self):
+        problem = pymanopt.Problem(self.man, self.cost)
+        assert problem.dtype == np.float64
+        self.man.dtype = np.float32
+        assert problem.dtype == np.float32
+        assert self.man.rand().dtype == np.float32
+        assert problem.scalar_dtype == np.float64
+        problem.promote_precision = False
+        assert problem.scalar_dtype == np.float32
+
+    def test_hess_reuses_egrad(self):
+        num_egrad_calls = [0]
+
+        @pymanopt.function.Callable
+        def egrad(x):
+            num_egrad_calls[0] += 1
+            return 2 * x
+
+        @pymanopt.function.Callable
+        def ehess(x, a):
+            return 2 * a
+
+        problem = pymanopt.Problem(self.man, self.cost, egrad=egrad,
+                                   ehess=ehess)
+        x = self.man.rand()
+        for _ in range(3):
+            problem.hess(x, self.man.randvec(x))
+        self.assertEqual(num_egrad_calls[0], 1)
+        problem.hess(self.man.rand(), self.man.randvec(x))
+        self.assertEqual(num_egrad_calls[0], 2)
+
+    def test_cost_batch(self):
+        problem = pymanopt.Problem(self.man, self.cost)
+        xs = self.man.rand(4)
+        np_testing.assert_allclose(problem.cost_batch(xs),
+                                   [problem.cost(x) for x in xs])
+
+        def cost_batch(xs):
+            return np.zeros(len(xs))
+
+        problem = pymanopt.Problem(self.man, self.cost, cost_batch=cost_batch)
+        np_testing.assert_array_equal(problem.cost_batch(xs), np.zeros(4))
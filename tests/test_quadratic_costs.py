@@ -0,0 +1,33 @@
+import numpy as np
+import numpy.testing as np_testing
+import scipy.sparse
+
+from pymanopt.manifolds import ComplexCircle
+from pymanopt.tools.quadratic_costs import hermitian_quadratic_cost
+from ._test import TestCase
+
+
+class TestHermitianQuadraticCost(TestCase):
+    def setUp(self):
+        self.dimension = 50
+        self.man = ComplexCircle(self.dimension)
+
+    def test_hermitian_quadratic_cost(self):
+        n = self.dimension
+        A = scipy.sparse.random(n, n, density=0.1, format="coo") * (1 + 1j)
+        C = A + A.conj().T
+        cost, egrad, ehess = hermitian_quadratic_cost(C)
+        z = self.man.rand()
+        u = self.man.randvec(z)
+        Cd = C.toarray()
+        np_testing.assert_allclose(cost(z), z.conj().dot(Cd).dot(z).real)
+
+        # Compare the directional derivatives against finite differences
+        # with respect to the real inner product.
+        t = 1e-6
+        np_testing.assert_allclose(
+            (cost(z + t * u) - cost(z - t * u)) / (2 * t),
+            np.vdot(egrad(z), u).real, rtol=1e-6)
+        np_testing.assert_allclose(
+            (egrad(z + t * u) - egrad(z - t * u)) / (2 * t), ehess(z, u),
+            rtol=1e-6, atol=1e-8)
@@ -0,0 +1,75 @@
+import numpy as np
+import scipy.sparse
+from numpy import testing as np_testing
+
+from pymanopt.manifolds import Elliptope
+from pymanopt.solvers import TrustRegions
+from pymanopt.tools.riemannian_staircase import RiemannianStaircase
+from ._test import TestCase
+
+
+class TestRiemannianStaircase(TestCase):
+    def setUp(self):
+        # MaxCut relaxation min <C, X> s.t. X psd, diag(X) = 1 with C = -L / 4
+        # for the Laplacian L of a small random graph. For this instance, the
+        # second-order critical point found at rank 2 is not optimal.
+        np.random.seed(0)
+        rng = np.random.default_rng(0)
+        n = self.n = 20
+        A = np.triu((rng.random((n, n)) < 0.3).astype(float), 1)
+        A = A + A.T
+        self.C = -(np.diag(A.sum(axis=1)) - A) / 4
+
+    def _dense_certificate(self, Y):
+        X = Y.dot(Y.T)
+        return self.C - np.diag(np.diag(self.C.dot(X)))
+
+    def test_certification(self):
+        staircase = RiemannianStaircase(TrustRegions(), rank=2,
+                                        logverbosity=1)
+        Y, optlog = staircase.solve(self.C, verbosity=0)
+        assert optlog["stoppingreason"].startswith(
+            "Terminated - certified optimal")
+        assert optlog["steps"]["rank"][-1] > 2
+
+        # X = Y Y^T is feasible and the dense dual certificate is positive
+        # semidefinite, so that X solves the semidefinite program.
+        X = Y.dot(Y.T)
+        np_testing.assert_allclose(np.diag(X), 1)
+        eigenvalues = np.linalg.eigvalsh(self._dense_certificate(Y))
+        assert eigenvalues[0] >= -1e-6
+        np_testing.assert_allclose(optlog["final_values"]["mineigval"],
+                                   eigenvalues[0], atol=1e-8)
+
+        # The certificate does not depend on the format of C.
+        Y_sparse = staircase.solve(scipy.sparse.csr_matrix(self.C), x=Y,
+                                   verbosity=0)[0]
+        np_testing.assert_allclose(Y_sparse.dot(Y_sparse.T), X, atol=1e-6)
+
+    def test_escape(self):
+        staircase = RiemannianStaircase(TrustRegions(), rank=2, maxrank=2,
+                                        logverbosity=1)
+        Y, optlog = staircase.solve(self.C, verbosity=0)
+        assert optlog["stoppingreason"].startswith(
+            "Terminated - max rank 2 reached")
+
+        mineigval, direction = staircase._certificate(self.C, 0, Y, True)
+        eigenvalues = np.linalg.eigvalsh(self._dense_certificate(Y))
+        np_testing.assert_allclose(mineigval, eigenvalues[0])
+        assert mineigval < -staircase._tolerance
+
+        # The step along the direction of negative curvature in the new
+        # column lowers the cost at rank 3.
+        manifold = Elliptope(self.n, 3)
+        problem = staircase._make_problem(manifold, self.C, 0, 0)
+        Y_escaped = staircase._escape(manifold, problem.cost, Y, direction)
+        assert Y_escaped.shape == (self.n, 3)
+        np_testing.assert_allclose(np.sum(Y_escaped ** 2, axis=1), 1)
+        assert problem.cost(Y_escaped) < problem.cost(Y) - 1e-4
+
+        # Along the direction of largest curvature, no step lowers the cost
+        # and the padded point is returned.
+        direction = np.linalg.eigh(self._dense_certificate(Y))[1][:, -1]
+        Y_escaped = staircase._escape(manifold, problem.cost, Y, direction)
+        np_testing.assert_array_equal(Y_escaped[:, :2], Y)
+        np_testing.assert_array_equal(Y_escaped[:, -1], 0)